@@ -1,23 +1,27 @@
 from __future__ import annotations
 
+import importlib
 from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
-from mteb.benchmarks.benchmarks import (
-    MTEB_ENG_CLASSIC,
-    MTEB_MAIN_RU,
-    MTEB_RETRIEVAL_LAW,
-    MTEB_RETRIEVAL_MEDICAL,
-    MTEB_RETRIEVAL_WITH_INSTRUCTIONS,
-    CoIR,
-)
 from mteb.evaluation import *
 from mteb.load_results import BenchmarkResults, load_results
 from mteb.models import get_model, get_model_meta, get_model_metas
 from mteb.overview import TASKS_REGISTRY, get_task, get_tasks
 
-from .benchmarks.benchmarks import Benchmark
+from .benchmarks.benchmark import Benchmark
 from .benchmarks.get_benchmark import BENCHMARK_REGISTRY, get_benchmark, get_benchmarks
 
+if TYPE_CHECKING:
+    from mteb.benchmarks.benchmarks import (
+        MTEB_ENG_CLASSIC,
+        MTEB_MAIN_RU,
+        MTEB_RETRIEVAL_LAW,
+        MTEB_RETRIEVAL_MEDICAL,
+        MTEB_RETRIEVAL_WITH_INSTRUCTIONS,
+        CoIR,
+    )
+
 __version__ = version("mteb")  # fetch version from install metadata
 
 
@@ -41,3 +45,17 @@ __all__ = [
     "BenchmarkResults",
     "BENCHMARK_REGISTRY",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # the benchmarks are created on first access, as this requires initializing their tasks
+    if name in {
+        "MTEB_ENG_CLASSIC",
+        "MTEB_MAIN_RU",
+        "MTEB_RETRIEVAL_LAW",
+        "MTEB_RETRIEVAL_MEDICAL",
+        "MTEB_RETRIEVAL_WITH_INSTRUCTIONS",
+        "CoIR",
+    }:
+        return getattr(importlib.import_module("mteb.benchmarks.benchmarks"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -298,11 +298,12 @@ class AbsTask(ABC):
         filter_modalities_set = set(modalities)
         task_modalities_set = set(self.modalities)
         if exclusive_modality_filter:
-            if not (filter_modalities_set == task_modalities_set):
-                self.metadata.modalities = []
+            keep = filter_modalities_set == task_modalities_set
         else:
-            if not filter_modalities_set.intersection(task_modalities_set):
-                self.metadata.modalities = []
+            keep = bool(filter_modalities_set.intersection(task_modalities_set))
+        if not keep:
+            # copy the metadata, as it is shared by all instances of the task
+            self.metadata = self.metadata.model_copy(update={"modalities": []})
         return self
 
     def filter_languages(
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import numpy as np
 from datasets import Dataset
 
 from mteb.encoder_interface import Encoder
@@ -92,6 +93,8 @@ class AbsTaskBitextMining(AbsTask):
                 **kwargs,
             )
         else:
+            # the subsets often share one side, e.g. English, which is then only encoded once
+            embedding_cache = {}
             for hf_subet in hf_subsets:
                 logger.info(
                     f"\nTask: {self.metadata.name}, split: {split}, subset: {hf_subet}. Running..."
@@ -106,6 +109,7 @@ class AbsTaskBitextMining(AbsTask):
                     data_split,  # type: ignore
                     subsets=["sentence1", "sentence2"],
                     encode_kwargs=encode_kwargs,
+                    embedding_cache=embedding_cache,
                     **kwargs,
                 )
 
@@ -124,6 +128,7 @@ class AbsTaskBitextMining(AbsTask):
         *,
         parallel: bool = False,
         encode_kwargs: dict[str, Any] = {},
+        embedding_cache: dict[tuple[str, str], np.ndarray] | None = None,
         **kwargs,
     ) -> ScoresDict:
         pairs = self.get_pairs(parallel)
@@ -132,6 +137,7 @@ class AbsTaskBitextMining(AbsTask):
             data_split,
             task_name=self.metadata.name,
             pair_columns=pairs,  # type: ignore
+            embedding_cache=embedding_cache,
             **kwargs,
         )
         metrics = evaluator(model, encode_kwargs=encode_kwargs)
@@ -167,21 +167,18 @@ class AbsTaskClassification(AbsTask):
         params.update(kwargs)
 
         scores = []
-        test_cache, idxs = (
-            None,
-            None,
-        )  # we store idxs to make the shuffling reproducible
-        for i in range(self.n_experiments):
-            logger.info(
-                "=" * 10 + f" Experiment {i + 1}/{self.n_experiments} " + "=" * 10
-            )
+        evaluators, train_samples = [], []
+        idxs = None  # we store idxs to make the shuffling reproducible
+        train_texts = train_split["text"]  # type: ignore
+        train_labels = train_split["label"]  # type: ignore
+        limit = params.get("limit")
+        for _ in range(self.n_experiments):
             # Bootstrap `self.samples_per_label` samples per label for each split
-            X_sampled, y_sampled, idxs = self._undersample_data(
-                train_split["text"],  # type: ignore
-                train_split["label"],  # type: ignore
-                self.samples_per_label,
-                idxs,
+            sample_indices, idxs = self._undersample_data_indices(
+                train_labels, self.samples_per_label, idxs
             )
+            X_sampled = [train_texts[i] for i in sample_indices]
+            y_sampled = [train_labels[i] for i in sample_indices]
 
             if self.method == "kNN":
                 evaluator = kNNClassificationEvaluator(
@@ -215,8 +212,28 @@ class AbsTaskClassification(AbsTask):
                 )
             else:
                 raise ValueError(f"Method {self.method} not supported")
+            evaluators.append(evaluator)
+            train_samples.append(np.asarray(sample_indices[:limit], dtype=np.int64))
+
+        # Encode all unique training sentences of the experiments at once
+        unique_train_indices = np.unique(np.concatenate(train_samples))
+        unique_train_embeddings = model.encode(
+            [train_texts[i] for i in unique_train_indices],
+            task_name=self.metadata.name,
+            **evaluators[0].encode_kwargs,
+        )
 
-            scores_exp, test_cache = evaluator(model, test_cache=test_cache)
+        test_cache = None
+        for i, (evaluator, sample_indices) in enumerate(zip(evaluators, train_samples)):
+            logger.info(
+                "=" * 10 + f" Experiment {i + 1}/{self.n_experiments} " + "=" * 10
+            )
+            train_cache = unique_train_embeddings[
+                np.searchsorted(unique_train_indices, sample_indices)
+            ]
+            scores_exp, test_cache = evaluator(
+                model, test_cache=test_cache, train_cache=train_cache
+            )
             scores.append(scores_exp)
 
         avg_scores: dict[str, Any] = {
@@ -227,18 +244,27 @@ class AbsTaskClassification(AbsTask):
 
     def _undersample_data(self, X, y, samples_per_label: int, idxs=None):
         """Undersample data to have samples_per_label samples of each label"""
-        X_sampled = []
-        y_sampled = []
+        sample_indices, idxs = self._undersample_data_indices(
+            y, samples_per_label, idxs
+        )
+        X_sampled = [X[i] for i in sample_indices]
+        y_sampled = [y[i] for i in sample_indices]
+        return X_sampled, y_sampled, idxs
+
+    def _undersample_data_indices(self, y, samples_per_label: int, idxs=None):
+        """Undersample data to have samples_per_label samples of each label,
+        returning the indices of the samples instead of the samples.
+        """
+        sample_indices = []
         if idxs is None:
             idxs = np.arange(len(y))
         np.random.shuffle(idxs)
         label_counter = defaultdict(int)
         for i in idxs:
             if label_counter[y[i]] < samples_per_label:
-                X_sampled.append(X[i])
-                y_sampled.append(y[i])
+                sample_indices.append(i)
                 label_counter[y[i]] += 1
-        return X_sampled, y_sampled, idxs
+        return sample_indices, idxs
 
     def _calculate_metrics_from_split(
         self, split: str, hf_subset: str | None = None, compute_overall: bool = False
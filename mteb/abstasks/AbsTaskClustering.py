@@ -5,13 +5,18 @@ from collections import Counter
 from typing import Any
 
 import numpy as np
-import tqdm
+import torch
 from datasets import Dataset
 
 from mteb.encoder_interface import Encoder
 from mteb.load_results.task_results import ScoresDict
 
-from ..evaluation.evaluators import ClusteringEvaluator
+from ..evaluation.evaluators.ClusteringEvaluator import (
+    DEFAULT_CLUSTERING_BATCH_SIZE,
+    fit_v_measure,
+)
+from ..evaluation.evaluators.Evaluator import DEFAULT_SEED
+from ..evaluation.evaluators.utils import encode_sorted_by_length, map_in_processes
 from .AbsTask import AbsTask
 from .TaskMetadata import DescriptiveStatistics
 
@@ -63,6 +68,10 @@ class AbsTaskClustering(AbsTask):
     """
 
     abstask_prompt = "Identify categories in user passages."
+    # the number of processes fitting k-means on the cluster sets, None uses all CPUs. Starting the processes takes a few seconds, so splits
+    # with fewer sentences are clustered in the current process.
+    n_jobs: int | None = None
+    min_sentences_per_process_pool: int = 10_000
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -78,16 +87,51 @@ class AbsTaskClustering(AbsTask):
         encode_kwargs: dict[str, Any] = {},
         **kwargs,
     ) -> ScoresDict:
-        v_measures = []
-        for cluster_set in tqdm.tqdm(dataset, desc="Clustering"):
-            evaluator = ClusteringEvaluator(
-                cluster_set["sentences"],  # type: ignore
-                cluster_set["labels"],  # type: ignore
-                task_name=self.metadata.name,
-                **kwargs,
+        # the arguments of ClusteringEvaluator, which is not built as the sets are encoded and clustered together
+        seed = kwargs.get("seed", DEFAULT_SEED)
+        clustering_batch_size = kwargs.get(
+            "clustering_batch_size", DEFAULT_CLUSTERING_BATCH_SIZE
+        )
+        limit = kwargs.get("limit")
+        cluster_sets = [
+            (cluster_set["sentences"][:limit], cluster_set["labels"][:limit])  # type: ignore
+            for cluster_set in dataset
+        ]
+
+        # the cluster sets are small and share many sentences, so all sets are encoded at once, each distinct sentence once
+        index_map: dict[str, int] = {}
+        sentence_indexes = [
+            np.fromiter(
+                (
+                    index_map.setdefault(sentence, len(index_map))
+                    for sentence in sentences
+                ),
+                dtype=np.int64,
+                count=len(sentences),
             )
-            metrics = evaluator(model, encode_kwargs=encode_kwargs)
-            v_measures.append(metrics["v_measure"])
+            for sentences, _ in cluster_sets
+        ]
+        embeddings = encode_sorted_by_length(
+            model,
+            list(index_map),
+            task_name=self.metadata.name,
+            **{"batch_size": 32, **encode_kwargs},
+        )
+        if isinstance(embeddings, torch.Tensor):
+            embeddings = embeddings.cpu().numpy()
+
+        n_sentences = sum(len(indexes) for indexes in sentence_indexes)
+        v_measures = map_in_processes(
+            fit_v_measure,
+            [
+                (embeddings[indexes], labels, clustering_batch_size, seed)
+                for (_, labels), indexes in zip(cluster_sets, sentence_indexes)
+            ],
+            n_jobs=self.n_jobs
+            if n_sentences >= self.min_sentences_per_process_pool
+            else 1,
+            desc="Clustering",
+        )
 
         v_mean = np.mean(v_measures)
         v_std = np.std(v_measures)
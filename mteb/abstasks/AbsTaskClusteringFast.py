@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import itertools
 import logging
+import os
 import random
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import numpy as np
@@ -11,6 +13,7 @@ import sklearn
 import sklearn.cluster
 from datasets import Dataset, DatasetDict
 from sklearn.metrics.cluster import v_measure_score
+from threadpoolctl import threadpool_limits
 
 from mteb.encoder_interface import Encoder
 
@@ -24,6 +27,22 @@ logger = logging.getLogger(__name__)
 MultilingualDataset = dict[HFSubset, DatasetDict]
 
 
+def _fit_v_measure(
+    embeddings: np.ndarray,
+    labels: np.ndarray,
+    n_clusters: int,
+    kmean_batch_size: int,
+    seed: int,
+) -> float:
+    clustering_model = sklearn.cluster.MiniBatchKMeans(
+        n_clusters=n_clusters,
+        batch_size=kmean_batch_size,
+        n_init="auto",
+        random_state=seed,
+    )
+    return v_measure_score(labels, clustering_model.fit_predict(embeddings))
+
+
 def evaluate_clustering_bootstrapped(
     embeddings: np.ndarray,
     labels: list[list[str]],
@@ -31,43 +50,68 @@ def evaluate_clustering_bootstrapped(
     cluster_size: int,
     kmean_batch_size: int,
     max_depth: int | None,
-    rng_state: random.Random = random.Random(),
+    rng_state: random.Random | np.random.Generator = random.Random(),
+    n_jobs: int | None = None,
 ) -> dict[str, list[float]]:
     """Bootstrapped evaluation of clustering performance using V-measure.
 
     The bootstrapping is done by sampling N samples from the corpus and clustering them. It is done without replacement to get a diverse set of
     samples.
-    """
-    n_embeddings = embeddings.shape[0]
 
+    If `rng_state` is a numpy Generator, all samples are drawn from it up front, along with a seed for the k-means of each sample, and the
+    samples are clustered concurrently on `n_jobs` threads (None uses all CPUs), which share the BLAS and OpenMP threads of the process. The
+    results only depend on the state of the Generator. With a `random.Random`, the samples are drawn and clustered one after the other, as
+    in earlier versions.
+    """
     v_measures = defaultdict(list)
     if max_depth is not None:
         max_depth = min(max_depth, max(map(len, labels)))
     else:
         max_depth = max(map(len, labels))
+
+    fits = []
     # Evaluate on each level til max depth
     for i_level in range(max_depth):
-        level_labels = []
         # Assign -1 to gold label if the level is not there
-        for label in labels:
-            if len(label) > i_level:
-                level_labels.append(label[i_level])
-            else:
-                level_labels.append(-1)
-        level_labels = np.array(level_labels)
-        valid_idx = np.array(
-            [level_label != -1 for level_label in level_labels]
-        )  # Could be level_labels != -1 but fails with FutureWarning: elementwise comparison failed
+        level_labels = np.array(
+            [label[i_level] if len(label) > i_level else -1 for label in labels]
+        )
+        # The -1 of a missing level becomes "-1" in an array of string labels, in which case the samples are kept, as they always were
+        if level_labels.dtype.kind in "US":
+            valid_idx = np.ones(len(level_labels), dtype=bool)
+        else:
+            valid_idx = level_labels != -1
         level_labels = level_labels[valid_idx]
         level_embeddings = embeddings[valid_idx]
+        n_level_clusters = np.unique(level_labels).size
+        n_embeddings = len(level_embeddings)
+
+        if isinstance(rng_state, np.random.Generator):
+            # sample N samples from the corpus with replacement
+            cluster_indices = rng_state.integers(
+                n_embeddings, size=(n_clusters, cluster_size)
+            )
+            seeds = rng_state.integers(2**31 - 1, size=n_clusters)
+            fits.extend(
+                (
+                    f"Level {i_level}",
+                    level_embeddings,
+                    level_labels,
+                    n_level_clusters,
+                    idx,
+                    seed,
+                )
+                for idx, seed in zip(cluster_indices, seeds.tolist())
+            )
+            continue
+
         clustering_model = sklearn.cluster.MiniBatchKMeans(
-            n_clusters=np.unique(level_labels).size,
+            n_clusters=n_level_clusters,
             batch_size=kmean_batch_size,
             n_init="auto",
         )
         for _ in range(n_clusters):
             # sample N samples from the corpus with replacement
-            n_embeddings = len(level_embeddings)
             cluster_indices = rng_state.choices(range(n_embeddings), k=cluster_size)
 
             _embeddings = level_embeddings[cluster_indices]
@@ -76,6 +120,26 @@ def evaluate_clustering_bootstrapped(
             v_measure = v_measure_score(_labels, cluster_assignment)
             v_measures[f"Level {i_level}"].append(v_measure)
 
+    if fits:
+        n_jobs = min(n_jobs or os.cpu_count() or 1, len(fits))
+
+        def fit(
+            level_embeddings, level_labels, n_level_clusters, cluster_indices, seed
+        ) -> float:
+            return _fit_v_measure(
+                level_embeddings[cluster_indices],
+                level_labels[cluster_indices],
+                n_level_clusters,
+                kmean_batch_size,
+                seed,
+            )
+
+        with threadpool_limits(limits=max(1, (os.cpu_count() or 1) // n_jobs)):
+            with ThreadPoolExecutor(n_jobs) as pool:
+                futures = [(level, pool.submit(fit, *args)) for level, *args in fits]
+                for level, future in futures:
+                    v_measures[level].append(future.result())
+
     return v_measures
 
 
@@ -141,6 +205,10 @@ class AbsTaskClusteringFast(AbsTask):
     n_clusters: int = 10
     k_mean_batch_size: int = 512
     max_depth = None
+    # Draw the bootstrap samples from a numpy Generator seeded with self.seed and cluster them concurrently on n_jobs threads (None uses all
+    # CPUs). The scores differ from those of the default sequential bootstrap, which is kept for comparability with existing results.
+    parallel_bootstrap: bool = False
+    n_jobs: int | None = None
     abstask_prompt = "Identify categories in user passages."
 
     def __init__(self, **kwargs):
@@ -210,7 +278,10 @@ class AbsTaskClusteringFast(AbsTask):
             cluster_size=self.max_documents_per_cluster,
             kmean_batch_size=self.k_mean_batch_size,
             max_depth=self.max_depth,
-            rng_state=rng_state,
+            rng_state=np.random.default_rng(self.seed)
+            if self.parallel_bootstrap
+            else rng_state,
+            n_jobs=self.n_jobs,
         )
         v_measures = list(itertools.chain.from_iterable(all_v_scores.values()))
 
@@ -430,6 +430,47 @@ class AbsTaskInstructionRetrieval(AbsTask):
         )
 
         top_ranked = top_ranked[split]
+
+        # the corpus is the same for all instruction variants, so it is encoded only once
+        ranked_ids = {doc_id for doc_ids in top_ranked.values() for doc_id in doc_ids}
+        retriever.encode_corpus(
+            {doc_id: doc for doc_id, doc in corpus.items() if doc_id in ranked_ids}
+        )
+        try:
+            return self._evaluate_instruction_variants(
+                retriever,
+                corpus,
+                queries,
+                og_relevant_docs,
+                changed_relevant_docs,
+                og_instructions,
+                changed_instructions,
+                top_ranked,
+                lang,
+                split,
+                keywords,
+                short_instructions,
+                **kwargs,
+            )
+        finally:
+            retriever.clear_corpus_embeddings()
+
+    def _evaluate_instruction_variants(
+        self,
+        retriever: InstructionRetrievalEvaluator,
+        corpus: dict,
+        queries: dict,
+        og_relevant_docs: dict,
+        changed_relevant_docs: dict,
+        og_instructions: dict,
+        changed_instructions: dict,
+        top_ranked: dict,
+        lang: str,
+        split: str,
+        keywords: dict | None = None,
+        short_instructions: dict | None = None,
+        **kwargs,
+    ) -> dict[str, dict[str, float] | float]:
         kwargs["prediction_name"] = "og"  # for naming predictions, as needed
         scores_og, results_og = self._evaluate_subset(
             retriever,
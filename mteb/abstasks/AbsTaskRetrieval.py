@@ -404,6 +404,8 @@ class AbsTaskRetrieval(AbsTask):
                 for k, v in naucs_mrr.items()
             },
         }
+        # the recall of an approximate search backend against exact search, if one is used
+        scores.update(retriever.search_recall())
         self._add_main_score(scores)
 
         if export_errors:
@@ -15,6 +15,9 @@ from ...evaluation.evaluators import (
     ImagekNNClassificationEvaluatorPytorch,
     ImagelogRegClassificationEvaluator,
 )
+from ...evaluation.evaluators.Image.ClassificationEvaluator import (
+    encode_image_dataset,
+)
 from ..AbsTask import AbsTask, ScoresDict
 from ..TaskMetadata import DescriptiveStatistics
 
@@ -194,21 +197,18 @@ class AbsTaskImageClassification(AbsTask):
         params.update(kwargs)
 
         scores = []
-        test_cache, idxs = (
-            None,
-            None,
-        )  # we store idxs to make the shuffling reproducible
-        for i in range(self.n_experiments):
-            logger.info(
-                "=" * 10 + f" Experiment {i + 1}/{self.n_experiments} " + "=" * 10
-            )
+        evaluators, train_samples = [], []
+        idxs = None  # we store idxs to make the shuffling reproducible
+        limit = params.get("limit")
+        for _ in range(self.n_experiments):
             # Bootstrap `self.samples_per_label` samples per label for each split
-            undersampled_train, idxs = self._undersample_data(
+            sample_indices, idxs = self._undersample_data_indices(
                 train_split,
                 self.label_column_name,
                 self.samples_per_label,
                 idxs=idxs,
             )
+            undersampled_train = train_split.select(sample_indices)
 
             if self.method == "kNN":
                 evaluator = ImagekNNClassificationEvaluator(
@@ -242,8 +242,29 @@ class AbsTaskImageClassification(AbsTask):
                 )
             else:
                 raise ValueError(f"Method {self.method} not supported")
+            evaluators.append(evaluator)
+            train_samples.append(np.asarray(sample_indices[:limit], dtype=np.int64))
+
+        # Encode all unique training images of the experiments at once
+        unique_train_indices = np.unique(np.concatenate(train_samples))
+        unique_train_embeddings = encode_image_dataset(
+            model,
+            train_split.select(unique_train_indices),
+            self.image_column_name,
+            batch_size=evaluators[0].encode_kwargs["batch_size"],
+        )
 
-            scores_exp, test_cache = evaluator(model, test_cache=test_cache)
+        test_cache = None
+        for i, (evaluator, sample_indices) in enumerate(zip(evaluators, train_samples)):
+            logger.info(
+                "=" * 10 + f" Experiment {i + 1}/{self.n_experiments} " + "=" * 10
+            )
+            train_cache = unique_train_embeddings[
+                np.searchsorted(unique_train_indices, sample_indices)
+            ]
+            scores_exp, test_cache = evaluator(
+                model, test_cache=test_cache, train_cache=train_cache
+            )
             scores.append(scores_exp)
 
         avg_scores: dict[str, Any] = {
@@ -258,6 +279,21 @@ class AbsTaskImageClassification(AbsTask):
         """Undersample data to have samples_per_label samples of each label
         without loading all images into memory.
         """
+        selected_indices, idxs = self._undersample_data_indices(
+            dataset_split, label_column_name, samples_per_label, idxs
+        )
+        undersampled_dataset = dataset_split.select(selected_indices)
+        return (
+            undersampled_dataset,
+            idxs,
+        )
+
+    def _undersample_data_indices(
+        self, dataset_split, label_column_name, samples_per_label, idxs=None
+    ):
+        """Undersample data to have samples_per_label samples of each label,
+        returning the indices of the samples instead of the samples.
+        """
         if idxs is None:
             idxs = np.arange(len(dataset_split))
         np.random.shuffle(idxs)
@@ -272,9 +308,4 @@ class AbsTaskImageClassification(AbsTask):
             if label_counter[label] < samples_per_label:
                 selected_indices.append(i)
                 label_counter[label] += 1
-
-        undersampled_dataset = dataset_split.select(selected_indices)
-        return (
-            undersampled_dataset,
-            idxs,
-        )
+        return selected_indices, idxs
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import importlib
+from typing import Any
+
 from mteb.benchmarks.benchmark import Benchmark
-from mteb.benchmarks.benchmarks import *
 from mteb.benchmarks.get_benchmark import (
     BENCHMARK_REGISTRY,
     get_benchmark,
@@ -14,3 +16,13 @@ __all__ = [
     "get_benchmarks",
     "Benchmark",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # the benchmarks are created on first access, as this requires initializing their tasks
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    benchmarks = importlib.import_module("mteb.benchmarks.benchmarks")
+    if not hasattr(benchmarks, name):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(benchmarks, name)
@@ -3,57 +3,59 @@ from __future__ import annotations
 import difflib
 import logging
 import warnings
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
 
-import mteb.benchmarks.benchmarks as benchmark_module
-from mteb.benchmarks.benchmarks import (
-    C_MTEB,
-    FA_MTEB,
-    MTEB_DEU,
-    MTEB_EN,
-    MTEB_ENG_CLASSIC,
-    MTEB_EU,
-    MTEB_FRA,
-    MTEB_INDIC,
-    MTEB_JPN,
-    MTEB_KOR,
-    MTEB_MAIN_RU,
-    MTEB_POL,
-    MTEB_RETRIEVAL_LAW,
-    MTEB_RETRIEVAL_MEDICAL,
-    MTEB_RETRIEVAL_WITH_INSTRUCTIONS,
-    SEB,
-    Benchmark,
-    MTEB_code,
-    MTEB_multilingual,
-)
+from mteb.benchmarks.benchmark import Benchmark
 
 logger = logging.getLogger(__name__)
 
-BENCHMARK_REGISTRY = {
-    inst.name: inst
-    for nam, inst in benchmark_module.__dict__.items()
-    if isinstance(inst, Benchmark)
-}
+
+@lru_cache
+def _create_benchmark_registry() -> dict[str, Benchmark]:
+    import mteb.benchmarks.benchmarks as benchmark_module
+
+    return {
+        inst.name: inst
+        for nam, inst in benchmark_module.__dict__.items()
+        if isinstance(inst, Benchmark)
+    }
+
+
+class BenchmarkRegistry(Mapping):
+    """A mapping from benchmark names to benchmarks. The benchmarks are created on first access, as this requires initializing their tasks."""
+
+    def __getitem__(self, benchmark_name: str) -> Benchmark:
+        return _create_benchmark_registry()[benchmark_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_create_benchmark_registry())
+
+    def __len__(self) -> int:
+        return len(_create_benchmark_registry())
+
+
+BENCHMARK_REGISTRY = BenchmarkRegistry()
 
 PREVIOUS_BENCHMARK_NAMES = {
-    "MTEB(eng)": MTEB_EN.name,
-    "MTEB(eng, classic)": MTEB_ENG_CLASSIC.name,
-    "MTEB(rus)": MTEB_MAIN_RU.name,
-    "MTEB(Retrieval w/Instructions)": MTEB_RETRIEVAL_WITH_INSTRUCTIONS.name,
-    "MTEB(law)": MTEB_RETRIEVAL_LAW.name,
-    "MTEB(Medical)": MTEB_RETRIEVAL_MEDICAL.name,
-    "MTEB(Scandinavian)": SEB.name,
-    "MTEB(fra)": MTEB_FRA.name,
-    "MTEB(deu)": MTEB_DEU.name,
-    "MTEB(kor)": MTEB_KOR.name,
-    "MTEB(pol)": MTEB_POL.name,
-    "MTEB(code)": MTEB_code.name,
-    "MTEB(Multilingual)": MTEB_multilingual.name,
-    "MTEB(jpn)": MTEB_JPN.name,
-    "MTEB(Indic)": MTEB_INDIC.name,
-    "MTEB(Europe)": MTEB_EU.name,
-    "MTEB(Chinese)": C_MTEB.name,
-    "FaMTEB(fas, beta)": FA_MTEB.name,
+    "MTEB(eng)": "MTEB(eng, v2)",
+    "MTEB(eng, classic)": "MTEB(eng, v1)",
+    "MTEB(rus)": "MTEB(rus, v1)",
+    "MTEB(Retrieval w/Instructions)": "FollowIR",
+    "MTEB(law)": "MTEB(Law, v1)",
+    "MTEB(Medical)": "MTEB(Medical, v1)",
+    "MTEB(Scandinavian)": "MTEB(Scandinavian, v1)",
+    "MTEB(fra)": "MTEB(fra, v1)",
+    "MTEB(deu)": "MTEB(deu, v1)",
+    "MTEB(kor)": "MTEB(kor, v1)",
+    "MTEB(pol)": "MTEB(pol, v1)",
+    "MTEB(code)": "MTEB(Code, v1)",
+    "MTEB(Multilingual)": "MTEB(Multilingual, v2)",
+    "MTEB(jpn)": "MTEB(jpn, v1)",
+    "MTEB(Indic)": "MTEB(Indic, v1)",
+    "MTEB(Europe)": "MTEB(Europe, v1)",
+    "MTEB(Chinese)": "MTEB(cmn, v1)",
+    "FaMTEB(fas, beta)": "MTEB(fas, beta)",
 }
 
 
@@ -6,6 +6,7 @@ import os
 import traceback
 import warnings
 from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import copy, deepcopy
 from datetime import datetime
 from itertools import chain
@@ -23,14 +24,118 @@ from mteb.models import model_meta_from_sentence_transformers
 
 from ..abstasks import *
 from ..abstasks import AbsTask
+from ..abstasks.AbsTaskRetrieval import AbsTaskRetrieval
+from ..abstasks.MultiSubsetLoader import MultiSubsetLoader
 from ..load_results.task_results import TaskResult
 from ..models.sentence_transformer_wrapper import SentenceTransformerWrapper
-from ..tasks import *
 from . import LangMapping
 
 logger = logging.getLogger(__name__)
 
 
+def _dataset_loads(task: AbsTask) -> list[dict[str, Any]]:
+    """The arguments of the `datasets.load_dataset` calls made by the loader of the task, if it is one of the standard loaders."""
+    dataset = task.metadata_dict["dataset"]
+    loader = type(task).load_data
+    if loader is AbsTask.load_data:
+        return [dataset]
+    if loader is MultiSubsetLoader.load_data:
+        if getattr(task, "fast_loading", False):
+            return [dataset]
+        return [{"name": hf_subset, **dataset} for hf_subset in task.hf_subsets]
+    if loader is AbsTaskRetrieval.load_data:
+        path = dataset["path"]
+        trust_remote_code = dataset.get("trust_remote_code", False)
+        qrels_path = path + "-qrels" if "clarin-knext" in path else path
+        return [
+            {"path": path, "name": "corpus", "trust_remote_code": trust_remote_code},
+            {"path": path, "name": "queries", "trust_remote_code": trust_remote_code},
+            {"path": qrels_path, "trust_remote_code": trust_remote_code},
+        ]
+    return []
+
+
+def _download(loads: list[dict[str, Any]]) -> datasets.DatasetDict:
+    """Download and prepare the datasets in the cache of `datasets`, and return the last one."""
+    for load_kwargs in loads:
+        dataset = datasets.load_dataset(**load_kwargs)
+    return dataset
+
+
+class _TaskPrefetcher:
+    """Downloads the data of upcoming tasks in a background thread while the current task is evaluated.
+
+    Only the `datasets.load_dataset` calls of the standard loaders run in the background. The tasks themselves are loaded in the main thread
+    once they are evaluated, which then reads the datasets from the cache, or for tasks with the default loader uses the dataset returned by
+    the background thread directly. As `dataset_transform` and custom loaders, some of which use the global random state, run in the main
+    thread in the order of the tasks, the scores do not depend on the timing of the background thread.
+
+    At most `n_tasks` tasks are downloaded ahead of the current one, and the data of each task is released once it has been evaluated, so
+    memory stays bounded. With `n_tasks=0` all tasks are loaded when they are evaluated and their data is kept.
+    """
+
+    def __init__(self, n_tasks: int, **load_kwargs: Any):
+        self.n_tasks = n_tasks
+        self.load_kwargs = load_kwargs
+        self.executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="mteb-prefetch")
+            if n_tasks > 0
+            else None
+        )
+        self.futures: dict[int, Future] = {}
+        # the attributes of the tasks before loading, used to release their data
+        self.states: dict[int, dict[str, Any]] = {}
+
+    def prefetch(self, tasks: Iterable[AbsTask]) -> None:
+        """Start downloading the data of the given upcoming tasks, in order, until `n_tasks` tasks are downloaded ahead."""
+        if self.executor is None:
+            return
+        for task in tasks:
+            if len(self.futures) >= self.n_tasks:
+                break
+            if id(task) in self.futures or task.data_loaded:
+                continue
+            loads = _dataset_loads(task)
+            if loads:
+                self.futures[id(task)] = self.executor.submit(_download, loads)
+
+    def load(self, task: AbsTask) -> None:
+        """Load the data of the task, waiting for its download if it is being prefetched."""
+        if self.executor is not None:
+            self.states.setdefault(id(task), dict(vars(task)))
+        future = self.futures.pop(id(task), None)
+        dataset = None
+        if future is not None:
+            try:
+                dataset = future.result()
+            except Exception as e:
+                # the task is loaded as usual, which raises the error again if it persists
+                logger.debug(
+                    f"Prefetching the data of {task.metadata.name} failed: {e}"
+                )
+        if (
+            dataset is not None
+            and not task.data_loaded
+            and type(task).load_data is AbsTask.load_data
+        ):
+            task.dataset = dataset
+            task.dataset_transform()
+            task.data_loaded = True
+        else:
+            task.load_data(**self.load_kwargs)
+
+    def release(self, task: AbsTask) -> None:
+        """Free the data of a task loaded by the prefetcher by restoring its attributes from before loading."""
+        state = self.states.pop(id(task), None)
+        if state is not None:
+            vars(task).clear()
+            vars(task).update(state)
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+
 class MTEB:
     _tasks: Iterable[str | AbsTask] | None
     tasks: list[AbsTask]
@@ -87,6 +192,8 @@ class MTEB:
 
         self._version = version
         self.err_logs_path = err_logs_path
+        # the wrapper of the last SentenceTransformer evaluated, reused across runs such that e.g. its encoding processes are kept alive
+        self._model_wrapper: tuple[Any, SentenceTransformerWrapper] | None = None
 
         self.last_evaluated_splits = {}
 
@@ -122,6 +229,18 @@ class MTEB:
                 + "Please use `tasks = mteb.get_tasks(tasks=[...])` method to get tasks instead."
             )
 
+    @property
+    def tasks_cls(self) -> list[AbsTask]:
+        """All existing tasks. These are only initialized when needed, as this requires importing all tasks."""
+        if self._tasks_cls is None:
+            from mteb.overview import create_task_list
+
+            self._tasks_cls = [
+                cls(hf_subsets=self._task_langs, **self._task_kwargs)
+                for cls in create_task_list()
+            ]
+        return self._tasks_cls
+
     @property
     def available_tasks(self):
         return [x.metadata_dict["name"] for x in self.tasks_cls]
@@ -226,17 +345,15 @@ class MTEB:
 
     def select_tasks(self, **kwargs):
         """Select the tasks to be evaluated."""
-        # Get all existing tasks
-        tasks_categories_cls = list(AbsTask.__subclasses__())
-        self.tasks_cls = [
-            cls(hf_subsets=self._task_langs, **kwargs)
-            for cat_cls in tasks_categories_cls
-            for cls in cat_cls.__subclasses__()
-            if cat_cls.__name__.startswith("AbsTask")
-        ]
+        self._task_kwargs = kwargs
+        self._tasks_cls = None
 
         # If `task_list` is specified, select list of tasks
         if self._tasks is not None:
+            if all(isinstance(x, AbsTask) for x in self._tasks):
+                # no need to initialize all existing tasks
+                self.tasks = list(self._tasks)
+                return
             self.tasks = list(
                 filter(
                     lambda x: (x.metadata_dict["name"] in self._tasks), self.tasks_cls
@@ -390,6 +507,8 @@ class MTEB:
         raise_error: bool = True,
         co2_tracker: bool = False,
         encode_kwargs: dict[str, Any] = {},
+        search_backend: str | None = None,
+        prefetch_tasks: int = 0,
         **kwargs,
     ) -> list[TaskResult]:
         """Run the evaluation pipeline on the selected tasks.
@@ -409,6 +528,13 @@ class MTEB:
             raise_error: Whether to raise an error if an exception occurs during evaluation.
             co2_tracker: Whether to enable or disable CO2 emissions tracker using codecarbon.
             encode_kwargs: Additional keyword arguments to be passed to the model.encode method.
+            search_backend: The search backend used by retrieval tasks, e.g. "exact" (default) or "ivf" for approximate search. See
+                `mteb.evaluation.evaluators.search_backends.SEARCH_BACKENDS`. Its options can be passed using `search_backend_kwargs`. When an
+                approximate backend is used, its recall against exact search is added to the scores as `search_recall_at_{k}`.
+            prefetch_tasks: The number of upcoming tasks to download in a background thread while the current task is evaluated. The tasks
+                are still loaded and transformed in the main thread, so the scores are the same as without prefetching. When prefetching, the
+                data of each task is released once its results are written. Default 0, i.e. each task is downloaded right before it is
+                evaluated.
             kwargs: Additional arguments to be passed to `_run_eval` method and task.load_data.
 
         Returns:
@@ -420,6 +546,8 @@ class MTEB:
                 + "Please use `encode_kwargs = {'batch_size': ...}` to set the batch size instead."
             )
             encode_kwargs["batch_size"] = kwargs["batch_size"]
+        if search_backend is not None:
+            kwargs["search_backend"] = search_backend
 
         # update logging to account for different levels of Verbosity (similar to the command line)
 
@@ -437,7 +565,9 @@ class MTEB:
         meta = self.create_model_meta(model)
         output_path = self.create_output_folder(meta, output_folder)
         if isinstance(model, (SentenceTransformer, CrossEncoder)):
-            model = SentenceTransformerWrapper(model)
+            if self._model_wrapper is None or self._model_wrapper[0] is not model:
+                self._model_wrapper = (model, SentenceTransformerWrapper(model))
+            model = self._model_wrapper[1]
 
         ## Disable co2_tracker for API models
         if "API" in meta.framework:
@@ -460,6 +590,7 @@ class MTEB:
         # To evaluate missing splits, we keep track of the task name and the corresponding splits.
         self.last_evaluated_splits = {}
 
+        prefetcher = _TaskPrefetcher(prefetch_tasks, **kwargs)
         while len(self.tasks) > 0:
             task = self.tasks[0]
             logger.info(
@@ -478,6 +609,7 @@ class MTEB:
                     raise_error=raise_error,
                     co2_tracker=co2_tracker,
                     encode_kwargs=encode_kwargs,
+                    prefetch_tasks=prefetch_tasks,
                     **kwargs,
                 )
                 new_results = task.combine_task_results(task_results)
@@ -573,7 +705,14 @@ class MTEB:
 
             try:
                 task.check_if_dataset_is_superseded()
-                task.load_data(**kwargs)
+                prefetcher.load(task)
+                prefetcher.prefetch(
+                    upcoming
+                    for upcoming in self.tasks[1:]
+                    if self._can_prefetch(
+                        upcoming, meta, output_path, overwrite_results
+                    )
+                )
 
                 task_results = {}
                 evaluation_time = 0
@@ -669,6 +808,7 @@ class MTEB:
                     f"Error while evaluating {task.metadata_dict['name']}: {e}"
                 )
                 if raise_error:
+                    prefetcher.close()
                     raise e
                 logger.error(
                     f"Please check all the error logs at: {self.err_logs_path}"
@@ -679,11 +819,36 @@ class MTEB:
                     f_out.write("\n\n")
 
             # empty memory
+            prefetcher.release(task)
             del self.tasks[0]
 
+        prefetcher.close()
         self.tasks = original_tasks
         return evaluation_results
 
+    @staticmethod
+    def _can_prefetch(
+        task: AbsTask,
+        meta: ModelMeta,
+        output_path: Path | None,
+        overwrite_results: bool,
+    ) -> bool:
+        """Whether the data of an upcoming task can be prefetched, i.e. the task is likely to be evaluated rather than skipped."""
+        if task.is_aggregate:
+            return False
+        if "bm25s" in (meta.name or "") and task.metadata.type != "Retrieval":
+            return False
+        if meta.modalities is not None and any(
+            m not in meta.modalities for m in task.metadata.modalities
+        ):
+            return False
+        if output_path and not overwrite_results:
+            # the results might already exist, in which case the task is skipped
+            return not (
+                output_path / f"{task.metadata.name}{task.save_suffix}.json"
+            ).exists()
+        return True
+
     @staticmethod
     def create_model_meta(model: Encoder) -> ModelMeta:
         if hasattr(model, "mteb_model_meta"):
@@ -3,15 +3,17 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import numpy as np
 import torch
 import tqdm
 from datasets import Dataset
 from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
 
 from mteb.encoder_interface import Encoder
+from mteb.models.colbert_models import TokenEmbeddings
 
 from .Evaluator import Evaluator
-from .utils import cos_sim
+from .utils import cos_sim, encode_sorted_by_length
 
 logger = logging.getLogger(__name__)
 
@@ -20,15 +22,29 @@ DEFAULT_PAIR = [("sentence1", "sentence2")]
 
 
 class BitextMiningEvaluator(Evaluator):
+    """Evaluate a model by mining the translation of each sentence among the sentences of the other language, using the similarity of
+    their embeddings.
+
+    Args:
+        sentences: The sentences, with a column per language or side of the pairs.
+        task_name: The name of the task, passed on to the model.
+        pair_columns: The pairs of columns to mine.
+        embedding_cache: A cache of the embeddings keyed by (column, sentence). Sharing it between the evaluators of the subsets of a task
+            means that a column shared by the subsets, e.g. the English side of Tatoeba, is only encoded once. The token embeddings of
+            late-interaction models are cached as the token matrix of each sentence.
+    """
+
     def __init__(
         self,
         sentences: Dataset,
         task_name: str | None = None,
         pair_columns: list[tuple[str, str]] = DEFAULT_PAIR,
+        embedding_cache: dict[tuple[str, str], np.ndarray | torch.Tensor] | None = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.pairs = pair_columns
+        self.embedding_cache = embedding_cache
         self.n = len(sentences)
         self.sentences = sentences
         self.gold = (
@@ -55,11 +71,7 @@ class BitextMiningEvaluator(Evaluator):
 
         embeddings = {}
         for sub in tqdm.tqdm(subsets, desc=f"Encoding {n_subsets}x{self.n} sentences"):
-            embeddings[sub] = model.encode(
-                self.sentences[sub],
-                task_name=self.task_name,
-                **encode_kwargs,
-            )
+            embeddings[sub] = self._encode_column(model, sub, encode_kwargs)
 
         scores = {}
         for i, (key1, key2) in enumerate(
@@ -76,6 +88,41 @@ class BitextMiningEvaluator(Evaluator):
 
         return scores
 
+    def _encode_column(
+        self, model: Encoder, column: str, encode_kwargs: dict[str, Any]
+    ) -> np.ndarray | TokenEmbeddings:
+        sentences = self.sentences[column]
+        if self.embedding_cache is None:
+            return encode_sorted_by_length(
+                model, sentences, task_name=self.task_name, **encode_kwargs
+            )
+
+        missing = list(
+            dict.fromkeys(
+                sentence
+                for sentence in sentences
+                if (column, sentence) not in self.embedding_cache
+            )
+        )
+        if missing:
+            missing_embeddings = encode_sorted_by_length(
+                model, missing, task_name=self.task_name, **encode_kwargs
+            )
+            if not isinstance(missing_embeddings, TokenEmbeddings):
+                # converting packed token embeddings would pad them to the longest sentence of this call only
+                missing_embeddings = np.asarray(missing_embeddings)
+            for i, sentence in enumerate(missing):
+                self.embedding_cache[(column, sentence)] = missing_embeddings[i]
+        logger.info(
+            f"Encoded {len(missing)} of the {len(sentences)} sentences of {column}, the others were cached."
+        )
+        embeddings = [
+            self.embedding_cache[(column, sentence)] for sentence in sentences
+        ]
+        if embeddings and isinstance(embeddings[0], torch.Tensor):
+            return TokenEmbeddings.from_sequences(embeddings)
+        return np.stack(embeddings)
+
     def _compute_metrics(
         self,
         embeddings1,
@@ -84,18 +131,11 @@ class BitextMiningEvaluator(Evaluator):
     ):
         # Find nearest neighbors
         logger.info("Finding nearest neighbors...")
-        nearest_neighbors = self._similarity_search(
-            embeddings1, embeddings2, model, top_k=1
-        )
+        predictions = self._nearest_neighbors(embeddings1, embeddings2, model).tolist()
 
         # Compute errors
         logger.info("Computing metrics...")
-        labels = []
-        predictions = []
-        for i, x in enumerate(nearest_neighbors):
-            j = x[0]["corpus_id"]
-            predictions.append(j)
-            labels.append(self.gold[i][1])
+        labels = [self.gold[i][1] for i in range(len(predictions))]
 
         scores = {
             "precision": precision_score(
@@ -109,6 +149,74 @@ class BitextMiningEvaluator(Evaluator):
         }
         return scores
 
+    @staticmethod
+    def _similarity(
+        model: Encoder, embeddings1: torch.Tensor, embeddings2: torch.Tensor
+    ) -> torch.Tensor:
+        if hasattr(model, "similarity"):
+            return model.similarity(embeddings1, embeddings2)
+        return cos_sim(embeddings1, embeddings2)
+
+    @staticmethod
+    def _to_2d_tensors(
+        query_embeddings, corpus_embeddings
+    ) -> tuple[torch.Tensor | TokenEmbeddings, torch.Tensor | TokenEmbeddings]:
+        # packed token embeddings are passed on to the model's similarity as they are
+        if isinstance(query_embeddings, TokenEmbeddings) or isinstance(
+            corpus_embeddings, TokenEmbeddings
+        ):
+            return query_embeddings, corpus_embeddings
+        query_embeddings = torch.from_numpy(query_embeddings)
+        corpus_embeddings = torch.from_numpy(corpus_embeddings)
+        if len(query_embeddings.shape) == 1:
+            query_embeddings = query_embeddings.unsqueeze(0)
+        if len(corpus_embeddings.shape) == 1:
+            corpus_embeddings = corpus_embeddings.unsqueeze(0)
+
+        # Check that corpus and queries are on the same device
+        if corpus_embeddings.device != query_embeddings.device:
+            query_embeddings = query_embeddings.to(corpus_embeddings.device)
+        return query_embeddings, corpus_embeddings
+
+    def _nearest_neighbors(
+        self,
+        query_embeddings,
+        corpus_embeddings,
+        model: Encoder,
+        query_chunk_size: int = 100,
+        corpus_chunk_size: int = 500000,
+    ) -> torch.Tensor:
+        """The index of the most similar corpus entry for each query, computed block by block while keeping only the running maximum.
+
+        Ties are resolved towards the lowest corpus index, like `_similarity_search` with `top_k=1`.
+        """
+        query_embeddings, corpus_embeddings = self._to_2d_tensors(
+            query_embeddings, corpus_embeddings
+        )
+        nearest = torch.zeros(len(query_embeddings), dtype=torch.long)
+        for query_start_idx in range(0, len(query_embeddings), query_chunk_size):
+            queries = query_embeddings[
+                query_start_idx : query_start_idx + query_chunk_size
+            ]
+            best_scores = torch.full((len(queries),), -torch.inf, dtype=torch.float64)
+            best_idx = torch.zeros(len(queries), dtype=torch.long)
+            for corpus_start_idx in range(0, len(corpus_embeddings), corpus_chunk_size):
+                similarity_scores = self._similarity(
+                    model,
+                    queries,
+                    corpus_embeddings[
+                        corpus_start_idx : corpus_start_idx + corpus_chunk_size
+                    ],
+                )
+                scores, idx = (
+                    torch.as_tensor(similarity_scores).cpu().double().max(dim=1)
+                )
+                improved = scores > best_scores
+                best_scores = torch.where(improved, scores, best_scores)
+                best_idx = torch.where(improved, idx + corpus_start_idx, best_idx)
+            nearest[query_start_idx : query_start_idx + len(queries)] = best_idx
+        return nearest
+
     def _similarity_search(
         self,
         query_embeddings,
@@ -132,24 +240,17 @@ class BitextMiningEvaluator(Evaluator):
         Returns:
             Returns a list with one entry for each query. Each entry is a list of dictionaries with the keys 'corpus_id' and 'score', sorted by decreasing cosine similarity scores.
         """
-        query_embeddings = torch.from_numpy(query_embeddings)
-        corpus_embeddings = torch.from_numpy(corpus_embeddings)
-        if len(query_embeddings.shape) == 1:
-            query_embeddings = query_embeddings.unsqueeze(0)
-        if len(corpus_embeddings.shape) == 1:
-            corpus_embeddings = corpus_embeddings.unsqueeze(0)
-
-        # Check that corpus and queries are on the same device
-        if corpus_embeddings.device != query_embeddings.device:
-            query_embeddings = query_embeddings.to(corpus_embeddings.device)
+        query_embeddings, corpus_embeddings = self._to_2d_tensors(
+            query_embeddings, corpus_embeddings
+        )
 
         queries_result_list = [[] for _ in range(len(query_embeddings))]
 
         for query_start_idx in range(0, len(query_embeddings), query_chunk_size):
             # Iterate over chunks of the corpus
             for corpus_start_idx in range(0, len(corpus_embeddings), corpus_chunk_size):
-                # Compute cosine similarities
-                similarity_scores = cos_sim(
+                similarity_scores = self._similarity(
+                    model,
                     query_embeddings[
                         query_start_idx : query_start_idx + query_chunk_size
                     ],
@@ -158,16 +259,6 @@ class BitextMiningEvaluator(Evaluator):
                     ],
                 )
 
-                if hasattr(model, "similarity"):
-                    similarity_scores = model.similarity(
-                        query_embeddings[
-                            query_start_idx : query_start_idx + query_chunk_size
-                        ],
-                        corpus_embeddings[
-                            corpus_start_idx : corpus_start_idx + corpus_chunk_size
-                        ],
-                    )
-
                 # Get top-k scores
                 cos_scores_top_k_values, cos_scores_top_k_idx = torch.topk(
                     similarity_scores,
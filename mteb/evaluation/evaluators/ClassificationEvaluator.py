@@ -62,16 +62,19 @@ class kNNClassificationEvaluator(Evaluator):
 
         self.k = k
 
-    def __call__(self, model, test_cache=None):
+    def __call__(self, model, test_cache=None, train_cache=None):
         scores = {}
         max_accuracy = 0
         max_f1 = 0
         max_ap = 0
-        X_train = model.encode(
-            self.sentences_train,
-            task_name=self.task_name,
-            **self.encode_kwargs,
-        )
+        if train_cache is None:
+            X_train = model.encode(
+                self.sentences_train,
+                task_name=self.task_name,
+                **self.encode_kwargs,
+            )
+        else:
+            X_train = train_cache
         if test_cache is None:
             X_test = model.encode(
                 self.sentences_test,
@@ -141,16 +144,19 @@ class kNNClassificationEvaluatorPytorch(Evaluator):
 
         self.k = k
 
-    def __call__(self, model: Encoder, test_cache=None):
+    def __call__(self, model: Encoder, test_cache=None, train_cache=None):
         scores = {}
         max_accuracy = 0
         max_f1 = 0
         max_ap = 0
-        X_train = model.encode(
-            self.sentences_train,
-            task_name=self.task_name,
-            **self.encode_kwargs,
-        )
+        if train_cache is None:
+            X_train = model.encode(
+                self.sentences_train,
+                task_name=self.task_name,
+                **self.encode_kwargs,
+            )
+        else:
+            X_train = train_cache
 
         if test_cache is None:
             X_test = model.encode(
@@ -295,7 +301,7 @@ class logRegClassificationEvaluator(Evaluator):
         self.max_iter = max_iter
         self.task_name = task_name
 
-    def __call__(self, model, test_cache=None):
+    def __call__(self, model, test_cache=None, train_cache=None):
         scores = {}
         clf = LogisticRegression(
             random_state=self.seed,
@@ -303,11 +309,14 @@ class logRegClassificationEvaluator(Evaluator):
             max_iter=self.max_iter,
             verbose=1 if logger.isEnabledFor(logging.DEBUG) else 0,
         )
-        X_train = model.encode(
-            self.sentences_train,
-            task_name=self.task_name,
-            **self.encode_kwargs,
-        )
+        if train_cache is None:
+            X_train = model.encode(
+                self.sentences_train,
+                task_name=self.task_name,
+                **self.encode_kwargs,
+            )
+        else:
+            X_train = train_cache
         if test_cache is None:
             X_test = model.encode(
                 self.sentences_test,
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import numpy as np
 import sklearn
 import sklearn.cluster
 from sklearn import metrics
@@ -10,9 +11,12 @@ from sklearn import metrics
 from mteb.encoder_interface import Encoder
 
 from .Evaluator import Evaluator
+from .utils import encode_sorted_by_length
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CLUSTERING_BATCH_SIZE = 500
+
 
 class ClusteringEvaluator(Evaluator):
     def __init__(
@@ -20,7 +24,7 @@ class ClusteringEvaluator(Evaluator):
         sentences,
         labels,
         task_name: str | None = None,
-        clustering_batch_size: int = 500,
+        clustering_batch_size: int = DEFAULT_CLUSTERING_BATCH_SIZE,
         limit: int | None = None,
         **kwargs,
     ):
@@ -37,22 +41,43 @@ class ClusteringEvaluator(Evaluator):
         if "batch_size" not in encode_kwargs:
             encode_kwargs["batch_size"] = 32
 
-        corpus_embeddings = model.encode(
+        corpus_embeddings = encode_sorted_by_length(
+            model,
             self.sentences,
             task_name=self.task_name,
             **encode_kwargs,
         )
 
-        logger.info("Fitting Mini-Batch K-Means model...")
-        clustering_model = sklearn.cluster.MiniBatchKMeans(
-            n_clusters=len(set(self.labels)),
-            batch_size=self.clustering_batch_size,
-            n_init="auto",
-        )
-        clustering_model.fit(corpus_embeddings)
-        cluster_assignment = clustering_model.labels_
+        return {
+            "v_measure": fit_v_measure(
+                corpus_embeddings,
+                self.labels,
+                self.clustering_batch_size,
+                self.seed,
+            )
+        }
+
+
+def fit_v_measure(
+    embeddings: np.ndarray,
+    labels: list[Any],
+    clustering_batch_size: int,
+    seed: int,
+) -> float:
+    """Cluster the embeddings with mini-batch k-means, with one cluster per label, and compute the V-measure of the clusters.
 
-        logger.info("Evaluating...")
-        v_measure = metrics.cluster.v_measure_score(self.labels, cluster_assignment)
+    The k-means initialization is seeded with `seed` rather than the global random state, such that the result does not depend on the order,
+    nor the process, in which the cluster sets are evaluated.
+    """
+    logger.info("Fitting Mini-Batch K-Means model...")
+    clustering_model = sklearn.cluster.MiniBatchKMeans(
+        n_clusters=len(set(labels)),
+        batch_size=clustering_batch_size,
+        n_init="auto",
+        random_state=seed,
+    )
+    clustering_model.fit(embeddings)
+    cluster_assignment = clustering_model.labels_
 
-        return {"v_measure": v_measure}
+    logger.info("Evaluating...")
+    return metrics.cluster.v_measure_score(labels, cluster_assignment)
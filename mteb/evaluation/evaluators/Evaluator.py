@@ -9,13 +9,15 @@ import torch
 
 from mteb.encoder_interface import Encoder
 
+DEFAULT_SEED = 42
+
 
 class Evaluator(ABC):
     """Base class for all evaluators
     Extend this class and implement __call__ for custom evaluators.
     """
 
-    def __init__(self, seed: int = 42, **kwargs: Any):
+    def __init__(self, seed: int = DEFAULT_SEED, **kwargs: Any):
         self.seed = seed
         random.seed(self.seed)
         np.random.seed(self.seed)
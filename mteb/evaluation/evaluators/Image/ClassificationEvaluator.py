@@ -57,6 +57,27 @@ def custom_collate_fn(batch):
     return batch
 
 
+def encode_image_dataset(
+    model: Encoder,
+    hf_dataset,
+    image_column_name: str = "image",
+    batch_size: int = 32,
+):
+    """Embed the images of a huggingface dataset the way the classification evaluators embed their training split."""
+    dataloader = DataLoader(
+        ImageDataset(
+            hf_dataset,
+            image_column_name=image_column_name,
+            transform=get_default_transform(),
+        ),
+        batch_size=batch_size,
+        shuffle=False,
+        collate_fn=custom_collate_fn,
+        num_workers=min(math.floor(os.cpu_count() / 2), 16),
+    )
+    return model.get_image_embeddings(dataloader, batch_size=batch_size)
+
+
 class ImagekNNClassificationEvaluator(Evaluator):
     def __init__(
         self,
@@ -97,21 +118,24 @@ class ImagekNNClassificationEvaluator(Evaluator):
 
         self.k = k
 
-    def __call__(self, model, test_cache=None):
+    def __call__(self, model, test_cache=None, train_cache=None):
         scores = {}
         max_accuracy = 0
         max_f1 = 0
         max_ap = 0
-        dataloader_train = DataLoader(
-            self.dataset_train,
-            batch_size=self.encode_kwargs["batch_size"],
-            shuffle=False,
-            collate_fn=custom_collate_fn,
-            num_workers=min(math.floor(os.cpu_count() / 2), 16),
-        )
-        X_train = model.get_image_embeddings(
-            dataloader_train, batch_size=self.encode_kwargs["batch_size"]
-        )
+        if train_cache is None:
+            dataloader_train = DataLoader(
+                self.dataset_train,
+                batch_size=self.encode_kwargs["batch_size"],
+                shuffle=False,
+                collate_fn=custom_collate_fn,
+                num_workers=min(math.floor(os.cpu_count() / 2), 16),
+            )
+            X_train = model.get_image_embeddings(
+                dataloader_train, batch_size=self.encode_kwargs["batch_size"]
+            )
+        else:
+            X_train = train_cache
         dataloader = DataLoader(
             self.dataset_test,
             batch_size=self.encode_kwargs["batch_size"],
@@ -186,22 +210,25 @@ class ImagekNNClassificationEvaluatorPytorch(Evaluator):
 
         self.k = k
 
-    def __call__(self, model: Encoder, test_cache=None):
+    def __call__(self, model: Encoder, test_cache=None, train_cache=None):
         scores = {}
         max_accuracy = 0
         max_f1 = 0
         max_ap = 0
 
-        dataloader_train = DataLoader(
-            self.dataset_train,
-            batch_size=self.encode_kwargs["batch_size"],
-            shuffle=False,
-            collate_fn=custom_collate_fn,
-            num_workers=min(math.floor(os.cpu_count() / 2), 16),
-        )
-        X_train = model.get_image_embeddings(
-            dataloader_train, batch_size=self.encode_kwargs["batch_size"]
-        )
+        if train_cache is None:
+            dataloader_train = DataLoader(
+                self.dataset_train,
+                batch_size=self.encode_kwargs["batch_size"],
+                shuffle=False,
+                collate_fn=custom_collate_fn,
+                num_workers=min(math.floor(os.cpu_count() / 2), 16),
+            )
+            X_train = model.get_image_embeddings(
+                dataloader_train, batch_size=self.encode_kwargs["batch_size"]
+            )
+        else:
+            X_train = train_cache
 
         dataloader = DataLoader(
             self.dataset_test,
@@ -353,7 +380,7 @@ class ImagelogRegClassificationEvaluator(Evaluator):
         self.max_iter = max_iter
         self.task_name = task_name
 
-    def __call__(self, model, test_cache=None):
+    def __call__(self, model, test_cache=None, train_cache=None):
         scores = {}
         clf = LogisticRegression(
             random_state=self.seed,
@@ -361,16 +388,19 @@ class ImagelogRegClassificationEvaluator(Evaluator):
             max_iter=self.max_iter,
             verbose=1 if logger.isEnabledFor(logging.DEBUG) else 0,
         )
-        dataloader_train = DataLoader(
-            self.dataset_train,
-            batch_size=self.encode_kwargs["batch_size"],
-            shuffle=False,
-            collate_fn=custom_collate_fn,
-            num_workers=min(math.floor(os.cpu_count() / 2), 16),
-        )
-        X_train = model.get_image_embeddings(
-            dataloader_train, batch_size=self.encode_kwargs["batch_size"]
-        )
+        if train_cache is None:
+            dataloader_train = DataLoader(
+                self.dataset_train,
+                batch_size=self.encode_kwargs["batch_size"],
+                shuffle=False,
+                collate_fn=custom_collate_fn,
+                num_workers=min(math.floor(os.cpu_count() / 2), 16),
+            )
+            X_train = model.get_image_embeddings(
+                dataloader_train, batch_size=self.encode_kwargs["batch_size"]
+            )
+        else:
+            X_train = train_cache
         dataloader = DataLoader(
             self.dataset_test,
             batch_size=self.encode_kwargs["batch_size"],
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import logging
 
+from mteb.encoder_interface import PromptType
+
 from .RetrievalEvaluator import (
     RetrievalEvaluator,
 )
@@ -11,6 +13,39 @@ logger = logging.getLogger(__name__)
 
 class InstructionRetrievalEvaluator(RetrievalEvaluator):
     # only added to extend the RetrievalEvaluator to pass along the instructions
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.corpus_embeddings = None
+        self.corpus_id_to_index: dict[str, int] = {}
+
+    def _is_bm25(self) -> bool:
+        return (
+            hasattr(self.retriever.model, "mteb_model_meta")
+            and self.retriever.model.mteb_model_meta.name == "bm25s"
+        )
+
+    def encode_corpus(self, corpus: dict[str, dict[str, str]]) -> None:
+        """Encode the corpus once, so that subsequent calls only encode the queries.
+
+        Only the query side changes between the instruction variants (original, changed, keywords, ...),
+        so the corpus embeddings are reused by every call until `clear_corpus_embeddings` is called.
+        Does nothing for cross-encoders and bm25s, which do not embed the corpus.
+        """
+        if self.is_cross_encoder or self._is_bm25() or not corpus:
+            return
+        corpus_ids = list(corpus)
+        self.corpus_id_to_index = {cid: i for i, cid in enumerate(corpus_ids)}
+        self.corpus_embeddings = self.retriever.model.encode(
+            [corpus[cid] for cid in corpus_ids],
+            task_name=self.task_name,
+            prompt_type=PromptType.passage,
+            **self.retriever.encode_kwargs,
+        )
+
+    def clear_corpus_embeddings(self) -> None:
+        self.corpus_embeddings = None
+        self.corpus_id_to_index = {}
+
     def __call__(
         self,
         corpus: dict[str, dict[str, str]],
@@ -26,10 +61,7 @@ class InstructionRetrievalEvaluator(RetrievalEvaluator):
             return self.retriever.search_cross_encoder(
                 corpus, queries, self.top_k, instructions=instructions, **kwargs
             )
-        elif (
-            hasattr(self.retriever.model, "mteb_model_meta")
-            and self.retriever.model.mteb_model_meta.name == "bm25s"
-        ):
+        elif self._is_bm25():
             return self.retriever.model.search(
                 corpus,
                 queries,
@@ -39,6 +71,13 @@ class InstructionRetrievalEvaluator(RetrievalEvaluator):
                 **kwargs,
             )
         else:
+            corpus_embeddings = None
+            if self.corpus_embeddings is not None and all(
+                cid in self.corpus_id_to_index for cid in corpus
+            ):
+                corpus_embeddings = self.corpus_embeddings[
+                    [self.corpus_id_to_index[cid] for cid in corpus]
+                ]
             return self.retriever.search(
                 corpus,
                 queries,
@@ -46,5 +85,6 @@ class InstructionRetrievalEvaluator(RetrievalEvaluator):
                 instructions=instructions,
                 request_qid=qid,
                 task_name=self.task_name,
+                corpus_embeddings=corpus_embeddings,
                 **kwargs,
             )
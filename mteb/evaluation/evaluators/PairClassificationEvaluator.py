@@ -116,10 +116,7 @@ class PairClassificationEvaluator(Evaluator):
 
         embeddings1_np = np.asarray(embeddings1)
         embeddings2_np = np.asarray(embeddings2)
-        dot_scores = [
-            np.dot(embeddings1_np[i], embeddings2_np[i])
-            for i in range(len(embeddings1_np))
-        ]
+        dot_scores = np.einsum("ij,ij->i", embeddings1_np, embeddings2_np)
 
         logger.info("Computing metrics...")
         labels = np.asarray(self.labels)
@@ -157,16 +154,19 @@ class PairClassificationEvaluator(Evaluator):
         Returns:
             The metrics for the given scores and labels.
         """
-        acc, acc_threshold = PairClassificationEvaluator.find_best_acc_and_threshold(
+        sorted_scores, sorted_labels = PairClassificationEvaluator._sort_by_similarity(
             scores, labels, high_score_more_similar
         )
+        acc, acc_threshold = PairClassificationEvaluator._best_acc_and_threshold(
+            sorted_scores, sorted_labels, high_score_more_similar
+        )
         (
             f1,
             precision,
             recall,
             f1_threshold,
-        ) = PairClassificationEvaluator.find_best_f1_and_threshold(
-            scores, labels, high_score_more_similar
+        ) = PairClassificationEvaluator._best_f1_and_threshold(
+            sorted_scores, sorted_labels, high_score_more_similar
         )
         ap = PairClassificationEvaluator.ap_score(
             scores, labels, high_score_more_similar
@@ -182,66 +182,113 @@ class PairClassificationEvaluator(Evaluator):
             "ap": float(ap),
         }
 
+    @staticmethod
+    def _sort_by_similarity(
+        scores, labels, high_score_more_similar: bool
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Sort the pairs from the most to the least similar. The sort is stable, i.e. pairs with the same score keep their order."""
+        scores = np.asarray(scores)
+        labels = np.asarray(labels)
+        order = np.argsort(
+            -scores if high_score_more_similar else scores, kind="stable"
+        )
+        return scores[order], labels[order]
+
     @staticmethod
     def find_best_acc_and_threshold(scores, labels, high_score_more_similar: bool):
         assert len(scores) == len(labels)
-        rows = list(zip(scores, labels))
+        return PairClassificationEvaluator._best_acc_and_threshold(
+            *PairClassificationEvaluator._sort_by_similarity(
+                scores, labels, high_score_more_similar
+            ),
+            high_score_more_similar,
+        )
 
-        rows = sorted(rows, key=lambda x: x[0], reverse=high_score_more_similar)
+    @staticmethod
+    def find_best_f1_and_threshold(scores, labels, high_score_more_similar: bool):
+        assert len(scores) == len(labels)
+        return PairClassificationEvaluator._best_f1_and_threshold(
+            *PairClassificationEvaluator._sort_by_similarity(
+                scores, labels, high_score_more_similar
+            ),
+            high_score_more_similar,
+        )
 
-        max_acc = 0
-        best_threshold = -1
+    @staticmethod
+    def _split_positions(scores: np.ndarray) -> np.ndarray:
+        """The positions after which a threshold can split the sorted pairs into similar and dissimilar ones.
 
-        positive_so_far = 0
-        remaining_negatives = sum(np.array(labels) == 0)
+        A threshold cannot separate pairs with the same score, so these are the last pairs of each group of equal scores, ending with the
+        last pair, i.e. classifying all pairs as similar.
+        """
+        return np.flatnonzero(np.append(scores[:-1] != scores[1:], True))
 
-        for i in range(len(rows) - 1):
-            score, label = rows[i]
-            if label == 1:
-                positive_so_far += 1
-            else:
-                remaining_negatives -= 1
+    @staticmethod
+    def _threshold(
+        scores: np.ndarray, position: int, high_score_more_similar: bool
+    ) -> float:
+        """The threshold classifying the sorted pairs up to `position` as similar: halfway to the next score, or just past the last one."""
+        if position + 1 < len(scores):
+            return (scores[position] + scores[position + 1]) / 2
+        return np.nextafter(
+            scores[position], -np.inf if high_score_more_similar else np.inf
+        )
 
-            acc = (positive_so_far + remaining_negatives) / len(labels)
-            if acc > max_acc:
-                max_acc = acc
-                best_threshold = (rows[i][0] + rows[i + 1][0]) / 2
+    @staticmethod
+    def _best_acc_and_threshold(
+        scores: np.ndarray, labels: np.ndarray, high_score_more_similar: bool
+    ):
+        """The best accuracy and its threshold, for the pairs sorted from the most to the least similar."""
+        max_acc = 0
+        best_threshold = -1
+        if len(labels) < 2:
+            return max_acc, best_threshold
+
+        # the accuracy when classifying the pairs up to each position as similar and the rest as dissimilar
+        positive_so_far = np.cumsum(labels == 1)
+        remaining_negatives = np.sum(labels == 0) - np.cumsum(labels != 1)
+        acc = (positive_so_far + remaining_negatives) / len(labels)
+
+        # the first split with the highest accuracy
+        splits = PairClassificationEvaluator._split_positions(scores)
+        best = int(splits[np.argmax(acc[splits])])
+        if acc[best] > max_acc:
+            max_acc = acc[best]
+            best_threshold = PairClassificationEvaluator._threshold(
+                scores, best, high_score_more_similar
+            )
 
         return max_acc, best_threshold
 
     @staticmethod
-    def find_best_f1_and_threshold(scores, labels, high_score_more_similar: bool):
-        assert len(scores) == len(labels)
-
-        scores = np.asarray(scores)
-        labels = np.asarray(labels)
-
-        rows = list(zip(scores, labels))
-
-        rows = sorted(rows, key=lambda x: x[0], reverse=high_score_more_similar)
-
+    def _best_f1_and_threshold(
+        scores: np.ndarray, labels: np.ndarray, high_score_more_similar: bool
+    ):
+        """The best F1 with its precision, recall and threshold, for the pairs sorted from the most to the least similar."""
         best_f1 = best_precision = best_recall = 0
         threshold = 0
-        nextract = 0
-        ncorrect = 0
-        total_num_duplicates = sum(labels)
-
-        for i in range(len(rows) - 1):
-            score, label = rows[i]
-            nextract += 1
-
-            if label == 1:
-                ncorrect += 1
-
-            if ncorrect > 0:
-                precision = ncorrect / nextract
-                recall = ncorrect / total_num_duplicates
-                f1 = 2 * precision * recall / (precision + recall)
-                if f1 > best_f1:
-                    best_f1 = f1
-                    best_precision = precision
-                    best_recall = recall
-                    threshold = (rows[i][0] + rows[i + 1][0]) / 2
+        total_num_duplicates = labels.sum()
+
+        nextract = np.arange(1, len(labels) + 1)
+        ncorrect = np.cumsum(labels == 1)
+        splits = PairClassificationEvaluator._split_positions(scores)
+        # the F1 is only defined once a similar pair has been extracted
+        candidates = splits[ncorrect[splits] > 0]
+        if len(candidates) == 0:
+            return best_f1, best_precision, best_recall, threshold
+
+        precision = ncorrect[candidates] / nextract[candidates]
+        recall = ncorrect[candidates] / total_num_duplicates
+        f1 = 2 * precision * recall / (precision + recall)
+
+        best = int(np.argmax(f1))
+        if f1[best] > best_f1:
+            best_f1 = f1[best]
+            best_precision = precision[best]
+            best_recall = recall[best]
+            threshold = PairClassificationEvaluator._threshold(
+                scores, int(candidates[best]), high_score_more_similar
+            )
 
         return best_f1, best_precision, best_recall, threshold
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from itertools import chain
 from typing import Any
 
 import numpy as np
@@ -12,6 +13,7 @@ from mteb.evaluation.evaluators.RetrievalEvaluator import RetrievalEvaluator
 
 from ...encoder_interface import Encoder, PromptType
 from .Evaluator import Evaluator
+from .retrieval_metrics import _confidence_scores, _padded
 from .utils import confidence_scores, cos_sim, nAUC
 
 logger = logging.getLogger(__name__)
@@ -83,42 +85,35 @@ class RerankingEvaluator(Evaluator):
         """
         logger.info("Encoding queries...")
         if isinstance(self.samples[0]["query"], str):
-            all_query_embs = np.asarray(
-                model.encode(
-                    [sample["query"] for sample in self.samples],
-                    task_name=self.task_name,
-                    prompt_type=PromptType.query,
-                    **self.encode_kwargs,
-                )
-            )
+            all_queries = [sample["query"] for sample in self.samples]
         elif isinstance(self.samples[0]["query"], list):
             # In case the query is a list of strings, we get the most similar embedding to any of the queries
-            all_query_flattened = [
-                q for sample in self.samples for q in sample["query"]
-            ]
-            all_query_embs = self._encode_unique_texts(
-                all_query_flattened,
-                model,
-                task_name=self.task_name,
-                prompt_type=PromptType.query,
-                **self.encode_kwargs,
-            )
+            all_queries = [q for sample in self.samples for q in sample["query"]]
         else:
             raise ValueError(
                 f"Query must be a string or a list of strings but is {type(self.samples[0]['query'])}"
             )
+        all_query_embs, all_query_indexes = self._encode_unique_texts(
+            all_queries,
+            model,
+            task_name=self.task_name,
+            prompt_type=PromptType.query,
+            **self.encode_kwargs,
+        )
 
         if self.evaluator_type == "standard":
             results = self._encode_candidates(
                 model=model,
                 batched=True,
                 all_query_embs=all_query_embs,
+                all_query_indexes=all_query_indexes,
             )
         elif self.evaluator_type == "miracl":
             results = self._encode_candidates_miracl(
                 model=model,
                 batched=True,
                 all_query_embs=all_query_embs,
+                all_query_indexes=all_query_indexes,
             )
         return results
 
@@ -140,7 +135,13 @@ class RerankingEvaluator(Evaluator):
             )
         return results
 
-    def _encode_candidates(self, model: Encoder, batched: bool, all_query_embs=None):
+    def _encode_candidates(
+        self,
+        model: Encoder,
+        batched: bool,
+        all_query_embs=None,
+        all_query_indexes=None,
+    ):
         all_mrr_scores = []
         all_ap_scores = []
         all_conf_scores = []
@@ -149,6 +150,7 @@ class RerankingEvaluator(Evaluator):
             self._encode_candidates_batched(
                 model=model,
                 all_query_embs=all_query_embs,
+                all_query_indexes=all_query_indexes,
                 all_mrr_scores=all_mrr_scores,
                 all_ap_scores=all_ap_scores,
                 all_conf_scores=all_conf_scores,
@@ -166,6 +168,7 @@ class RerankingEvaluator(Evaluator):
     def _encode_candidates_batched(
         self,
         all_query_embs,
+        all_query_indexes,
         model: Encoder,
         all_mrr_scores,
         all_ap_scores,
@@ -176,7 +179,7 @@ class RerankingEvaluator(Evaluator):
             all_docs.extend(sample["positive"])
             all_docs.extend(sample["negative"])
 
-        all_docs_embs = self._encode_unique_texts(
+        all_docs_embs, all_docs_indexes = self._encode_unique_texts(
             all_docs,
             model,
             task_name=self.task_name,
@@ -186,31 +189,42 @@ class RerankingEvaluator(Evaluator):
 
         # Compute scores and confidence scores
         logger.info("Evaluating...")
+        all_sim_scores, all_is_relevant = [], []
         query_idx, docs_idx = 0, 0
         for instance in self.samples:
             num_subqueries = (
                 len(instance["query"]) if isinstance(instance["query"], list) else 1
             )
-            query_emb = all_query_embs[query_idx : query_idx + num_subqueries]
+            query_emb = all_query_embs[
+                all_query_indexes[query_idx : query_idx + num_subqueries]
+            ]
             query_idx += num_subqueries
 
             num_pos = len(instance["positive"])
             num_neg = len(instance["negative"])
-            docs_emb = all_docs_embs[docs_idx : docs_idx + num_pos + num_neg]
+            docs_emb = all_docs_embs[
+                all_docs_indexes[docs_idx : docs_idx + num_pos + num_neg]
+            ]
             docs_idx += num_pos + num_neg
 
             if num_pos == 0 or num_neg == 0:
                 continue
-            is_relevant = [True] * num_pos + [False] * num_neg
-            self._apply_sim_scores(
-                query_emb,
-                docs_emb,
-                is_relevant,
-                all_mrr_scores,
-                all_ap_scores,
-                all_conf_scores,
-                model,
+            all_sim_scores.append(
+                self._compute_sim_scores_instance(query_emb, docs_emb, model)
             )
+            all_is_relevant.append([True] * num_pos + [False] * num_neg)
+
+        if not all_sim_scores:
+            return
+        mrr_scores, ap_scores, conf_scores = self._compute_metrics_batched(
+            all_sim_scores, all_is_relevant
+        )
+        all_mrr_scores.extend(mrr_scores.tolist())
+        all_ap_scores.extend(ap_scores.tolist())
+        all_conf_scores.extend(
+            dict(zip(conf_scores, values))
+            for values in zip(*(scores.tolist() for scores in conf_scores.values()))
+        )
 
     def _encode_candidates_individual(
         self,
@@ -274,28 +288,33 @@ class RerankingEvaluator(Evaluator):
         model: Encoder,
         batched,
         all_query_embs=None,
+        all_query_indexes=None,
     ):
         if batched:
             return self._encode_candidates_miracl_batched(
-                model=model, all_query_embs=all_query_embs
+                model=model,
+                all_query_embs=all_query_embs,
+                all_query_indexes=all_query_indexes,
             )
         else:
             return self._encode_candidates_miracl_individual(
                 model=model,
             )
 
-    def _encode_candidates_miracl_batched(self, all_query_embs, model: Encoder):
+    def _encode_candidates_miracl_batched(
+        self, all_query_embs, all_query_indexes, model: Encoder
+    ):
         all_docs = []
         for sample in self.samples:
             all_docs.extend(sample["candidates"])
 
-        all_docs_embs = np.asarray(
-            model.encode(
-                all_docs,
-                task_name=self.task_name,
-                prompt_type=PromptType.passage,
-                **self.encode_kwargs,
-            )
+        # the candidates of the queries overlap heavily, so each distinct candidate is only encoded once
+        all_docs_embs, all_docs_indexes = self._encode_unique_texts(
+            all_docs,
+            model,
+            task_name=self.task_name,
+            prompt_type=PromptType.passage,
+            **self.encode_kwargs,
         )
 
         # Compute scores
@@ -306,13 +325,15 @@ class RerankingEvaluator(Evaluator):
             num_subqueries = (
                 len(instance["query"]) if isinstance(instance["query"], list) else 1
             )
-            query_emb = all_query_embs[query_idx : query_idx + num_subqueries]
+            query_emb = all_query_embs[
+                all_query_indexes[query_idx : query_idx + num_subqueries]
+            ]
             query_idx += num_subqueries
 
-            positive = instance["positive"]
+            positive = set(instance["positive"])
             docs = instance["candidates"]
             num_doc = len(docs)
-            docs_emb = all_docs_embs[docs_idx : docs_idx + num_doc]
+            docs_emb = all_docs_embs[all_docs_indexes[docs_idx : docs_idx + num_doc]]
             docs_idx += num_doc
 
             fake_qid = str(query_idx)
@@ -426,16 +447,22 @@ class RerankingEvaluator(Evaluator):
         task_name: str | None,
         prompt_type: PromptType | None,
         **encode_kwargs: Any,
-    ):
-        index_map, all_unique_texts, all_texts_indexes = {}, [], []
-        for text in all_texts:
-            text_hash = hash(text)
-            if text_hash not in index_map:
-                index_map[text_hash] = len(all_unique_texts)
-                all_unique_texts.append(text)
-            all_texts_indexes.append(index_map[text_hash])
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Encodes each distinct text once.
+
+        Returns:
+            The embeddings of the unique texts, and the index of the embedding of each text of `all_texts`, as an int32 array. The embeddings
+            of a range of texts are gathered through the index, instead of duplicating the embeddings of repeated texts.
+        """
+        index_map: dict[str, int] = {}
+        all_texts_indexes = np.fromiter(
+            (index_map.setdefault(text, len(index_map)) for text in all_texts),
+            dtype=np.int32,
+            count=len(all_texts),
+        )
+        all_unique_texts = list(index_map)
         logger.warning(
-            f"A total of {len(all_texts) - len(all_unique_texts)}/{len(all_texts)} duplicate texts were found during encoding. Only encoding unique text and duplicating embeddings across."
+            f"A total of {len(all_texts) - len(all_unique_texts)}/{len(all_texts)} duplicate texts were found during encoding. Only encoding unique texts."
         )
         all_unique_texts_embs = np.asarray(
             model.encode(
@@ -445,7 +472,7 @@ class RerankingEvaluator(Evaluator):
                 **encode_kwargs,
             )
         )
-        return all_unique_texts_embs[all_texts_indexes]
+        return all_unique_texts_embs, all_texts_indexes
 
     def _compute_sim_scores_instance(
         self, query_emb: np.ndarray, docs_emb: np.ndarray, model: Encoder
@@ -489,6 +516,68 @@ class RerankingEvaluator(Evaluator):
         ap = self.ap_score(is_relevant, sim_scores.cpu().tolist())
         return {"mrr": mrr, "ap": ap}
 
+    def _compute_metrics_batched(
+        self, all_sim_scores: list[torch.Tensor], all_is_relevant: list[list[bool]]
+    ) -> tuple[np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+        """Computes the metrics of all instances at once, from a (num_instances, max_num_candidates) matrix of their similarity scores padded
+        with -inf.
+
+        The results match `_compute_metrics_instance` and `conf_scores` for each instance, where candidates with the same similarity score are
+        ranked in their original order for the MRR.
+
+        Args:
+            all_sim_scores: The query-documents similarity scores of each instance, with shape `(num_pos+num_neg,)`
+            all_is_relevant: True if the document is relevant, for each instance
+
+        Returns:
+            The MRR@`self.mrr_at_k` and AP of each instance, and the confidence scores of the instances.
+        """
+        counts = [len(is_relevant) for is_relevant in all_is_relevant]
+        rows = np.repeat(np.arange(len(counts)), counts)
+        scores = (
+            torch.cat(
+                [sim_scores.detach().cpu().reshape(-1) for sim_scores in all_sim_scores]
+            )
+            .double()
+            .numpy()
+        )
+        relevance = np.fromiter(
+            chain.from_iterable(all_is_relevant), dtype=bool, count=len(scores)
+        )
+
+        padded_scores = _padded(rows, counts, scores, -np.inf)
+        order = np.argsort(-padded_scores, axis=1, kind="stable")
+        sorted_scores = np.take_along_axis(padded_scores, order, axis=1)
+        sorted_relevance = np.take_along_axis(
+            _padded(rows, counts, relevance, False), order, axis=1
+        )
+        n_candidates = sorted_scores.shape[1]
+        is_candidate = np.arange(n_candidates) < np.array(counts)[:, None]
+
+        first_relevant = sorted_relevance.argmax(axis=1)
+        mrr_scores = np.where(
+            sorted_relevance[:, : self.mrr_at_k].any(axis=1),
+            1 / (first_relevant + 1),
+            0.0,
+        )
+
+        # As in sklearn's average_precision_score, the precision is only evaluated after the last candidate of each distinct score, and
+        # weighted by the number of relevant candidates with that score.
+        precision = np.cumsum(sorted_relevance, axis=1) / np.arange(1, n_candidates + 1)
+        tied_with_next = np.zeros_like(is_candidate)
+        tied_with_next[:, :-1] = (
+            sorted_scores[:, 1:] == sorted_scores[:, :-1]
+        ) & is_candidate[:, 1:]
+        positions = np.where(
+            is_candidate & ~tied_with_next, np.arange(n_candidates), n_candidates - 1
+        )
+        last_of_score = np.minimum.accumulate(positions[:, ::-1], axis=1)[:, ::-1]
+        ap_scores = (
+            sorted_relevance * np.take_along_axis(precision, last_of_score, axis=1)
+        ).sum(axis=1) / np.maximum(sorted_relevance.sum(axis=1), 1)
+
+        return mrr_scores, ap_scores, _confidence_scores(rows, counts, scores)
+
     @staticmethod
     def conf_scores(sim_scores: torch.Tensor) -> dict[str, float]:
         """Computes confidence scores for a single instance = (query, positives, negatives)
@@ -1,15 +1,14 @@
 from __future__ import annotations
 
-import heapq
 import json
 import logging
 import os
+import warnings
 from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
 import numpy as np
-import pytrec_eval
 import torch
 import tqdm
 from sentence_transformers import CrossEncoder, SentenceTransformer
@@ -17,17 +16,22 @@ from sentence_transformers import CrossEncoder, SentenceTransformer
 from mteb.encoder_interface import Encoder, PromptType
 from mteb.model_meta import ModelMeta
 
+from .corpus_checkpoint import CorpusChunkCheckpoint, checkpoint_fingerprint
 from .Evaluator import Evaluator
+from .retrieval_metrics import RankedRun
+from .retrieval_metrics import confidence_scores as query_confidence_scores
+from .search_backends import (
+    SearchBackend,
+    get_search_backend,
+    recall_against_exact,
+)
 from .utils import (
-    confidence_scores,
     convert_conv_history_to_query,
     cos_sim,
     download,
-    hole,
-    mrr,
+    encode_sorted_by_length,
+    length_sorted_order,
     nAUC,
-    recall_cap,
-    top_k_accuracy,
 )
 
 logger = logging.getLogger(__name__)
@@ -62,12 +66,36 @@ class DenseRetrievalExactSearch:
         model: Encoder,
         encode_kwargs: dict[str, Any] = {},
         corpus_chunk_size: int = 50000,
+        query_chunk_size: int = 1024,
         previous_results: str | Path | None = None,
+        search_backend: str | type[SearchBackend] = "exact",
+        search_backend_kwargs: dict[str, Any] | None = None,
+        search_recall_sample_size: int = 100,
+        corpus_checkpoint_dir: str | Path | None = None,
         **kwargs: Any,
     ):
         # Model is class that provides encode_corpus() and encode_queries()
         self.model = model
+        if (
+            "search_backend" in encode_kwargs
+            or "search_backend_kwargs" in encode_kwargs
+        ):
+            # the search backend can also be selected through the encode_kwargs, but is not passed on to the model
+            search_backend = encode_kwargs.get("search_backend", search_backend)
+            search_backend_kwargs = encode_kwargs.get(
+                "search_backend_kwargs", search_backend_kwargs
+            )
+            encode_kwargs = {
+                k: v
+                for k, v in encode_kwargs.items()
+                if k not in ["search_backend", "search_backend_kwargs"]
+            }
         self.encode_kwargs = encode_kwargs
+        self.search_backend = get_search_backend(search_backend)
+        self.search_backend_kwargs = search_backend_kwargs or {}
+        self.search_recall_sample_size = search_recall_sample_size
+        # (approximate, exact) corpus positions of a sample of the queries, if an approximate search backend is used
+        self.recall_sample: tuple[torch.Tensor, torch.Tensor] | None = None
 
         if "batch_size" not in encode_kwargs:
             encode_kwargs["batch_size"] = 128
@@ -77,6 +105,10 @@ class DenseRetrievalExactSearch:
             encode_kwargs["convert_to_tensor"] = True
 
         self.corpus_chunk_size = corpus_chunk_size
+        self.query_chunk_size = query_chunk_size
+        # opt-in folder for checkpoints of the encoded corpus chunks, such that an interrupted search resumes after the last finished chunk.
+        # Only used for models whose mteb_model_meta has a name and revision, which identify the encoder of a checkpoint.
+        self.corpus_checkpoint_dir = corpus_checkpoint_dir
         if isinstance(previous_results, Path):
             self.previous_results = str(previous_results)
         else:
@@ -103,9 +135,20 @@ class DenseRetrievalExactSearch:
         task_name: str,
         instructions: dict[str, str] | None = None,
         request_qid: str | None = None,
-        return_sorted: bool = False,
+        return_sorted: bool | None = None,
+        corpus_embeddings: torch.Tensor | np.ndarray | None = None,
         **kwargs,
     ) -> dict[str, dict[str, float]]:
+        """Retrieve the top_k documents of the corpus for each query.
+
+        If `corpus_embeddings` are given (in the order of `corpus`), they are used instead of encoding the corpus. The documents of each query
+        are returned sorted by descending score; `return_sorted` is deprecated and ignored.
+        """
+        if return_sorted is not None:
+            warnings.warn(
+                "`return_sorted` is deprecated and ignored: the documents of each query are always returned sorted by descending score.",
+                DeprecationWarning,
+            )
         logger.info("Encoding Queries.")
         query_ids = list(queries.keys())
         self.results = {qid: {} for qid in query_ids}
@@ -120,7 +163,8 @@ class DenseRetrievalExactSearch:
                 **self.encode_kwargs,
             )
         else:
-            query_embeddings = self.model.encode(
+            query_embeddings = encode_sorted_by_length(
+                self.model,
                 queries,  # type: ignore
                 task_name=task_name,
                 prompt_type=PromptType.query,
@@ -128,32 +172,115 @@ class DenseRetrievalExactSearch:
             )
 
         logger.info("Sorting Corpus by document length (Longest first)...")
-        corpus_ids = sorted(
-            corpus,
-            reverse=True,
-        )
+        corpus_ids = list(corpus)
+        order = length_sorted_order([corpus[cid] for cid in corpus_ids])
+        if order is not None:
+            corpus_ids = [corpus_ids[i] for i in order]
+        else:
+            corpus_ids = sorted(corpus_ids, reverse=True)
+        if corpus_embeddings is not None:
+            corpus_position = {cid: i for i, cid in enumerate(corpus)}
+            corpus_embeddings = corpus_embeddings[
+                [corpus_position[cid] for cid in corpus_ids]
+            ]
         corpus = [corpus[cid] for cid in corpus_ids]  # type: ignore
+        # documents with equal scores are retrieved by descending id, like the heap of (score, corpus id) that used to keep the top-k
+        tie_break_rank = torch.empty(len(corpus_ids), dtype=torch.long)
+        tie_break_rank[
+            sorted(range(len(corpus_ids)), key=corpus_ids.__getitem__, reverse=True)
+        ] = torch.arange(len(corpus_ids))
 
         logger.info("Encoding Corpus in batches... Warning: This might take a while!")
 
         itr = range(0, len(corpus), self.corpus_chunk_size)
 
-        result_heaps = {
-            qid: [] for qid in query_ids
-        }  # Keep only the top-k docs for each query
+        # Compute similarites using self defined similarity otherwise default to cosine-similarity
+        backend = self.search_backend(
+            query_embeddings,
+            top_k,
+            self.model.similarity if hasattr(self.model, "similarity") else cos_sim,
+            query_chunk_size=self.query_chunk_size,
+            tie_break_rank=tie_break_rank,
+            **self.search_backend_kwargs,
+        )
+        checkpoint = None
+        if self.corpus_checkpoint_dir is not None and corpus_embeddings is None:
+            model_meta = getattr(
+                getattr(self.model, "model", self.model), "mteb_model_meta", None
+            )
+            if model_meta is None or not model_meta.name or not model_meta.revision:
+                # the checkpoint of another encoder would be resumed silently
+                logger.warning(
+                    "Not checkpointing the corpus embeddings, as the model has no mteb_model_meta with a name and revision to identify them."
+                )
+            else:
+                checkpoint = CorpusChunkCheckpoint(
+                    self.corpus_checkpoint_dir,
+                    checkpoint_fingerprint(
+                        model_meta.name,
+                        model_meta.revision,
+                        task_name,
+                        request_qid,
+                        top_k,
+                        self.corpus_chunk_size,
+                        self.query_chunk_size,
+                        self.search_backend.__name__,
+                        self.search_backend_kwargs,
+                        sorted(
+                            (k, v)
+                            for k, v in self.encode_kwargs.items()
+                            if k != "show_progress_bar"
+                        ),
+                        # the prompts of the wrapper and of the underlying model, which select the prompt of the documents
+                        getattr(self.model, "model_prompts", None),
+                        getattr(getattr(self.model, "model", None), "prompts", None),
+                        *query_ids,
+                        *queries,
+                        *corpus_ids,
+                        *corpus,
+                    ),
+                )
+                if checkpoint.backend_state is not None:
+                    backend.load_state_dict(checkpoint.backend_state)
+        # the chunks which are encoded in the checkpoint, and the chunks which are part of the restored search state
+        resumed_chunks = checkpoint.n_chunks if checkpoint is not None else 0
+        restored_chunks = (
+            resumed_chunks
+            if checkpoint is not None and checkpoint.backend_state is not None
+            else 0
+        )
+
         for batch_num, corpus_start_idx in enumerate(itr):
             logger.info(f"Encoding Batch {batch_num + 1}/{len(itr)}...")
             corpus_end_idx = min(corpus_start_idx + self.corpus_chunk_size, len(corpus))
+            if batch_num < restored_chunks and not (
+                self.save_corpus_embeddings and request_qid
+            ):
+                continue
+            resumed = batch_num < resumed_chunks
 
             # Encode chunk of corpus
-            if (
+            if corpus_embeddings is not None:
+                sub_corpus_embeddings = corpus_embeddings[
+                    corpus_start_idx:corpus_end_idx
+                ]
+            elif (
                 self.save_corpus_embeddings
                 and request_qid
                 and len(self.corpus_embeddings[request_qid])
             ):
-                sub_corpus_embeddings = torch.tensor(
-                    self.corpus_embeddings[request_qid][batch_num]
-                )
+                sub_corpus_embeddings = self.corpus_embeddings[request_qid][batch_num]
+                # models may return other containers, e.g. the packed token embeddings of late-interaction models
+                if isinstance(sub_corpus_embeddings, (np.ndarray, list)):
+                    sub_corpus_embeddings = torch.tensor(sub_corpus_embeddings)
+            elif resumed:
+                sub_corpus_embeddings = checkpoint.load_chunk(batch_num)  # type: ignore
+                if isinstance(query_embeddings, torch.Tensor):
+                    sub_corpus_embeddings = sub_corpus_embeddings.to(
+                        query_embeddings.device, query_embeddings.dtype
+                    )
+                if self.save_corpus_embeddings and request_qid:
+                    self.corpus_embeddings[request_qid].append(sub_corpus_embeddings)
             else:
                 # Encode chunk of corpus
                 sub_corpus_embeddings = self.model.encode(
@@ -166,55 +293,36 @@ class DenseRetrievalExactSearch:
                 if self.save_corpus_embeddings and request_qid:
                     self.corpus_embeddings[request_qid].append(sub_corpus_embeddings)
 
-            # Compute similarites using self defined similarity otherwise default to cosine-similarity
-            if hasattr(self.model, "similarity"):
-                similarity_scores = self.model.similarity(
-                    query_embeddings, sub_corpus_embeddings
+            if batch_num >= restored_chunks:
+                backend.add(sub_corpus_embeddings)
+            if checkpoint is not None and not resumed:
+                checkpoint.save_chunk(
+                    batch_num, sub_corpus_embeddings, backend.state_dict()
                 )
-            else:
-                similarity_scores = cos_sim(query_embeddings, sub_corpus_embeddings)
-            is_nan = torch.isnan(similarity_scores)
-            if is_nan.sum() > 0:
-                logger.warning(
-                    f"Found {is_nan.sum()} NaN values in the similarity scores. Replacing NaN values with -1."
-                )
-            similarity_scores[is_nan] = -1
-
-            # Get top-k values
-            similarity_scores_top_k_values, similarity_scores_top_k_idx = torch.topk(
-                similarity_scores,
-                min(
-                    top_k + 1,
-                    len(similarity_scores[1])
-                    if len(similarity_scores) > 1
-                    else len(similarity_scores[-1]),
-                ),
-                dim=1,
-                largest=True,
-                sorted=return_sorted,
-            )
-            similarity_scores_top_k_values = (
-                similarity_scores_top_k_values.cpu().tolist()
+
+        top_k_values, top_k_idx = backend.search()
+        for qid, scores, corpus_idx in zip(
+            query_ids, top_k_values.tolist(), top_k_idx.tolist()
+        ):
+            self.results[qid] = {
+                corpus_ids[idx]: score
+                for idx, score in zip(corpus_idx, scores)
+                if idx >= 0
+            }
+
+        if checkpoint is not None:
+            checkpoint.remove()
+
+        self.recall_sample = None
+        if not backend.is_exact:
+            # measure how much the approximate search deviates from exact search on a sample of the queries
+            sample_idx = torch.from_numpy(
+                np.random.default_rng(42).permutation(len(query_ids))[
+                    : self.search_recall_sample_size
+                ]
             )
-            similarity_scores_top_k_idx = similarity_scores_top_k_idx.cpu().tolist()
-
-            for query_itr in range(len(query_embeddings)):
-                query_id = query_ids[query_itr]
-                for sub_corpus_id, score in zip(
-                    similarity_scores_top_k_idx[query_itr],
-                    similarity_scores_top_k_values[query_itr],
-                ):
-                    corpus_id = corpus_ids[corpus_start_idx + sub_corpus_id]
-                    if len(result_heaps[query_id]) < top_k:
-                        # Push item on the heap
-                        heapq.heappush(result_heaps[query_id], (score, corpus_id))
-                    else:
-                        # If item is larger than the smallest in the heap, push it on the heap then pop the smallest element
-                        heapq.heappushpop(result_heaps[query_id], (score, corpus_id))
-
-        for qid in result_heaps:
-            for score, corpus_id in result_heaps[qid]:
-                self.results[qid][corpus_id] = score
+            _, exact_idx = backend.exact_search(sample_idx)
+            self.recall_sample = (top_k_idx[sample_idx], exact_idx)
 
         return self.results
 
@@ -489,6 +597,21 @@ class RetrievalEvaluator(Evaluator):
                 task_name=self.task_name,  # type: ignore
             )
 
+    def search_recall(self) -> dict[str, float]:
+        """The recall@k of the approximate search backend against exact search, measured on a sample of the queries of the last call.
+
+        Empty if the last call did not use an approximate search backend.
+        """
+        if self.is_cross_encoder or self.retriever.recall_sample is None:
+            return {}
+        approximate_idx, exact_idx = self.retriever.recall_sample
+        recall = recall_against_exact(
+            approximate_idx,
+            exact_idx,
+            [k for k in self.k_values if k <= self.top_k],
+        )
+        return {f"search_recall_at_{k}": v for k, v in recall.items()}
+
     @staticmethod
     def evaluate(
         qrels: dict[str, dict[str, int]],
@@ -516,46 +639,17 @@ class RetrievalEvaluator(Evaluator):
                 "For evaluation, we DO NOT ignore identical query and document ids (default), please explicitly set ``ignore_identical_ids=True`` to ignore this."
             )
 
-        all_ndcgs, all_aps, all_recalls, all_precisions = {}, {}, {}, {}
+        ranked_run = RankedRun(qrels, results, k_values)
+        metric_scores = ranked_run.trec_metrics()
 
+        ndcg, _map, recall, precision = {}, {}, {}, {}
         for k in k_values:
-            all_ndcgs[f"NDCG@{k}"] = []
-            all_aps[f"MAP@{k}"] = []
-            all_recalls[f"Recall@{k}"] = []
-            all_precisions[f"P@{k}"] = []
-
-        map_string = "map_cut." + ",".join([str(k) for k in k_values])
-        ndcg_string = "ndcg_cut." + ",".join([str(k) for k in k_values])
-        recall_string = "recall." + ",".join([str(k) for k in k_values])
-        precision_string = "P." + ",".join([str(k) for k in k_values])
-        evaluator = pytrec_eval.RelevanceEvaluator(
-            qrels, {map_string, ndcg_string, recall_string, precision_string}
-        )
-        scores = evaluator.evaluate(results)
-
-        for query_id in scores.keys():
-            for k in k_values:
-                all_ndcgs[f"NDCG@{k}"].append(scores[query_id]["ndcg_cut_" + str(k)])
-                all_aps[f"MAP@{k}"].append(scores[query_id]["map_cut_" + str(k)])
-                all_recalls[f"Recall@{k}"].append(scores[query_id]["recall_" + str(k)])
-                all_precisions[f"P@{k}"].append(scores[query_id]["P_" + str(k)])
-
-        ndcg, _map, recall, precision = (
-            all_ndcgs.copy(),
-            all_aps.copy(),
-            all_recalls.copy(),
-            all_precisions.copy(),
-        )
+            ndcg[f"NDCG@{k}"] = round(float(metric_scores[f"NDCG@{k}"].mean()), 5)
+            _map[f"MAP@{k}"] = round(float(metric_scores[f"MAP@{k}"].mean()), 5)
+            recall[f"Recall@{k}"] = round(float(metric_scores[f"Recall@{k}"].mean()), 5)
+            precision[f"P@{k}"] = round(float(metric_scores[f"P@{k}"].mean()), 5)
 
-        for k in k_values:
-            ndcg[f"NDCG@{k}"] = round(sum(ndcg[f"NDCG@{k}"]) / len(scores), 5)
-            _map[f"MAP@{k}"] = round(sum(_map[f"MAP@{k}"]) / len(scores), 5)
-            recall[f"Recall@{k}"] = round(sum(recall[f"Recall@{k}"]) / len(scores), 5)
-            precision[f"P@{k}"] = round(sum(precision[f"P@{k}"]) / len(scores), 5)
-
-        naucs = RetrievalEvaluator.evaluate_abstention(
-            results, {**all_ndcgs, **all_aps, **all_recalls, **all_precisions}
-        )
+        naucs = RetrievalEvaluator._naucs(ranked_run.confidence_scores(), metric_scores)
 
         return ndcg, _map, recall, precision, naucs
 
@@ -567,14 +661,15 @@ class RetrievalEvaluator(Evaluator):
         metric: str,
         output_type: str = "all",
     ) -> tuple[dict[str, float], dict[str, float]]:
+        ranked_run = RankedRun(qrels, results, k_values)
         if metric.lower() in ["mrr", "mrr@k", "mrr_cut"]:
-            metric_scores = mrr(qrels, results, k_values, output_type)
+            metric_scores = ranked_run.mrr()
 
         elif metric.lower() in ["recall_cap", "r_cap", "r_cap@k"]:
-            metric_scores = recall_cap(qrels, results, k_values, output_type)
+            metric_scores = ranked_run.recall_cap()
 
         elif metric.lower() in ["hole", "hole@k"]:
-            metric_scores = hole(qrels, results, k_values, output_type)
+            metric_scores = ranked_run.hole()
 
         elif metric.lower() in [
             "acc",
@@ -583,10 +678,10 @@ class RetrievalEvaluator(Evaluator):
             "accuracy@k",
             "top_k_accuracy",
         ]:
-            metric_scores = top_k_accuracy(qrels, results, k_values, output_type)
+            metric_scores = ranked_run.top_k_accuracy()
 
-        naucs = RetrievalEvaluator.evaluate_abstention(results, metric_scores)
-        metric_scores_avg = {k: sum(v) / len(v) for k, v in metric_scores.items()}
+        naucs = RetrievalEvaluator._naucs(ranked_run.confidence_scores(), metric_scores)
+        metric_scores_avg = {k: float(v.mean()) for k, v in metric_scores.items()}
 
         return metric_scores_avg, naucs
 
@@ -596,17 +691,17 @@ class RetrievalEvaluator(Evaluator):
         metric_scores: dict[str, list[float]],
     ) -> dict[str, float]:
         """Computes normalized Area Under the Curve on a set of evaluated instances as presented in the paper https://arxiv.org/abs/2402.12997"""
-        all_sim_scores = [list(results[qid].values()) for qid in list(results.keys())]
-        all_conf_scores = [
-            confidence_scores(sim_scores) for sim_scores in all_sim_scores
-        ]
-        conf_fcts = list(all_conf_scores[0].keys())
-        all_conf_scores = {
-            fct: np.array([x[fct] for x in all_conf_scores]) for fct in conf_fcts
-        }
-        metric_scores = {k: np.array(v) for k, v in metric_scores.items()}
-        naucs = {}
+        return RetrievalEvaluator._naucs(
+            query_confidence_scores(results),
+            {k: np.array(v) for k, v in metric_scores.items()},
+        )
 
+    @staticmethod
+    def _naucs(
+        all_conf_scores: dict[str, np.ndarray],
+        metric_scores: dict[str, np.ndarray],
+    ) -> dict[str, float]:
+        naucs = {}
         for metric_name, scores in metric_scores.items():
             for fct, conf_scores in all_conf_scores.items():
                 naucs[f"nAUC_{metric_name}_{fct}"] = nAUC(conf_scores, scores)
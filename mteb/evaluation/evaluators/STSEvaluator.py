@@ -14,6 +14,7 @@ from sklearn.metrics.pairwise import (
 from mteb.encoder_interface import Encoder, EncoderWithSimilarity
 
 from .Evaluator import Evaluator
+from .utils import encode_sorted_by_length
 
 logger = logging.getLogger(__name__)
 
@@ -44,12 +45,14 @@ class STSEvaluator(Evaluator):
         *,
         encode_kwargs: dict[str, Any] = {},
     ):
-        embeddings1 = model.encode(
+        embeddings1 = encode_sorted_by_length(
+            model,
             self.sentences1,
             task_name=self.task_name,
             **encode_kwargs,
         )
-        embeddings2 = model.encode(
+        embeddings2 = encode_sorted_by_length(
+            model,
             self.sentences2,
             task_name=self.task_name,
             **encode_kwargs,
@@ -108,41 +108,27 @@ class SummarizationEvaluator(Evaluator):
             desc="Scoring",
             total=len(self.human_summaries),
         ):
-            cosine_pred_scores = []  # Predicted quality score for a summary
-            dot_pred_scores = []  # Predicted quality score for a summary
-            sim_scores = []
-            human_scores = []  # Human score for a summary
-
-            for emb_machine_summary, human_eval_score in zip(
-                embs_machine_summaries, self.gold_scores[i]
-            ):  # Iterate through all machine summaries + scores for a single sample
-                cosine_scores = cos_sim(emb_machine_summary, embs_human_summaries)
-                dot_scores = dot_score(emb_machine_summary, embs_human_summaries)
-
-                if hasattr(model, "similarity_pairwise"):
-                    # Pairwise similarity
-                    _sim_score = [
-                        float(model.similarity(emb_machine_summary, emb_human_summary))  # type: ignore
-                        for emb_human_summary in embs_human_summaries
-                    ]
-                    sim_score = torch.tensor(_sim_score)
-                elif hasattr(model, "similarity"):
-                    _sim_score = [
-                        float(model.similarity(emb_machine_summary, emb_human_summary))  # type: ignore
-                        for emb_human_summary in embs_human_summaries
-                    ]
-                    sim_score = torch.tensor(_sim_score)
-                else:
-                    sim_score = cosine_scores  # Default to cosine similarity
-
-                cosine_max_score = torch.max(cosine_scores).item()
-                dot_max_score = torch.max(dot_scores).item()
-                sim_max_score = torch.max(sim_score).item()
-
-                cosine_pred_scores.append(cosine_max_score)
-                dot_pred_scores.append(dot_max_score)
-                sim_scores.append(sim_max_score)
-                human_scores.append(human_eval_score)
+            # a machine summary without gold score is ignored
+            n_machine_summaries = min(
+                len(embs_machine_summaries), len(self.gold_scores[i])
+            )
+            embs_machine_summaries = embs_machine_summaries[:n_machine_summaries]
+            human_scores = list(self.gold_scores[i][:n_machine_summaries])
+
+            # the similarities between all machine and human summaries of the sample, of shape (machine summaries, human summaries)
+            cosine_scores = cos_sim(embs_machine_summaries, embs_human_summaries)
+            dot_scores = dot_score(embs_machine_summaries, embs_human_summaries)
+            if hasattr(model, "similarity_pairwise") or hasattr(model, "similarity"):
+                sim_score = torch.as_tensor(
+                    model.similarity(embs_machine_summaries, embs_human_summaries)  # type: ignore
+                ).to(torch.float32)
+            else:
+                sim_score = cosine_scores  # Default to cosine similarity
+
+            # the predicted quality score of a machine summary is its highest similarity to a human summary
+            cosine_pred_scores = torch.max(cosine_scores, dim=1).values.tolist()
+            dot_pred_scores = torch.max(dot_scores, dim=1).values.tolist()
+            sim_scores = torch.max(sim_score, dim=1).values.tolist()
 
             if (
                 (len(set(human_scores)) == 1)
@@ -0,0 +1,99 @@
+"""On-disk checkpoints of the corpus chunks encoded by `DenseRetrievalExactSearch`.
+
+Encoding a large corpus can take hours, so an interrupted search (e.g. a preempted or OOM-killed job) should not have to start over. When a
+checkpoint directory is given, each encoded chunk is written as a `.npy` shard next to the state of the search backend after that chunk. A
+restarted search with the same model, queries and corpus skips the finished chunks, loading their shards memory-mapped if needed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import torch
+
+logger = logging.getLogger(__name__)
+
+
+def checkpoint_fingerprint(*parts: Any) -> str:
+    """A stable hash identifying a search, used as the name of its checkpoint folder."""
+    sha = hashlib.sha256()
+    for part in parts:
+        sha.update(str(part).encode("utf-8"))
+        sha.update(b"\0")
+    return sha.hexdigest()[:16]
+
+
+class CorpusChunkCheckpoint:
+    """The checkpoint of a single search.
+
+    Args:
+        checkpoint_dir: The folder containing the checkpoints of all searches.
+        fingerprint: The fingerprint of the search, see `checkpoint_fingerprint`.
+
+    Attributes:
+        n_chunks: The number of finished chunks.
+        backend_state: The state of the search backend after the finished chunks, or None if the backend does not support restoring its state,
+            in which case the finished chunks have to be added again.
+    """
+
+    state_file = "state.pt"
+
+    def __init__(self, checkpoint_dir: str | Path, fingerprint: str):
+        self.path = Path(checkpoint_dir) / fingerprint
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.n_chunks = 0
+        self.backend_state: dict[str, Any] | None = None
+
+        state_path = self.path / self.state_file
+        if state_path.exists():
+            state = torch.load(state_path)
+            self.n_chunks = state["n_chunks"]
+            self.backend_state = state["backend_state"]
+            logger.info(
+                f"Resuming from checkpoint {self.path}, skipping {self.n_chunks} encoded corpus chunks."
+            )
+
+    def _chunk_path(self, chunk_idx: int) -> Path:
+        return self.path / f"chunk_{chunk_idx:05d}.npy"
+
+    def load_chunk(self, chunk_idx: int) -> torch.Tensor:
+        """Load the embeddings of a finished chunk, memory-mapped."""
+        # copy-on-write, such that the tensor is writable without reading the shard into memory
+        return torch.from_numpy(np.load(self._chunk_path(chunk_idx), mmap_mode="c"))
+
+    def save_chunk(
+        self,
+        chunk_idx: int,
+        embeddings: torch.Tensor | np.ndarray,
+        backend_state: dict[str, Any] | None,
+    ) -> None:
+        """Persist the embeddings of a chunk and the state of the backend after adding it.
+
+        The chunks have to be saved in order. The files are written atomically, so an interruption while saving leaves the previous checkpoint
+        intact.
+        """
+        if isinstance(embeddings, torch.Tensor):
+            embeddings = embeddings.detach().cpu().float().numpy()
+        chunk_path = self._chunk_path(chunk_idx)
+        with open(chunk_path.with_suffix(".tmp"), "wb") as f:
+            np.save(f, np.asarray(embeddings))
+        os.replace(chunk_path.with_suffix(".tmp"), chunk_path)
+
+        self.n_chunks = chunk_idx + 1
+        self.backend_state = backend_state
+        state_path = self.path / self.state_file
+        torch.save(
+            {"n_chunks": self.n_chunks, "backend_state": backend_state},
+            state_path.with_suffix(".tmp"),
+        )
+        os.replace(state_path.with_suffix(".tmp"), state_path)
+
+    def remove(self) -> None:
+        """Remove the checkpoint, once the search has finished."""
+        shutil.rmtree(self.path, ignore_errors=True)
@@ -0,0 +1,249 @@
+"""Vectorized computation of the retrieval metrics.
+
+Evaluating a run query by query, using `pytrec_eval` for the standard metrics and Python loops for the custom ones, converts and sorts every
+ranking several times. Instead the run and the relevance judgements are converted once into matrices of the relevance of the top ranked
+documents of each query, from which all metrics are computed at once using numpy.
+
+The standard metrics (NDCG, MAP, Recall and P) match `pytrec_eval`, including its tie breaking: documents with the same score are ranked by
+descending document id. The custom metrics (MRR, R_cap, Hole and Accuracy) keep the ranking of the original implementations in `utils`, which
+sort stably by score, i.e. ties keep the order of the run.
+"""
+
+from __future__ import annotations
+
+from itertools import chain, repeat
+
+import numpy as np
+
+
+def _padded(
+    rows: np.ndarray, counts: list[int], values: np.ndarray, fill: float
+) -> np.ndarray:
+    """Scatter the flattened values of a run into a matrix with one row per query, padded with `fill`."""
+    starts = np.cumsum([0, *counts[:-1]])
+    cols = np.arange(len(values)) - np.repeat(starts, counts).astype(np.int64)
+    matrix = np.full((len(counts), max(counts, default=0)), fill, dtype=values.dtype)
+    matrix[rows, cols] = values
+    return matrix
+
+
+def _confidence_scores(
+    rows: np.ndarray, counts: list[int], scores: np.ndarray
+) -> dict[str, np.ndarray]:
+    """The confidence scores of `utils.confidence_scores` for all queries at once. Queries without results get a confidence of 0."""
+    n_queries = len(counts)
+    counts_array = np.array(counts, dtype=np.int64)
+    safe_counts = np.maximum(counts_array, 1)
+    mean = np.bincount(rows, weights=scores, minlength=n_queries) / safe_counts
+    var = (
+        np.bincount(rows, weights=(scores - mean[rows]) ** 2, minlength=n_queries)
+        / safe_counts
+    )
+
+    padded = _padded(rows, counts, scores, -np.inf)
+    if padded.shape[1] > 1:
+        top2 = -np.partition(-padded, 1, axis=1)[:, :2]
+    else:
+        top2 = np.concatenate(
+            [padded, np.full((n_queries, 2 - padded.shape[1]), -np.inf)], axis=1
+        )
+    # the padding of queries with fewer than two results is masked before subtracting, as -inf - -inf is undefined
+    has_two = counts_array > 1
+    diff1 = np.zeros(n_queries)
+    diff1[has_two] = top2[has_two, 0] - top2[has_two, 1]
+    return {
+        "max": np.where(counts_array > 0, top2[:, 0], 0.0),
+        "std": np.sqrt(var),
+        "diff1": diff1,
+    }
+
+
+def confidence_scores(results: dict[str, dict[str, float]]) -> dict[str, np.ndarray]:
+    """Computes the confidence scores of `utils.confidence_scores` for all queries of a run at once.
+
+    Args:
+        results: The run, mapping query ids to the scores of the retrieved documents.
+
+    Returns:
+        The `max`, `std` and `diff1` confidence scores, each an array with one entry per query in the order of `results`.
+    """
+    counts = [len(doc_scores) for doc_scores in results.values()]
+    rows = np.repeat(np.arange(len(results)), counts)
+    scores = np.fromiter(
+        (score for doc_scores in results.values() for score in doc_scores.values()),
+        dtype=np.float64,
+        count=sum(counts),
+    )
+    return _confidence_scores(rows, counts, scores)
+
+
+class RankedRun:
+    """A run converted into matrices of the relevance of the top ranked documents of each query.
+
+    Only the queries of the run which have relevance judgements are evaluated, in the order of the run, as `pytrec_eval` does.
+
+    Args:
+        qrels: The relevance judgements, mapping query ids to the relevance of documents.
+        results: The run, mapping query ids to the scores of the retrieved documents.
+        k_values: The cutoffs the metrics are computed at.
+    """
+
+    def __init__(
+        self,
+        qrels: dict[str, dict[str, int]],
+        results: dict[str, dict[str, float]],
+        k_values: list[int],
+    ):
+        self.k_values = k_values
+        self.query_ids = [qid for qid in results if qid in qrels]
+        n_queries = len(self.query_ids)
+        depth = max(k_values)
+
+        counts = [len(results[qid]) for qid in self.query_ids]
+        n_entries = sum(counts)
+        rows = np.repeat(np.arange(n_queries), counts)
+        doc_ids = list(chain.from_iterable(results[qid] for qid in self.query_ids))
+        scores = np.fromiter(
+            chain.from_iterable(results[qid].values() for qid in self.query_ids),
+            dtype=np.float64,
+            count=n_entries,
+        )
+        relevance = np.fromiter(
+            chain.from_iterable(
+                map(qrels[qid].get, results[qid], repeat(0)) for qid in self.query_ids
+            ),
+            dtype=np.float64,
+            count=n_entries,
+        )
+        annotated_corpus = {doc_id for docs in qrels.values() for doc_id in docs}
+        annotated = np.fromiter(
+            map(annotated_corpus.__contains__, doc_ids), dtype=bool, count=n_entries
+        )
+
+        def top_ranked(order: np.ndarray, values: np.ndarray) -> np.ndarray:
+            ranked = np.take_along_axis(
+                _padded(rows, counts, values, 0), order[:, :depth], axis=1
+            )
+            return np.pad(ranked, ((0, 0), (0, depth - ranked.shape[1])))
+
+        # ties keep the order of the run, the padding is sorted last since it has the lowest score
+        padded_scores = _padded(rows, counts, scores, -np.inf)
+        stable_order = np.argsort(-padded_scores, axis=1, kind="stable")
+        self.relevant = top_ranked(stable_order, relevance > 0)
+        self.unannotated = top_ranked(stable_order, ~annotated)
+
+        # trec_eval ranks documents with the same score by descending document id. Mapping the document ids to their lexicographic rank is
+        # slow, so it is only done for the queries with ties among their top ranked documents.
+        trec_order = stable_order.copy()
+        ranked_scores = np.take_along_axis(
+            padded_scores, stable_order[:, : depth + 1], axis=1
+        )
+        is_result = np.arange(1, ranked_scores.shape[1]) < np.array(counts)[:, None]
+        tied_rows = np.flatnonzero(
+            ((ranked_scores[:, 1:] == ranked_scores[:, :-1]) & is_result).any(axis=1)
+        )
+        if len(tied_rows) > 0:
+            tied_query_ids = [self.query_ids[i] for i in tied_rows]
+            tied_counts = [counts[i] for i in tied_rows]
+            tied_doc_ids = list(
+                chain.from_iterable(results[qid] for qid in tied_query_ids)
+            )
+            vocabulary = {
+                doc_id: i for i, doc_id in enumerate(sorted(set(tied_doc_ids)))
+            }
+            doc_codes = np.fromiter(
+                map(vocabulary.__getitem__, tied_doc_ids),
+                dtype=np.int64,
+                count=len(tied_doc_ids),
+            )
+            tied_rows_of_entries = np.repeat(np.arange(len(tied_rows)), tied_counts)
+            by_doc_id = np.argsort(
+                -_padded(tied_rows_of_entries, tied_counts, doc_codes, -1), axis=1
+            )
+            tied_scores = np.take_along_axis(
+                padded_scores[tied_rows, : by_doc_id.shape[1]], by_doc_id, axis=1
+            )
+            trec_order[tied_rows, : by_doc_id.shape[1]] = np.take_along_axis(
+                by_doc_id, np.argsort(-tied_scores, axis=1, kind="stable"), axis=1
+            )
+        self.trec_gains = top_ranked(trec_order, np.maximum(relevance, 0))
+        self.trec_relevant = top_ranked(trec_order, relevance >= 1)
+
+        self.n_relevant = np.array(
+            [sum(rel >= 1 for rel in qrels[qid].values()) for qid in self.query_ids]
+        )
+        self.n_positive = np.array(
+            [sum(rel > 0 for rel in qrels[qid].values()) for qid in self.query_ids]
+        )
+        self.ideal_gains = np.zeros((n_queries, depth))
+        for i, qid in enumerate(self.query_ids):
+            gains = sorted(
+                (rel for rel in qrels[qid].values() if rel > 0), reverse=True
+            )
+            self.ideal_gains[i, : min(len(gains), depth)] = gains[:depth]
+
+        self._confidence = (rows, counts, scores)
+
+    @staticmethod
+    def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        return np.divide(
+            numerator,
+            denominator,
+            out=np.zeros_like(numerator, dtype=np.float64),
+            where=denominator > 0,
+        )
+
+    def trec_metrics(self) -> dict[str, np.ndarray]:
+        """The per query NDCG@k, MAP@k, Recall@k and P@k, as computed by the `ndcg_cut`, `map_cut`, `recall` and `P` measures of trec_eval."""
+        discounts = 1 / np.log2(np.arange(2, self.trec_gains.shape[1] + 2))
+        dcg = np.cumsum(self.trec_gains * discounts, axis=1)
+        ideal_dcg = np.cumsum(self.ideal_gains * discounts, axis=1)
+        hits = np.cumsum(self.trec_relevant, axis=1)
+        ranks = np.arange(1, self.trec_relevant.shape[1] + 1)
+        precision_at_hits = np.cumsum(self.trec_relevant * hits / ranks, axis=1)
+
+        metrics = {}
+        for k in self.k_values:
+            metrics[f"NDCG@{k}"] = self._safe_divide(dcg[:, k - 1], ideal_dcg[:, k - 1])
+            metrics[f"MAP@{k}"] = self._safe_divide(
+                precision_at_hits[:, k - 1], self.n_relevant
+            )
+            metrics[f"Recall@{k}"] = self._safe_divide(hits[:, k - 1], self.n_relevant)
+            metrics[f"P@{k}"] = hits[:, k - 1] / k
+        return metrics
+
+    def mrr(self) -> dict[str, np.ndarray]:
+        """The per query reciprocal rank of the first relevant document within the top k."""
+        first_hit = np.argmax(self.relevant, axis=1)
+        any_hit = self.relevant.any(axis=1)
+        return {
+            f"MRR@{k}": np.where(any_hit & (first_hit < k), 1 / (first_hit + 1), 0.0)
+            for k in self.k_values
+        }
+
+    def recall_cap(self) -> dict[str, np.ndarray]:
+        """The per query recall within the top k, capped at k relevant documents."""
+        hits = np.cumsum(self.relevant, axis=1)
+        return {
+            f"R_cap@{k}": self._safe_divide(
+                hits[:, k - 1], np.minimum(self.n_positive, k)
+            )
+            for k in self.k_values
+        }
+
+    def hole(self) -> dict[str, np.ndarray]:
+        """The per query fraction of the top k documents which are not judged for any query."""
+        holes = np.cumsum(self.unannotated, axis=1)
+        return {f"Hole@{k}": holes[:, k - 1] / k for k in self.k_values}
+
+    def top_k_accuracy(self) -> dict[str, np.ndarray]:
+        """Per query, whether any relevant document is retrieved within the top k."""
+        hits = np.cumsum(self.relevant, axis=1)
+        return {
+            f"Accuracy@{k}": (hits[:, k - 1] > 0).astype(np.float64)
+            for k in self.k_values
+        }
+
+    def confidence_scores(self) -> dict[str, np.ndarray]:
+        """The confidence scores of the evaluated queries, see `utils.confidence_scores`."""
+        return _confidence_scores(*self._confidence)
@@ -0,0 +1,420 @@
+"""Search backends used by `DenseRetrievalExactSearch` to retrieve the top-k documents of each query.
+
+A backend receives the corpus embeddings one chunk at a time, in the order of the corpus, and is then asked for the top-k of all queries. The
+exact backend streams over the chunks and only keeps the running top-k, while approximate backends build an index from the chunks, trading a
+measured amount of recall for speed on large corpora.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+import numpy as np
+import torch
+
+logger = logging.getLogger(__name__)
+
+SimilarityFn = Callable[[Any, Any], torch.Tensor]
+
+
+def merge_top_k(
+    previous_top_k: tuple[torch.Tensor, torch.Tensor] | None,
+    scores: torch.Tensor,
+    corpus_idx: torch.Tensor,
+    top_k: int,
+    tie_break_rank: torch.Tensor | None = None,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Merge the top-k candidates of a corpus chunk into the running top-k of each query.
+
+    Ties are broken in favour of the candidate with the lowest `tie_break_rank`, such that the result does not depend on the order in which
+    the chunks are merged.
+
+    Args:
+        previous_top_k: The running (scores, corpus positions) of shape (n_queries, <= top_k), or None for the first chunk.
+        scores: The scores of the candidates of the chunk, of shape (n_queries, n_candidates).
+        corpus_idx: The corpus positions of the candidates of the chunk.
+        top_k: The number of candidates to keep per query.
+        tie_break_rank: The rank of each corpus position among documents with equal scores. Defaults to the corpus position.
+
+    Returns:
+        The merged (scores, corpus positions), sorted by descending score.
+    """
+    if previous_top_k is not None:
+        scores = torch.cat([previous_top_k[0], scores], dim=1)
+        corpus_idx = torch.cat([previous_top_k[1], corpus_idx], dim=1)
+    # positions of -1 mark missing documents, which have a score of -inf
+    rank = (
+        corpus_idx
+        if tie_break_rank is None
+        else tie_break_rank[corpus_idx.clamp(min=0)]
+    )
+    order = torch.argsort(rank, dim=1, stable=True)
+    scores = torch.gather(scores, 1, order)
+    corpus_idx = torch.gather(corpus_idx, 1, order)
+    scores, order = torch.sort(scores, dim=1, descending=True, stable=True)
+    return scores[:, :top_k], torch.gather(corpus_idx, 1, order[:, :top_k])
+
+
+def top_k_candidates(
+    scores: torch.Tensor, k: int, rank: torch.Tensor
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """The k highest scores of each row and their columns, where ties are broken in favour of the column with the lowest `rank`.
+
+    `torch.topk` picks arbitrary columns among equal scores at the cutoff, so rows with such ties are sorted by (score, rank) instead.
+    """
+    values, idx = torch.topk(scores, k, dim=1)
+    if k == 0:
+        return values, idx
+    threshold = values[:, -1:]
+    has_dropped_ties = (scores == threshold).sum(dim=1) > (values == threshold).sum(
+        dim=1
+    )
+    if has_dropped_ties.any():
+        rows = has_dropped_ties.nonzero().squeeze(1)
+        column_order = torch.argsort(rank.to(scores.device), stable=True)
+        tied_values, order = torch.sort(
+            scores[rows][:, column_order], dim=1, descending=True, stable=True
+        )
+        values[rows] = tied_values[:, :k]
+        idx[rows] = column_order[order[:, :k]]
+    return values, idx
+
+
+def _similarity_without_nan(
+    similarity_fn: SimilarityFn, queries: Any, corpus: Any
+) -> torch.Tensor:
+    similarity_scores = similarity_fn(queries, corpus)
+    is_nan = torch.isnan(similarity_scores)
+    if is_nan.sum() > 0:
+        logger.warning(
+            f"Found {is_nan.sum()} NaN values in the similarity scores. Replacing NaN values with -1."
+        )
+    similarity_scores[is_nan] = -1
+    return similarity_scores
+
+
+class SearchBackend(ABC):
+    """Retrieves the top-k corpus positions of each query from the corpus embeddings added using `add`.
+
+    Args:
+        query_embeddings: The embeddings of the queries.
+        top_k: The number of documents to retrieve per query.
+        similarity_fn: The similarity function of the model, returning a (n_queries, n_documents) matrix.
+        query_chunk_size: The number of queries scored at once, which bounds the size of the similarity matrix.
+        tie_break_rank: The rank of each corpus position among documents with equal scores, the lowest rank is retrieved first. Defaults to
+            the corpus position.
+    """
+
+    is_exact: bool = True
+
+    def __init__(
+        self,
+        query_embeddings: torch.Tensor | np.ndarray,
+        top_k: int,
+        similarity_fn: SimilarityFn,
+        query_chunk_size: int = 1024,
+        tie_break_rank: torch.Tensor | None = None,
+        **kwargs: Any,
+    ):
+        self.query_embeddings = query_embeddings
+        self.top_k = top_k
+        self.similarity_fn = similarity_fn
+        self.query_chunk_size = query_chunk_size
+        self.tie_break_rank = tie_break_rank
+        self.n_documents = 0
+
+    @abstractmethod
+    def add(self, corpus_embeddings: torch.Tensor | np.ndarray) -> None:
+        """Add the next chunk of the corpus."""
+        ...
+
+    @abstractmethod
+    def search(self) -> tuple[torch.Tensor, torch.Tensor]:
+        """Retrieve the top-k of each query.
+
+        Returns:
+            The (scores, corpus positions) of shape (n_queries, <= top_k), sorted by descending score. Positions of -1 mark missing documents,
+            e.g. when an approximate backend finds fewer than top_k candidates.
+        """
+        ...
+
+    def exact_search(
+        self, query_idx: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Search the added documents exhaustively for the given queries. Required for approximate backends, to measure their recall."""
+        raise NotImplementedError
+
+    def state_dict(self) -> dict[str, Any] | None:
+        """The state of the search after the chunks added so far, used to resume an interrupted search. None if not supported."""
+        return None
+
+    def load_state_dict(self, state: dict[str, Any]) -> None:
+        """Restore the state returned by `state_dict`."""
+        raise NotImplementedError
+
+
+class ExactSearchBackend(SearchBackend):
+    """Brute-force search, scoring every chunk against blocks of queries and merging the top-k of the chunk into the running top-k."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.query_blocks = range(0, len(self.query_embeddings), self.query_chunk_size)
+        self.top_k_per_block: list[tuple[torch.Tensor, torch.Tensor] | None] = [
+            None for _ in self.query_blocks
+        ]
+
+    def add(self, corpus_embeddings: torch.Tensor | np.ndarray) -> None:
+        for block_num, query_start_idx in enumerate(self.query_blocks):
+            similarity_scores = _similarity_without_nan(
+                self.similarity_fn,
+                self.query_embeddings[
+                    query_start_idx : query_start_idx + self.query_chunk_size
+                ],
+                corpus_embeddings,
+            )
+            corpus_idx = torch.arange(
+                self.n_documents, self.n_documents + similarity_scores.shape[1]
+            )
+            top_k_values, top_k_idx = top_k_candidates(
+                similarity_scores,
+                min(self.top_k + 1, similarity_scores.shape[1]),
+                corpus_idx
+                if self.tie_break_rank is None
+                else self.tie_break_rank[corpus_idx],
+            )
+            self.top_k_per_block[block_num] = merge_top_k(
+                self.top_k_per_block[block_num],
+                top_k_values.cpu(),
+                top_k_idx.cpu() + self.n_documents,
+                self.top_k,
+                self.tie_break_rank,
+            )
+        self.n_documents += len(corpus_embeddings)
+
+    def state_dict(self) -> dict[str, Any] | None:
+        return {
+            "n_documents": self.n_documents,
+            "top_k_per_block": self.top_k_per_block,
+        }
+
+    def load_state_dict(self, state: dict[str, Any]) -> None:
+        self.n_documents = state["n_documents"]
+        self.top_k_per_block = state["top_k_per_block"]
+
+    def search(self) -> tuple[torch.Tensor, torch.Tensor]:
+        if self.n_documents == 0 or not self.top_k_per_block:
+            n_queries = len(self.query_embeddings)
+            return torch.empty((n_queries, 0)), torch.empty(
+                (n_queries, 0), dtype=torch.long
+            )
+        top_k_values, top_k_idx = zip(*self.top_k_per_block)  # type: ignore
+        return torch.cat(top_k_values), torch.cat(top_k_idx)
+
+
+class IVFSearchBackend(SearchBackend):
+    """Approximate search using an inverted file index.
+
+    The first chunk is clustered using k-means, after which every document is assigned to the list of its most similar centroid. A query is only
+    scored against the documents in the lists of its `n_probe` most similar centroids.
+
+    Args:
+        n_lists: The number of k-means clusters. Defaults to sqrt(n) for the n documents of the first chunk.
+        n_probe: The number of lists searched per query.
+        n_iter: The number of k-means iterations.
+        n_train_per_list: The number of documents per list used to train k-means.
+        seed: The seed used to initialize the centroids.
+        *args: See `SearchBackend`.
+        **kwargs: See `SearchBackend`.
+    """
+
+    is_exact = False
+
+    def __init__(
+        self,
+        *args: Any,
+        n_lists: int | None = None,
+        n_probe: int = 16,
+        n_iter: int = 10,
+        n_train_per_list: int = 64,
+        seed: int = 42,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.n_iter = n_iter
+        self.n_train_per_list = n_train_per_list
+        self.seed = seed
+        self.centroids: torch.Tensor | None = None
+        self.embeddings: list[torch.Tensor] = []
+        self.assignments: list[torch.Tensor] = []
+
+    def _assign(self, embeddings: torch.Tensor) -> torch.Tensor:
+        assert self.centroids is not None
+        return torch.cat(
+            [
+                _similarity_without_nan(
+                    self.similarity_fn,
+                    embeddings[start : start + self.query_chunk_size],
+                    self.centroids,
+                )
+                .argmax(dim=1)
+                .cpu()
+                for start in range(0, len(embeddings), self.query_chunk_size)
+            ]
+        )
+
+    def _train(self, embeddings: torch.Tensor) -> None:
+        n_lists = self.n_lists or max(1, int(math.sqrt(len(embeddings))))
+        n_lists = min(n_lists, len(embeddings))
+        generator = torch.Generator().manual_seed(self.seed)
+        sample = torch.randperm(len(embeddings), generator=generator)
+        # k-means only needs a sample of the documents of each list to find the centroids
+        embeddings = embeddings[sample[: n_lists * self.n_train_per_list]]
+        self.centroids = embeddings[:n_lists].clone()
+        for _ in range(self.n_iter):
+            assignments = self._assign(embeddings)
+            sums = torch.zeros_like(self.centroids).index_add_(
+                0, assignments, embeddings
+            )
+            counts = torch.bincount(assignments, minlength=n_lists)
+            non_empty = counts > 0
+            self.centroids[non_empty] = sums[non_empty] / counts[non_empty, None].to(
+                sums.dtype
+            )
+
+    def add(self, corpus_embeddings: torch.Tensor | np.ndarray) -> None:
+        embeddings = torch.as_tensor(corpus_embeddings).detach().cpu().float()
+        if self.centroids is None:
+            self._train(embeddings)
+        self.embeddings.append(embeddings)
+        self.assignments.append(self._assign(embeddings))
+        self.n_documents += len(embeddings)
+
+    def search(self) -> tuple[torch.Tensor, torch.Tensor]:
+        query_embeddings = torch.as_tensor(self.query_embeddings).detach().cpu().float()
+        n_queries = len(query_embeddings)
+        top_k = min(self.top_k, self.n_documents)
+        top_k_values = torch.full((n_queries, top_k), -math.inf)
+        top_k_idx = torch.full((n_queries, top_k), -1, dtype=torch.long)
+        if self.centroids is None or top_k == 0:
+            return top_k_values, top_k_idx
+
+        embeddings = torch.cat(self.embeddings)
+        assignments = torch.cat(self.assignments)
+        n_lists = len(self.centroids)
+        documents_by_list = torch.argsort(assignments, stable=True)
+        document_offsets = torch.cumsum(
+            torch.bincount(assignments, minlength=n_lists), dim=0
+        ).tolist()
+
+        # invert the probed lists of each query, such that each list is scored once against all queries probing it
+        probes = torch.cat(
+            [
+                torch.topk(
+                    _similarity_without_nan(
+                        self.similarity_fn,
+                        query_embeddings[start : start + self.query_chunk_size],
+                        self.centroids,
+                    ).cpu(),
+                    min(self.n_probe, n_lists),
+                    dim=1,
+                ).indices
+                for start in range(0, n_queries, self.query_chunk_size)
+            ]
+        )
+        probed_lists = probes.flatten()
+        queries_by_list = torch.argsort(probed_lists, stable=True) // probes.shape[1]
+        query_offsets = torch.cumsum(
+            torch.bincount(probed_lists, minlength=n_lists), dim=0
+        ).tolist()
+
+        for list_idx in range(n_lists):
+            documents = documents_by_list[
+                (document_offsets[list_idx - 1] if list_idx else 0) : document_offsets[
+                    list_idx
+                ]
+            ]
+            list_queries = queries_by_list[
+                (query_offsets[list_idx - 1] if list_idx else 0) : query_offsets[
+                    list_idx
+                ]
+            ]
+            if len(documents) == 0 or len(list_queries) == 0:
+                continue
+            for start in range(0, len(list_queries), self.query_chunk_size):
+                rows = list_queries[start : start + self.query_chunk_size]
+                similarity_scores = _similarity_without_nan(
+                    self.similarity_fn, query_embeddings[rows], embeddings[documents]
+                ).cpu()
+                values, idx = top_k_candidates(
+                    similarity_scores,
+                    min(top_k, len(documents)),
+                    documents
+                    if self.tie_break_rank is None
+                    else self.tie_break_rank[documents],
+                )
+                top_k_values[rows], top_k_idx[rows] = merge_top_k(
+                    (top_k_values[rows], top_k_idx[rows]),
+                    values,
+                    documents[idx],
+                    top_k,
+                    self.tie_break_rank,
+                )
+        return top_k_values, top_k_idx
+
+    def exact_search(
+        self, query_idx: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        exact = ExactSearchBackend(
+            torch.as_tensor(self.query_embeddings).detach().cpu().float()[query_idx],
+            self.top_k,
+            self.similarity_fn,
+            query_chunk_size=self.query_chunk_size,
+            tie_break_rank=self.tie_break_rank,
+        )
+        for embeddings in self.embeddings:
+            exact.add(embeddings)
+        return exact.search()
+
+
+SEARCH_BACKENDS: dict[str, type[SearchBackend]] = {
+    "exact": ExactSearchBackend,
+    "ivf": IVFSearchBackend,
+}
+
+
+def get_search_backend(
+    search_backend: str | type[SearchBackend],
+) -> type[SearchBackend]:
+    """Get a search backend by its name in `SEARCH_BACKENDS`, or return the given `SearchBackend` subclass."""
+    if isinstance(search_backend, str):
+        if search_backend not in SEARCH_BACKENDS:
+            raise ValueError(
+                f"Unknown search backend {search_backend!r}. Available backends: {list(SEARCH_BACKENDS)}"
+            )
+        return SEARCH_BACKENDS[search_backend]
+    return search_backend
+
+
+def recall_against_exact(
+    approximate_idx: torch.Tensor, exact_idx: torch.Tensor, k_values: list[int]
+) -> dict[int, float]:
+    """The fraction of the exact top-k documents found by an approximate search, averaged over the queries.
+
+    Args:
+        approximate_idx: The corpus positions retrieved by the approximate search, of shape (n_queries, top_k), sorted by descending score.
+        exact_idx: The corpus positions retrieved by exact search, in the same layout.
+        k_values: The values of k to compute the recall for.
+    """
+    recall = {}
+    for k in k_values:
+        exact_k = exact_idx[:, :k]
+        found = (approximate_idx[:, :k, None] == exact_k[:, None, :]).any(dim=1)
+        found &= exact_k >= 0
+        n_relevant = (exact_k >= 0).sum(dim=1).clamp(min=1)
+        recall[k] = (found.sum(dim=1) / n_relevant).mean().item()
+    return recall
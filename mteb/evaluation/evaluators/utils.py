@@ -1,6 +1,12 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing as mp
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from time import time
+from typing import TYPE_CHECKING, Any, Callable
 
 import numpy as np
 import pandas as pd
@@ -10,6 +16,11 @@ import tqdm
 from packaging.version import Version
 from sklearn.metrics import auc
 
+if TYPE_CHECKING:
+    from mteb.encoder_interface import Encoder
+
+logger = logging.getLogger(__name__)
+
 
 def cos_sim(a, b):
     """Computes the cosine similarity cos_sim(a[i], b[j]) for all i and j.
@@ -426,3 +437,96 @@ def nAUC(
         abst_nauc = (abst_auc - flat_auc) / (or_auc - flat_auc)
 
     return abst_nauc
+
+
+def _text_length(text: Any) -> int | None:
+    if isinstance(text, str):
+        return len(text)
+    if isinstance(text, dict) and "text" in text:
+        return len(text.get("title", "")) + len(text["text"])
+    return None
+
+
+def length_sorted_order(texts: Sequence[Any]) -> list[int] | None:
+    """The positions of the texts sorted by length, longest first. None if some of the inputs are not texts, e.g. images or conversations.
+
+    Sorting is stable, so texts of equal length keep their relative order.
+    """
+    lengths = [_text_length(text) for text in texts]
+    if any(length is None for length in lengths):
+        return None
+    return sorted(range(len(texts)), key=lambda i: lengths[i], reverse=True)  # type: ignore
+
+
+def encode_sorted_by_length(
+    model: Encoder, sentences: Sequence[Any], **kwargs: Any
+) -> np.ndarray | torch.Tensor:
+    """Encode the sentences sorted by length, such that each batch contains sentences of similar length and little padding, and return the
+    embeddings in the original order of the sentences.
+
+    Args:
+        model: The model to encode the sentences with.
+        sentences: The sentences to encode.
+        **kwargs: Passed on to `model.encode`, e.g. the task_name and the encode_kwargs.
+    """
+    order = length_sorted_order(sentences)
+    start_time = time()
+    if order is None:
+        embeddings = model.encode(sentences, **kwargs)
+    else:
+        embeddings = model.encode([sentences[i] for i in order], **kwargs)
+        if isinstance(embeddings, list):
+            embeddings = np.asarray(embeddings)
+        inverse = np.empty(len(order), dtype=np.int64)
+        inverse[order] = np.arange(len(order))
+        embeddings = embeddings[inverse]
+    elapsed = time() - start_time
+    if elapsed > 0:
+        logger.info(
+            f"Encoded {len(sentences)} texts for {kwargs.get('task_name')} in {elapsed:.2f}s "
+            + f"({len(sentences) / elapsed:.1f} texts/s)"
+        )
+    return embeddings
+
+
+def _limit_threads(n_threads: int) -> None:
+    from threadpoolctl import threadpool_limits
+
+    threadpool_limits(limits=n_threads)
+    torch.set_num_threads(n_threads)
+
+
+def map_in_processes(
+    fn: Callable[..., Any],
+    arguments: Sequence[tuple[Any, ...]],
+    n_jobs: int | None = None,
+    desc: str | None = None,
+) -> list[Any]:
+    """Call `fn` with each tuple of arguments in a pool of processes, and return the results in the order of the arguments.
+
+    The processes are started using spawn and share the CPUs, i.e. each limits its numpy, sklearn and torch threads to the number of CPUs
+    divided by the number of processes. With a single job, or a single set of arguments, `fn` is called in the current process instead. `fn`
+    has to be defined at the top level of a module, and should not depend on global state such as the global random seed.
+
+    Args:
+        fn: The function to call.
+        arguments: The positional arguments of each call.
+        n_jobs: The number of processes. Defaults to the number of CPUs.
+        desc: The description of the progress bar.
+    """
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(arguments))
+    if n_jobs <= 1:
+        return [fn(*args) for args in tqdm.tqdm(arguments, desc=desc)]
+
+    logger.info(f"Starting {n_jobs} processes for {desc or fn.__name__}.")
+    with ProcessPoolExecutor(
+        n_jobs,
+        mp_context=mp.get_context("spawn"),
+        initializer=_limit_threads,
+        initargs=(max(1, (os.cpu_count() or 1) // n_jobs),),
+    ) as pool:
+        futures = [pool.submit(fn, *args) for args in arguments]
+        return [
+            future.result()
+            for future in tqdm.tqdm(futures, desc=desc, total=len(futures))
+        ]
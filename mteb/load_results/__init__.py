@@ -2,6 +2,13 @@ from __future__ import annotations
 
 from .benchmark_results import BenchmarkResults, ModelResult
 from .load_results import load_results
+from .results_cache import ResultsCache
 from .task_results import TaskResult
 
-__all__ = ["load_results", "TaskResult", "ModelResult", "BenchmarkResults"]
+__all__ = [
+    "load_results",
+    "TaskResult",
+    "ModelResult",
+    "BenchmarkResults",
+    "ResultsCache",
+]
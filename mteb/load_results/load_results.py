@@ -9,8 +9,10 @@ from pathlib import Path
 
 from mteb.abstasks.AbsTask import AbsTask
 from mteb.load_results.benchmark_results import BenchmarkResults, ModelResult
+from mteb.load_results.results_cache import ResultsCache
 from mteb.load_results.task_results import TaskResult
 from mteb.model_meta import ModelMeta
+from mteb.overview import get_task
 
 logger = logging.getLogger(__name__)
 MODEL_NAME = str
@@ -91,6 +93,8 @@ def load_results(
     validate_and_filter: bool = True,
     require_model_meta: bool = True,
     only_main_score: bool = False,
+    use_cache: bool = True,
+    n_jobs: int | None = None,
 ) -> BenchmarkResults:
     """Loads the results from the latest version of the results repository. The results are cached locally in the MTEB_CACHE directory.
     This directory can be set using the MTEB_CACHE environment variable or defaults to "~/.cache/mteb".
@@ -105,11 +109,20 @@ def load_results(
         validate_and_filter: If True it will validate that the results object for the task contains the correct splits and filter out
             splits from the results object that are not default in the task metadata. Defaults to True.
         only_main_score: If True, only the main score will be loaded.
+        use_cache: If True the parsed results are read from an index next to the results repository, see `ResultsCache`, which is
+            updated with the results files that were added or changed since it was last updated. Otherwise all results files are parsed.
+            Defaults to True.
+        n_jobs: The number of processes used to parse the results files when updating the index. Defaults to the number of CPUs.
     """
     # TODO: we want to allow results_repo (the first argument) to be a local path
     # TODO: in v2 we can rename it to "path" to align with load_dataset
     repo_directory = download_of_results(results_repo, download_latest=download_latest)
     model_paths = [p for p in (repo_directory / "results").glob("*") if p.is_dir()]
+    results_cache = (
+        ResultsCache(repo_directory / "results").update(n_jobs=n_jobs)
+        if use_cache
+        else None
+    )
 
     if models is not None:
         models_to_keep = {}
@@ -129,6 +142,9 @@ def load_results(
             else:
                 task_names[task] = None
 
+    # the tasks are only fetched once per task name to validate the results
+    tasks_to_validate = dict(task_names)
+
     model_results = []
     for model_path in model_paths:
         model_revisions = model_path.glob("*")
@@ -148,15 +164,19 @@ def load_results(
                 if models_to_keep[model_name] != revision:
                     continue
 
-            task_json_files = [
-                f for f in revision_path.glob("*.json") if "model_meta.json" != f.name
-            ]
-            _results = []
-            for f in task_json_files:
-                task_res = TaskResult.from_disk(f)
-                if only_main_score:
-                    task_res = task_res.only_main_score()
-                _results.append(task_res)
+            if results_cache is not None:
+                _results = results_cache.load_task_results(
+                    revision_path, task_names=task_names if tasks is not None else None
+                )
+            else:
+                task_json_files = [
+                    f
+                    for f in revision_path.glob("*.json")
+                    if "model_meta.json" != f.name
+                ]
+                _results = [TaskResult.from_disk(f) for f in task_json_files]
+            if only_main_score:
+                _results = [r.only_main_score() for r in _results]
 
             # filter out tasks that are not in the tasks list
             if tasks is not None:
@@ -166,10 +186,11 @@ def load_results(
                 filtered_results = []
                 for r in _results:
                     try:
-                        if task_names:
-                            task = task_names[r.task_name]
-                        else:
-                            task = None
+                        task = tasks_to_validate.get(r.task_name)
+                        if task is None:
+                            task = tasks_to_validate[r.task_name] = get_task(
+                                r.task_name
+                            )
                         r = r.validate_and_filter_scores(task=task)
                         filtered_results.append(r)
                     except Exception as e:
@@ -0,0 +1,254 @@
+"""A columnar index of the task results of a results repository.
+
+Loading the results repository parses thousands of JSON files, each validated by pydantic and possibly converted from a historic format. The
+index stores the parsed results in parquet files next to the repository, such that they only have to be parsed again when a file is added or
+changed, which is detected from its modification time and size. Files which have to be parsed are parsed in parallel processes when there
+are many of them, e.g. when the index is first built.
+
+The index consists of two tables:
+
+- `task_results.parquet`: one row per task file, with its path relative to the results directory, its modification time and size, the name
+    of the task and the parsed `TaskResult` as JSON.
+- `scores.parquet`: one row per numeric score, with the columns `path`, `task_name`, `split`, `hf_subset`, `metric` and `value`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import polars as pl
+
+from mteb.evaluation.evaluators.utils import map_in_processes
+from mteb.load_results.task_results import TaskResult
+
+logger = logging.getLogger(__name__)
+
+TASK_RESULTS_FILE = "task_results.parquet"
+SCORES_FILE = "scores.parquet"
+# spawning the processes takes a few seconds, which only pays off for many files
+MIN_FILES_PER_PROCESS_POOL = 2_000
+FILES_PER_CHUNK = 250
+
+TASK_RESULTS_SCHEMA = {
+    "path": pl.String,
+    "mtime_ns": pl.Int64,
+    "size": pl.Int64,
+    "task_name": pl.String,
+    "task_result": pl.String,
+}
+SCORES_SCHEMA = {
+    "path": pl.String,
+    "task_name": pl.String,
+    "split": pl.String,
+    "hf_subset": pl.String,
+    "metric": pl.String,
+    "value": pl.Float64,
+}
+
+
+def _task_files(results_directory: Path) -> dict[str, tuple[int, int]]:
+    """The modification time and size of the task files of each model revision in the results directory, keyed by their relative path."""
+    files = {}
+    for model_entry in os.scandir(results_directory):
+        if not model_entry.is_dir():
+            continue
+        for revision_entry in os.scandir(model_entry.path):
+            if not revision_entry.is_dir():
+                continue
+            for entry in os.scandir(revision_entry.path):
+                if not entry.name.endswith(".json") or entry.name == "model_meta.json":
+                    continue
+                stat = entry.stat()
+                path = f"{model_entry.name}/{revision_entry.name}/{entry.name}"
+                files[path] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def _score_rows(path: str, task_result: TaskResult) -> list[tuple]:
+    rows = []
+    for split, split_scores in task_result.scores.items():
+        for scores in split_scores:
+            hf_subset = scores.get("hf_subset", "default")
+            for metric, value in scores.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    rows.append(
+                        (
+                            path,
+                            task_result.task_name,
+                            split,
+                            hf_subset,
+                            metric,
+                            float(value),
+                        )
+                    )
+    return rows
+
+
+def _parse_task_files(
+    results_directory: Path, paths: Sequence[str]
+) -> tuple[list[tuple], list[tuple]]:
+    """Parse the task files with `TaskResult.from_disk`, and return the rows of the task results and the scores tables."""
+    task_result_rows, score_rows = [], []
+    for path in paths:
+        file_path = results_directory / path
+        stat = file_path.stat()
+        task_result = TaskResult.from_disk(file_path)
+        task_result_rows.append(
+            (
+                path,
+                stat.st_mtime_ns,
+                stat.st_size,
+                task_result.task_name,
+                json.dumps(task_result.to_dict()),
+            )
+        )
+        score_rows.extend(_score_rows(path, task_result))
+    return task_result_rows, score_rows
+
+
+class ResultsCache:
+    """The index of the task results in a results directory, i.e. the `results` folder of the results repository.
+
+    Args:
+        results_directory: The directory with one folder per model, containing one folder per revision with the task files.
+        index_directory: The directory of the index. Defaults to a folder next to the results repository, named after it with "_index"
+            appended.
+    """
+
+    def __init__(
+        self, results_directory: Path | str, index_directory: Path | str | None = None
+    ):
+        self.results_directory = Path(results_directory)
+        if index_directory is None:
+            repo_directory = self.results_directory.parent
+            index_directory = repo_directory.parent / f"{repo_directory.name}_index"
+        self.index_directory = Path(index_directory)
+        self._task_results: pl.DataFrame | None = None
+        self._scores: pl.DataFrame | None = None
+        self._by_revision: dict[str, list[tuple[str, str]]] | None = None
+
+    def _read(self) -> tuple[pl.DataFrame, pl.DataFrame]:
+        task_results_path = self.index_directory / TASK_RESULTS_FILE
+        scores_path = self.index_directory / SCORES_FILE
+        if task_results_path.exists() and scores_path.exists():
+            try:
+                return pl.read_parquet(task_results_path), pl.read_parquet(scores_path)
+            except Exception as e:
+                logger.warning(
+                    f"Could not read the results index in {self.index_directory}, rebuilding it. Error: {e}"
+                )
+        return pl.DataFrame(schema=TASK_RESULTS_SCHEMA), pl.DataFrame(
+            schema=SCORES_SCHEMA
+        )
+
+    def _write(self, task_results: pl.DataFrame, scores: pl.DataFrame) -> None:
+        self.index_directory.mkdir(parents=True, exist_ok=True)
+        for table, name in [(task_results, TASK_RESULTS_FILE), (scores, SCORES_FILE)]:
+            tmp_path = self.index_directory / f"{name}.tmp{os.getpid()}"
+            table.write_parquet(tmp_path)
+            # replaced atomically, such that a concurrent reader never sees a partially written file
+            os.replace(tmp_path, self.index_directory / name)
+
+    def update(self, n_jobs: int | None = None) -> ResultsCache:
+        """Bring the index up to date with the results directory: parse the task files which were added or changed since the index was
+        last updated, and drop the ones which were removed.
+
+        Args:
+            n_jobs: The number of processes to parse the task files in. Defaults to the number of CPUs, but a single process is used if only
+                a few files have to be parsed.
+        """
+        task_results, scores = self._read()
+        files = _task_files(self.results_directory)
+        indexed = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in task_results.select(
+                "path", "mtime_ns", "size"
+            ).iter_rows()
+        }
+        stale = [path for path in indexed if files.get(path) != indexed[path]]
+        to_parse = sorted(path for path in files if indexed.get(path) != files[path])
+
+        if stale or to_parse:
+            logger.info(
+                f"Updating the results index in {self.index_directory}: parsing {len(to_parse)} files, dropping {len(stale)} outdated entries."
+            )
+            if len(to_parse) < MIN_FILES_PER_PROCESS_POOL:
+                n_jobs = 1
+            chunks = [
+                (self.results_directory, to_parse[i : i + FILES_PER_CHUNK])
+                for i in range(0, len(to_parse), FILES_PER_CHUNK)
+            ]
+            parsed = map_in_processes(
+                _parse_task_files, chunks, n_jobs, desc="Parsing results"
+            )
+            new_task_results = pl.DataFrame(
+                [row for rows, _ in parsed for row in rows],
+                schema=TASK_RESULTS_SCHEMA,
+                orient="row",
+            )
+            new_scores = pl.DataFrame(
+                [row for _, rows in parsed for row in rows],
+                schema=SCORES_SCHEMA,
+                orient="row",
+            )
+            task_results = pl.concat(
+                [
+                    task_results.filter(~pl.col("path").is_in(stale)),
+                    new_task_results,
+                ]
+            )
+            scores = pl.concat(
+                [scores.filter(~pl.col("path").is_in(stale)), new_scores]
+            )
+            self._write(task_results, scores)
+
+        self._task_results, self._scores = task_results, scores
+        self._by_revision = None
+        return self
+
+    @property
+    def task_results(self) -> pl.DataFrame:
+        """The table of the task results, with one row per task file."""
+        if self._task_results is None:
+            self.update()
+        return self._task_results  # type: ignore
+
+    @property
+    def scores(self) -> pl.DataFrame:
+        """The table of the scores, with one row per split, subset and numeric metric of each task file."""
+        if self._scores is None:
+            self.update()
+        return self._scores  # type: ignore
+
+    def load_task_results(
+        self, revision_path: Path, task_names: Iterable[str] | None = None
+    ) -> list[TaskResult]:
+        """The task results of a model revision, optionally only those of the given tasks.
+
+        Args:
+            revision_path: The folder of the model revision in the results directory.
+            task_names: The names of the tasks to load. If None, all tasks are loaded.
+        """
+        if self._by_revision is None:
+            self._by_revision = defaultdict(list)
+            for path, task_name, task_result in (
+                self.task_results.sort("path")
+                .select("path", "task_name", "task_result")
+                .iter_rows()
+            ):
+                self._by_revision[path.rsplit("/", 1)[0]].append(
+                    (task_name, task_result)
+                )
+
+        revision = revision_path.relative_to(self.results_directory).as_posix()
+        task_names = set(task_names) if task_names is not None else None
+        return [
+            TaskResult.from_validated(**json.loads(task_result))
+            for task_name, task_result in self._by_revision.get(revision, [])
+            if task_names is None or task_name in task_names
+        ]
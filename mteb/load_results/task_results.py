@@ -331,7 +331,7 @@ class TaskResult(BaseModel):
         from mteb.overview import TASKS_REGISTRY
 
         # in case the task name is not found in the registry, try to find a lower case version
-        lower_case_registry = {k.lower(): v for k, v in TASKS_REGISTRY.items()}
+        lower_case_registry = {k.lower(): k for k in TASKS_REGISTRY}
 
         scores = {**data}
 
@@ -367,7 +367,10 @@ class TaskResult(BaseModel):
         else:
             if task_name in renamed_tasks:
                 task_name = renamed_tasks[task_name]
-            task = TASKS_REGISTRY.get(task_name, lower_case_registry[task_name.lower()])
+            registry_name = lower_case_registry[task_name.lower()]
+            task = TASKS_REGISTRY[
+                task_name if task_name in TASKS_REGISTRY else registry_name
+            ]
 
         # make sure that main score exists
         main_score = task.metadata.main_score
@@ -0,0 +1,354 @@
+"""A shared engine for the requests of API embedding models.
+
+Sending one batch after the other makes the evaluation of an API model bound by the round-trip latency of the requests. The engine instead keeps
+several requests in flight, while staying within the rate limits of the provider: requests and tokens are drawn from token buckets, which are
+synchronized with the rate limit headers of the responses, and failed requests are retried with exponential backoff and jitter, honouring
+`Retry-After` when the provider sends it.
+
+The engine is independent of the client library of a provider. A wrapper hands it one coroutine function per batch, which sends the request and
+returns the result along with the response headers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from collections.abc import Awaitable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import tqdm
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+
+@dataclass
+class APIResponse:
+    """The result of a request, along with the headers of the response, which are used to track the rate limits."""
+
+    result: Any
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+
+def pack_batches(
+    token_counts: Sequence[int], max_batch_size: int, max_batch_tokens: int | None
+) -> list[range]:
+    """Split the inputs into consecutive batches with at most `max_batch_size` inputs and at most `max_batch_tokens` tokens.
+
+    An input with more than `max_batch_tokens` tokens is sent in a batch of its own.
+    """
+    batches = []
+    start, batch_tokens = 0, 0
+    for i, n_tokens in enumerate(token_counts):
+        batch_full = i - start >= max_batch_size or (
+            max_batch_tokens is not None and batch_tokens + n_tokens > max_batch_tokens
+        )
+        if i > start and batch_full:
+            batches.append(range(start, i))
+            start, batch_tokens = i, 0
+        batch_tokens += n_tokens
+    if start < len(token_counts):
+        batches.append(range(start, len(token_counts)))
+    return batches
+
+
+def parse_duration(value: str) -> float | None:
+    """Parse a duration like `1s`, `6m0s`, `20ms` or `0.5`, as used by the rate limit headers, to seconds."""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|s|m|h)", value)
+    if not parts:
+        return None
+    return sum(float(amount) * units[unit] for amount, unit in parts)
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> dict[str, float]:
+    """Parse the rate limit headers of a response, in the `x-ratelimit-*` format used by e.g. OpenAI, and `Retry-After`.
+
+    Returns:
+        The values found among `requests_limit`, `requests_remaining`, `requests_reset`, `tokens_limit`, `tokens_remaining`, `tokens_reset` and
+        `retry_after`, where the resets and `retry_after` are in seconds.
+    """
+    parsed = {}
+    for resource in ["requests", "tokens"]:
+        for kind in ["limit", "remaining", "reset"]:
+            value = _header(headers, f"x-ratelimit-{kind}-{resource}")
+            if value is None:
+                continue
+            number = parse_duration(value) if kind == "reset" else float(value)
+            if number is not None:
+                parsed[f"{resource}_{kind}"] = number
+    for name in ["retry-after-ms", "retry-after"]:
+        value = _header(headers, name)
+        seconds = parse_duration(value) if value is not None else None
+        if seconds is not None:
+            parsed["retry_after"] = (
+                seconds / 1000 if name == "retry-after-ms" else seconds
+            )
+            break
+    return parsed
+
+
+class TokenBucket:
+    """A token bucket refilling continuously at `capacity` per `interval` seconds.
+
+    Args:
+        capacity: The size of the bucket, e.g. the number of requests per minute.
+        interval: The time in seconds in which an empty bucket is refilled.
+    """
+
+    def __init__(self, capacity: float, interval: float = 60.0):
+        self.capacity = capacity
+        self.interval = interval
+        self.available = capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(
+            self.capacity,
+            self.available + (now - self._updated_at) * self.capacity / self.interval,
+        )
+        self._updated_at = now
+
+    async def acquire(self, amount: float) -> None:
+        """Wait until `amount` is available and take it. Amounts larger than the bucket only wait for a full bucket."""
+        amount = min(amount, self.capacity)
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+            self._refill()
+            if self.available >= amount:
+                self.available -= amount
+                return
+            await asyncio.sleep(
+                (amount - self.available) * self.interval / self.capacity
+            )
+
+    def update(
+        self,
+        limit: float | None = None,
+        remaining: float | None = None,
+        reset: float | None = None,
+    ) -> None:
+        """Synchronize the bucket with the limit, the remaining budget and the time until it is reset, as reported by the provider."""
+        self._refill()
+        if limit is not None and limit > 0:
+            self.capacity = limit
+            self.available = min(self.available, limit)
+        if remaining is not None:
+            self.available = min(self.available, remaining)
+            if remaining <= 0 and reset is not None:
+                self.pause(reset)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for `seconds`, e.g. after the provider asked to retry later."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def _status_code(error: Exception) -> int | None:
+    for obj in [error, getattr(error, "response", None)]:
+        for name in ["status_code", "http_status", "status", "code"]:
+            status = getattr(obj, name, None)
+            if isinstance(status, int):
+                return status
+    return None
+
+
+def _error_headers(error: Exception) -> Mapping[str, str]:
+    for obj in [getattr(error, "response", None), error]:
+        headers = getattr(obj, "headers", None)
+        if headers is not None and hasattr(headers, "items"):
+            return headers
+    return {}
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a failed request should be retried: rate limits, timeouts, server and connection errors."""
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES or status >= 500
+    if isinstance(error, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+        return True
+    # the client libraries have their own exception types for these, e.g. `openai.APIConnectionError` or `httpx.ConnectTimeout`
+    return any(
+        "Connection" in cls.__name__ or "Timeout" in cls.__name__
+        for cls in type(error).__mro__
+    )
+
+
+class APIRequestEngine:
+    """Sends the requests of an API model concurrently, within the rate limits of the provider.
+
+    The requests run on an event loop in a background thread owned by the engine, such that the clients of the providers, which are bound to
+    the event loop they are first used in, can be reused across calls and the engine works from within a running event loop, e.g. in a notebook.
+
+    Args:
+        max_concurrent_requests: The maximum number of requests in flight.
+        max_requests_per_minute: The request rate limit. If None, it is only limited once the provider reports its limit in the headers.
+        max_tokens_per_minute: The token rate limit. If None, it is only limited once the provider reports its limit in the headers.
+        max_retries: The number of times a failed request is retried before giving up.
+        base_delay: The backoff before the first retry in seconds, doubled with each retry.
+        max_delay: The maximum backoff in seconds.
+        seed: The seed of the jitter of the backoff.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_requests: int = 8,
+        max_requests_per_minute: int | None = None,
+        max_tokens_per_minute: int | None = None,
+        max_retries: int = 6,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        seed: int | None = None,
+    ):
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._rng = random.Random(seed)
+        self.request_bucket = (
+            TokenBucket(max_requests_per_minute) if max_requests_per_minute else None
+        )
+        self.token_bucket = (
+            TokenBucket(max_tokens_per_minute) if max_tokens_per_minute else None
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever, name="api-requests", daemon=True
+            )
+            self._thread.start()
+        return self._loop
+
+    def run(
+        self,
+        requests: Sequence[Callable[[], Awaitable[APIResponse]]],
+        n_tokens: Sequence[int] | None = None,
+        show_progress_bar: bool = False,
+    ) -> list[Any]:
+        """Send the requests and return their results in order.
+
+        Args:
+            requests: One coroutine function per request, which sends it and returns the result and the response headers. It is called again
+                for each retry.
+            n_tokens: The number of tokens of each request, used for the token rate limit.
+            show_progress_bar: Show a progress bar of the finished requests.
+        """
+        if n_tokens is None:
+            n_tokens = [0] * len(requests)
+        future = asyncio.run_coroutine_threadsafe(
+            self._run(requests, n_tokens, show_progress_bar), self._get_loop()
+        )
+        return future.result()
+
+    async def _run(
+        self,
+        requests: Sequence[Callable[[], Awaitable[APIResponse]]],
+        n_tokens: Sequence[int],
+        show_progress_bar: bool,
+    ) -> list[Any]:
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        progress_bar = tqdm.tqdm(
+            total=len(requests), leave=False, disable=not show_progress_bar
+        )
+
+        async def send(i: int) -> Any:
+            async with semaphore:
+                result = await self._send_with_retries(requests[i], n_tokens[i])
+            progress_bar.update(1)
+            return result
+
+        tasks = [asyncio.ensure_future(send(i)) for i in range(len(requests))]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            progress_bar.close()
+
+    async def _send_with_retries(
+        self, request: Callable[[], Awaitable[APIResponse]], n_tokens: int
+    ) -> Any:
+        for attempt in range(self.max_retries + 1):
+            if self.request_bucket is not None:
+                await self.request_bucket.acquire(1)
+            if self.token_bucket is not None and n_tokens:
+                await self.token_bucket.acquire(n_tokens)
+            try:
+                response = await request()
+            except Exception as e:
+                if attempt == self.max_retries or not is_retryable(e):
+                    raise
+                limits = self._update_limits(_error_headers(e))
+                delay = limits.get("retry_after", self._backoff(attempt))
+                if _status_code(e) == 429:
+                    # all requests wait, not just the ones which were rejected
+                    for bucket in [self.request_bucket, self.token_bucket]:
+                        if bucket is not None:
+                            bucket.pause(delay)
+                logger.info(
+                    f"Request failed ({e!r}), retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})."
+                )
+                await asyncio.sleep(delay)
+                continue
+            self._update_limits(response.headers)
+            return response.result
+
+    def _backoff(self, attempt: int) -> float:
+        # exponential backoff with full jitter, such that concurrent retries do not hit the provider at the same time
+        return self._rng.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def _update_limits(self, headers: Mapping[str, str]) -> dict[str, float]:
+        limits = parse_rate_limit_headers(headers)
+        for resource in ["requests", "tokens"]:
+            limit = limits.get(f"{resource}_limit")
+            bucket_name = f"{resource[:-1]}_bucket"
+            bucket = getattr(self, bucket_name)
+            if bucket is None and limit:
+                bucket = TokenBucket(limit)
+                setattr(self, bucket_name, bucket)
+            if bucket is not None:
+                bucket.update(
+                    limit=limit,
+                    remaining=limits.get(f"{resource}_remaining"),
+                    reset=limits.get(f"{resource}_reset"),
+                )
+        return limits
+
+    def close(self) -> None:
+        """Stop the event loop of the engine."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._thread is not None:
+                self._thread.join(timeout=5)
+            self._loop.close()
+            self._loop = None
+            self._thread = None
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import shutil
+import tempfile
 from functools import partial
+from pathlib import Path
+
+import numpy as np
 
 from mteb.evaluation.evaluators.RetrievalEvaluator import DRESModel
 from mteb.model_meta import ModelMeta
@@ -11,6 +18,30 @@ from mteb.requires_package import requires_package
 logger = logging.getLogger(__name__)
 
 
+def _default_index_cache_dir() -> Path:
+    cache_directory = os.environ.get("MTEB_CACHE", None)
+    cache_directory = (
+        Path(cache_directory) if cache_directory else Path.home() / ".cache" / "mteb"
+    )
+    return cache_directory / "bm25s"
+
+
+def _index_fingerprint(
+    corpus_ids: list[str], corpus_texts: list[str], *settings: object
+) -> str:
+    """A hash of the content of the corpus and the settings of the tokenizer, identifying a BM25 index."""
+    sha = hashlib.sha256()
+    for part in [*settings, len(corpus_ids)]:
+        sha.update(str(part).encode("utf-8"))
+        sha.update(b"\0")
+    for cid, text in zip(corpus_ids, corpus_texts):
+        sha.update(cid.encode("utf-8"))
+        sha.update(b"\0")
+        sha.update(text.encode("utf-8"))
+        sha.update(b"\0")
+    return sha.hexdigest()[:16]
+
+
 def bm25_loader(**kwargs):
     model_name = kwargs.get("model_name", "BM25")
     requires_package(bm25_loader, "bm25s", model_name, "pip install mteb[bm25s]")
@@ -18,13 +49,27 @@ def bm25_loader(**kwargs):
     import Stemmer
 
     class BM25Search(DRESModel, Wrapper):
-        """BM25 search"""
+        """BM25 search
+
+        The index of a corpus is cached in memory and on disk, keyed by the content of the corpus and the settings of the tokenizer, such that
+        the splits and subsets of a task sharing a corpus, as well as repeated runs, only tokenize and index it once.
+
+        Args:
+            previous_results: The path to the results of a previous run, used for reranking.
+            stopwords: The stopwords removed by the tokenizer.
+            stemmer_language: The language of the stemmer, or None to not stem the tokens.
+            index_cache_dir: The folder the indexes are saved in. If None it will use the "bm25s" folder in the MTEB_CACHE environment variable
+                or "~/.cache/mteb" by default.
+            cache_index: Whether to save the indexes on disk and load them in later runs.
+        """
 
         def __init__(
             self,
             previous_results: str = None,
             stopwords: str = "en",
             stemmer_language: str | None = "english",
+            index_cache_dir: str | Path | None = None,
+            cache_index: bool = True,
             **kwargs,
         ):
             super().__init__(
@@ -36,14 +81,68 @@ def bm25_loader(**kwargs):
             )
 
             self.stopwords = stopwords
+            self.stemmer_language = stemmer_language
             self.stemmer = (
                 Stemmer.Stemmer(stemmer_language) if stemmer_language else None
             )
+            self.index_cache_dir = (
+                Path(index_cache_dir)
+                if index_cache_dir is not None
+                else _default_index_cache_dir()
+            )
+            self.cache_index = cache_index
+            # the index of the last corpus, which is shared by consecutive splits and subsets
+            self._index: tuple[str, bm25s.BM25] | None = None
 
         @classmethod
         def name(self):
             return "bm25s"
 
+        def _get_index(
+            self, corpus_ids: list[str], corpus_texts: list[str]
+        ) -> bm25s.BM25:
+            fingerprint = _index_fingerprint(
+                corpus_ids,
+                corpus_texts,
+                bm25s.__version__,
+                self.stopwords,
+                self.stemmer_language,
+            )
+            if self._index is not None and self._index[0] == fingerprint:
+                logger.info("Reusing the BM25 index of the corpus...")
+                return self._index[1]
+
+            index_path = self.index_cache_dir / fingerprint
+            if self.cache_index and index_path.exists():
+                logger.info(f"Loading BM25 index from {index_path}...")
+                retriever = bm25s.BM25.load(str(index_path))
+            else:
+                logger.info("Encoding Corpus...")
+                encoded_corpus = self.encode(corpus_texts)
+                logger.info(
+                    f"Indexing Corpus... {len(encoded_corpus.ids):,} documents, {len(encoded_corpus.vocab):,} vocab"
+                )
+                retriever = bm25s.BM25()
+                retriever.index(encoded_corpus)
+                if self.cache_index:
+                    self._save_index(retriever, index_path)
+
+            self._index = (fingerprint, retriever)
+            return retriever
+
+        def _save_index(self, retriever: bm25s.BM25, index_path: Path) -> None:
+            # written to a temporary folder first, such that an interrupted run does not leave an incomplete index behind
+            self.index_cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = Path(tempfile.mkdtemp(dir=self.index_cache_dir))
+            try:
+                retriever.save(str(tmp_path))
+                tmp_path.rename(index_path)
+                logger.info(f"Saved BM25 index to {index_path}")
+            except OSError as e:
+                logger.warning(f"Could not save the BM25 index to {index_path}: {e}")
+            finally:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+
         def search(
             self,
             corpus: dict[str, dict[str, str]],
@@ -53,64 +152,34 @@ def bm25_loader(**kwargs):
             return_sorted: bool = False,
             **kwargs,
         ) -> dict[str, dict[str, float]]:
-            logger.info("Encoding Corpus...")
             corpus_ids = list(corpus.keys())
-            corpus_with_ids = [
-                {
-                    "doc_id": cid,
-                    **(
-                        {"text": corpus[cid]}
-                        if isinstance(corpus[cid], str)
-                        else corpus[cid]
-                    ),
-                }
-                for cid in corpus_ids
-            ]
-
             corpus_texts = [
-                "\n".join([doc.get("title", ""), doc["text"]])
-                for doc in corpus_with_ids
+                doc
+                if isinstance(doc, str)
+                else "\n".join([doc.get("title", ""), doc["text"]])
+                for doc in corpus.values()
             ]  # concatenate all document values (title, text, ...)
-            encoded_corpus = self.encode(corpus_texts)
-
-            logger.info(
-                f"Indexing Corpus... {len(encoded_corpus.ids):,} documents, {len(encoded_corpus.vocab):,} vocab"
-            )
-
-            # Create the BM25 model and index the corpus
-            retriever = bm25s.BM25()
-            retriever.index(encoded_corpus)
+            retriever = self._get_index(corpus_ids, corpus_texts)
 
             logger.info("Encoding Queries...")
             query_ids = list(queries.keys())
-            self.results = {qid: {} for qid in query_ids}
             queries_texts = [queries[qid] for qid in queries]
 
             query_token_strs = self.encode(queries_texts, return_ids=False)
 
             logger.info(f"Retrieving Results... {len(queries):,} queries")
 
+            # without a corpus, the indices of the documents are returned, which are mapped to their ids at once
             queries_results, queries_scores = retriever.retrieve(
-                query_token_strs, corpus=corpus_with_ids, k=top_k
+                query_token_strs, k=min(top_k, len(corpus_ids))
             )
+            doc_ids = np.asarray(corpus_ids, dtype=object)[queries_results].tolist()
+            scores = np.asarray(queries_scores, dtype=np.float64).tolist()
 
-            # Iterate over queries
-            for qi, qid in enumerate(query_ids):
-                doc_id_to_score = {}
-                query_results = queries_results[qi]
-                scores = queries_scores[qi]
-                doc_id_to_score = {}
-
-                # Iterate over results
-                for ri in range(len(query_results)):
-                    doc = query_results[ri]
-                    score = scores[ri]
-                    doc_id = doc["doc_id"]
-
-                    doc_id_to_score[doc_id] = float(score)
-
-                self.results[qid] = doc_id_to_score
-
+            self.results = {
+                qid: dict(zip(query_doc_ids, query_scores))
+                for qid, query_doc_ids, query_scores in zip(query_ids, doc_ids, scores)
+            }
             return self.results
 
         def encode(self, texts: list[str], **kwargs):
@@ -3,19 +3,33 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import torch
 
-from mteb.encoder_interface import Encoder
+from mteb.encoder_interface import Encoder, PromptType
 from mteb.models.wrapper import Wrapper
 
 logger = logging.getLogger(__name__)
 
 
 class TextVectorMap:
+    """Maps texts to embedding vectors stored in a memory-mapped file.
+
+    The index is an append-only binary file (`index.bin`) of fixed-width SHA-256
+    digests, where record `i` is the digest of the text stored in row `i` of
+    `vectors.npy`. Saving only appends the records added since the last save and
+    loading memory-maps the file, so both are independent of the cache size in
+    Python work. Lookups go through a sorted copy of the digests, new entries
+    are kept in a small dict until they are merged into it.
+    """
+
+    digest_size = hashlib.sha256().digest_size
+
     def __init__(
         self,
         directory: str | Path,
@@ -24,44 +38,160 @@ class TextVectorMap:
         self.directory = Path(directory)
         self.directory.mkdir(parents=True, exist_ok=True)
         self.vectors_file = self.directory / "vectors.npy"
-        self.index_file = self.directory / "index.json"
+        self.index_file = self.directory / "index.bin"
+        self.legacy_index_file = self.directory / "index.json"
         self.dimension_file = self.directory / "dimension"
-        self.hash_to_index: dict[str, int] = {}
         self.vectors: np.memmap | None = None
         self.vector_dim: int | None = None
         self.initial_vectors = initial_vectors
+        self._digest_dtype = np.dtype(f"S{self.digest_size}")
+        # rows [0, len(self._sorted_rows)) are looked up through the sorted digests,
+        # rows added after the last merge through self._recent
+        self._sorted_digests = np.empty(0, dtype=self._digest_dtype)
+        self._sorted_rows = np.empty(0, dtype=np.int64)
+        self._recent: dict[bytes, int] = {}
+        self._unsaved: list[bytes] = []
         logger.info(f"Initialized TextVectorMap in directory: {self.directory}")
         self._initialize_vectors_file()
 
-    def _hash_text(self, text: str) -> str:
-        return hashlib.sha256(text.encode()).hexdigest()
+    def __len__(self) -> int:
+        return len(self._sorted_rows) + len(self._recent)
+
+    def _hash_text(self, text: str) -> bytes:
+        return hashlib.sha256(text.encode()).digest()
+
+    def _hash_texts(self, texts: list[str], namespace: str = "") -> list[bytes]:
+        if not namespace:
+            sha256 = hashlib.sha256
+            return [sha256(text.encode()).digest() for text in texts]
+        # the same text under different namespaces (e.g. prompts) gets different keys
+        prefix = hashlib.sha256(namespace.encode() + b"\x00")
+        digests = []
+        for text in texts:
+            text_hash = prefix.copy()
+            text_hash.update(text.encode())
+            digests.append(text_hash.digest())
+        return digests
+
+    def _set_dimension(self, vector_dim: int) -> None:
+        self.vector_dim = vector_dim
+        self._initialize_vectors_file()
+        self._save_dimension()
+        logger.info(f"Initialized vector dimension to {self.vector_dim}")
+
+    def _lookup(self, digests: list[bytes]) -> np.ndarray:
+        indices = np.full(len(digests), -1, dtype=np.int64)
+        if len(self._sorted_rows) and len(digests):
+            queries = np.array(digests, dtype=self._digest_dtype)
+            positions = np.searchsorted(self._sorted_digests, queries)
+            positions[positions == len(self._sorted_digests)] = 0
+            found = self._sorted_digests[positions] == queries
+            indices[found] = self._sorted_rows[positions[found]]
+        if self._recent:
+            get = self._recent.get
+            for i in np.flatnonzero(indices < 0):
+                indices[i] = get(digests[i], -1)
+        return indices
+
+    def _append(self, digests: list[bytes]) -> np.ndarray:
+        """Assign rows to the given digests, reusing the rows of known digests."""
+        indices = self._lookup(digests)
+        recent = self._recent
+        for i in np.flatnonzero(indices < 0):
+            digest = digests[i]
+            index = recent.get(digest)
+            if index is None:
+                index = len(self)
+                recent[digest] = index
+                self._unsaved.append(digest)
+            indices[i] = index
+        if len(recent) > max(1024, len(self._sorted_rows) // 8):
+            self._merge_recent()
+        return indices
+
+    def _merge_recent(self) -> None:
+        if not self._recent:
+            return
+        digests = np.concatenate(
+            [
+                self._sorted_digests,
+                np.array(list(self._recent), dtype=self._digest_dtype),
+            ]
+        )
+        rows = np.concatenate(
+            [self._sorted_rows, np.fromiter(self._recent.values(), dtype=np.int64)]
+        )
+        order = np.argsort(digests, kind="stable")
+        self._sorted_digests = digests[order]
+        self._sorted_rows = rows[order]
+        self._recent = {}
+
+    def _build_lookup(self, digests: np.ndarray) -> None:
+        order = np.argsort(digests, kind="stable")
+        self._sorted_digests = digests[order]
+        self._sorted_rows = order.astype(np.int64)
+        self._recent = {}
 
     def add(self, text: str, vector: np.ndarray) -> None:
         try:
             if self.vector_dim is None:
-                self.vector_dim = vector.shape[0]
-                self._initialize_vectors_file()
-                self._save_dimension()
-                logger.info(f"Initialized vector dimension to {self.vector_dim}")
+                self._set_dimension(vector.shape[0])
 
-            text_hash = self._hash_text(text)
-            if text_hash in self.hash_to_index:
+            n_before = len(self)
+            index = self._append([self._hash_text(text)])[0]
+            if len(self) == n_before:
                 logger.warning(
                     "Hash collision or duplicate text. Overwriting existing vector."
                 )
-                index = self.hash_to_index[text_hash]
-            else:
-                index = len(self.hash_to_index)
-                if index >= len(self.vectors):
-                    self._double_vectors_file()
-                self.hash_to_index[text_hash] = index
+            self._ensure_capacity(len(self))
 
             self.vectors[index] = vector
+            logger.debug(f"Added new text-vector pair. Total pairs: {len(self)}")
+        except Exception as e:
+            logger.error(f"Error adding text-vector pair: {str(e)}")
+            raise
+
+    def add_many(
+        self, texts: list[str], vectors: np.ndarray, namespace: str = ""
+    ) -> np.ndarray:
+        """Add a batch of text-vector pairs with a single write to the vectors file.
+
+        Texts that are already in the index (or repeated within the batch) overwrite
+        the stored vector, the last occurrence wins.
+
+        Args:
+            texts: The texts to add.
+            vectors: The vectors of the texts.
+            namespace: Added to the key of each text, e.g. the prompt used for encoding it.
+
+        Returns:
+            The rows of the texts in the vectors file.
+        """
+        try:
+            if len(texts) != len(vectors):
+                raise ValueError(
+                    f"Got {len(texts)} texts but {len(vectors)} vectors to add."
+                )
+            if len(texts) == 0:
+                return np.empty(0, dtype=np.int64)
+            if self.vector_dim is None:
+                self._set_dimension(vectors.shape[1])
+
+            n_before = len(self)
+            indices = self._append(self._hash_texts(texts, namespace))
+            n_overwritten = len(texts) - (len(self) - n_before)
+            if n_overwritten:
+                logger.warning(
+                    f"{n_overwritten} texts were already cached or duplicated. Overwriting existing vectors."
+                )
+            self._ensure_capacity(len(self))
+            self.vectors[indices] = vectors
             logger.debug(
-                f"Added new text-vector pair. Total pairs: {len(self.hash_to_index)}"
+                f"Added {len(texts)} text-vector pairs. Total pairs: {len(self)}"
             )
+            return indices
         except Exception as e:
-            logger.error(f"Error adding text-vector pair: {str(e)}")
+            logger.error(f"Error adding text-vector pairs: {str(e)}")
             raise
 
     def _initialize_vectors_file(self):
@@ -84,19 +214,22 @@ class TextVectorMap:
             self.vectors = self.vectors.reshape(-1, self.vector_dim)
         logger.info(f"Vectors file initialized with shape: {self.vectors.shape}")
 
-    def _double_vectors_file(self):
+    def _ensure_capacity(self, n_vectors: int) -> None:
         current_size = len(self.vectors)
-        new_size = current_size * 2
-        logger.info(f"Doubling vectors file from {current_size} to {new_size} vectors")
+        if n_vectors <= current_size:
+            return
+        new_size = max(current_size, 1)
+        while new_size < n_vectors:
+            new_size *= 2
+        logger.info(f"Growing vectors file from {current_size} to {new_size} vectors")
         self.vectors.flush()
-        new_vectors = np.memmap(
+        # memmap in r+ mode extends the file, the existing rows are kept on disk
+        self.vectors = np.memmap(
             self.vectors_file,
             dtype="float32",
             mode="r+",
             shape=(new_size, self.vector_dim),
         )
-        new_vectors[:current_size] = self.vectors[:]
-        self.vectors = new_vectors
 
     def _save_dimension(self):
         with open(self.dimension_file, "w") as f:
@@ -119,18 +252,17 @@ class TextVectorMap:
 
     def save(self) -> None:
         try:
+            # vectors are flushed before their index records are appended, so a
+            # record on disk always points to a vector that has been written
             if self.vectors is not None:
                 self.vectors.flush()
 
-            # Convert hash_to_index dict to a format suitable for JSON
-            # JSON doesn't support integer keys, so we keep everything as strings
-            serializable_index = {
-                str(hash_): int(index)  # Ensure indices are serialized as integers
-                for hash_, index in self.hash_to_index.items()
-            }
-
-            with open(self.index_file, "w", encoding="utf-8") as f:
-                json.dump(serializable_index, f, indent=2)
+            if self._unsaved:
+                with open(self.index_file, "ab") as f:
+                    f.write(b"".join(self._unsaved))
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._unsaved = []
 
             self._save_dimension()
             logger.info(f"Saved TextVectorMap to {self.directory}")
@@ -138,20 +270,58 @@ class TextVectorMap:
             logger.error(f"Error saving TextVectorMap: {str(e)}")
             raise
 
+    def _load_digests(self) -> np.ndarray:
+        n_vectors = os.path.getsize(self.vectors_file) // (4 * self.vector_dim)
+        index_size = os.path.getsize(self.index_file)
+        if index_size % self.digest_size:
+            # a partially written record from an interrupted save
+            logger.warning(
+                f"Truncating incomplete record at the end of {self.index_file}"
+            )
+            with open(self.index_file, "r+b") as f:
+                f.truncate(index_size - index_size % self.digest_size)
+        n_records = index_size // self.digest_size
+        if n_records > n_vectors:
+            logger.warning(
+                f"Index has {n_records} records but the vectors file only {n_vectors} vectors. Ignoring the extra records."
+            )
+            n_records = n_vectors
+        if n_records == 0:
+            return np.empty(0, dtype=self._digest_dtype)
+        return np.memmap(
+            self.index_file, dtype=self._digest_dtype, mode="r", shape=(n_records,)
+        )
+
+    def _convert_legacy_index(self) -> None:
+        """Convert an `index.json` written by earlier versions to `index.bin`."""
+        logger.info(f"Converting {self.legacy_index_file} to {self.index_file}")
+        with open(self.legacy_index_file, encoding="utf-8") as f:
+            legacy_index = json.load(f)
+        digests = [b""] * len(legacy_index)
+        for hash_, index in legacy_index.items():
+            digests[int(index)] = bytes.fromhex(hash_)
+        tmp_file = self.index_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(b"".join(digests))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.index_file)
+        self.legacy_index_file.unlink()
+
     def load(self, name: str | None = None) -> None:
         name_details = name if name else ""
         try:
             self._load_dimension()
+            if (
+                self.legacy_index_file.exists()
+                and not self.index_file.exists()
+                and self.vectors_file.exists()
+            ):
+                self._convert_legacy_index()
             if self.index_file.exists() and self.vectors_file.exists():
-                with open(self.index_file, encoding="utf-8") as f:
-                    # Load and convert the JSON data back to the expected format
-                    loaded_index = json.load(f)
-                    self.hash_to_index = {
-                        str(hash_): int(index)  # Ensure we maintain the correct types
-                        for hash_, index in loaded_index.items()
-                    }
-
                 if self.vector_dim is not None:
+                    self._build_lookup(self._load_digests())
+                    self._unsaved = []
                     self.vectors = np.memmap(
                         self.vectors_file, dtype="float32", mode="r+"
                     )
@@ -175,18 +345,31 @@ class TextVectorMap:
 
     def get_vector(self, text: str) -> np.ndarray | None:
         try:
-            text_hash = self._hash_text(text)
-            if text_hash not in self.hash_to_index:
-                logger.debug(f"Text hash not found in index: {text_hash}")
+            index = self._lookup([self._hash_text(text)])[0]
+            if index < 0:
+                logger.debug("Text hash not found in index")
                 return None
-            index = self.hash_to_index[text_hash]
             return self.vectors[index]
         except Exception as e:
             logger.error(f"Error retrieving vector for text: {str(e)}")
             raise
 
+    def get_indices(self, texts: list[str], namespace: str = "") -> np.ndarray:
+        """Look up the row of each text in the vectors file, -1 for texts that are not cached."""
+        return self._lookup(self._hash_texts(texts, namespace))
+
+    def get_many(self, indices: np.ndarray) -> np.ndarray:
+        """Gather the vectors stored at the given rows with a single read from the vectors file."""
+        if len(indices) == 0:
+            return np.empty((0, self.vector_dim or 0), dtype=np.float32)
+        # reading the rows in file order keeps the memmap access sequential
+        order = np.argsort(indices, kind="stable")
+        vectors = np.empty((len(indices), self.vector_dim), dtype=np.float32)
+        vectors[order] = self.vectors[indices[order]]
+        return vectors
+
     def __contains__(self, text: str) -> bool:
-        return self._hash_text(text) in self.hash_to_index
+        return self._lookup([self._hash_text(text)])[0] >= 0
 
     def __del__(self):
         self.close()
@@ -199,73 +382,180 @@ class TextVectorMap:
         logger.info(f"Closed TextVectorMap in directory: {self.directory}")
 
 
+class TaskView:
+    """The rows of a shared TextVectorMap that were used by a single task.
+
+    Stored as an append-only file of int64 rows next to the shared vectors file.
+    """
+
+    def __init__(self, file: str | Path):
+        self.file = Path(file)
+        self._rows: list[np.ndarray] = []
+        self._seen = np.zeros(0, dtype=bool)
+        self._n_saved = 0
+        if self.file.exists():
+            self._add_unseen(np.fromfile(self.file, dtype=np.int64))
+            self._n_saved = len(self._rows)
+
+    def _add_unseen(self, rows: np.ndarray) -> None:
+        if len(rows) == 0:
+            return
+        if rows.max() >= len(self._seen):
+            seen = np.zeros(max(int(rows.max()) + 1, 2 * len(self._seen)), dtype=bool)
+            seen[: len(self._seen)] = self._seen
+            self._seen = seen
+        rows = np.unique(rows[~self._seen[rows]])
+        if len(rows):
+            self._seen[rows] = True
+            self._rows.append(rows)
+
+    def add(self, rows: np.ndarray) -> None:
+        self._add_unseen(np.asarray(rows, dtype=np.int64))
+
+    @property
+    def rows(self) -> np.ndarray:
+        if not self._rows:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(self._rows)
+
+    def save(self) -> None:
+        if self._n_saved == len(self._rows):
+            return
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.file, "ab") as f:
+            f.write(np.concatenate(self._rows[self._n_saved :]).tobytes())
+        self._n_saved = len(self._rows)
+
+
+@lru_cache
+def _warn_about_task_caches(cache_path: Path) -> None:
+    """Warn once per cache path about the per-task caches of earlier versions, stored in `<cache_path>/<task_name>`.
+
+    They are not migrated, as their embeddings are not keyed by the prompt of the model.
+    """
+    task_caches = sorted(path.parent.name for path in cache_path.glob("*/vectors.npy"))
+    if task_caches:
+        logger.warning(
+            f"Found embedding caches of earlier versions in {cache_path}, stored per task: {', '.join(task_caches)}. They are not used, as "
+            + "their embeddings are not keyed by the prompt of the model, and can be deleted. The cache is now stored per model in "
+            + f"{cache_path}/<model_name>/<revision>."
+        )
+
+
 class CachedEmbeddingWrapper(Wrapper, Encoder):
+    """Caches the embeddings of a model on disk.
+
+    All tasks share one content-addressed store per model and revision, located at
+    `<cache_path>/<model_name>/<revision>`. A vector is keyed by the prompt the model
+    applies for the task and prompt type together with the text, so queries and
+    passages do not collide while identical texts are encoded only once across
+    tasks. The rows used by each task are recorded in `<store>/tasks/<task_name>.bin`.
+    """
+
     def __init__(self, model: Encoder, cache_path: str | Path):
         self._model = model
         self.cache_path = Path(cache_path)
         self.cache_path.mkdir(parents=True, exist_ok=True)
 
-        if hasattr(model, "encode"):
-            self.cache_dict = {}
-        else:
+        if not hasattr(model, "encode"):
             logger.error("Model must have an 'encode' method.")
             raise ValueError("Invalid model encoding method")
 
+        _warn_about_task_caches(self.cache_path.resolve())
+        model_name, revision = self._model_name_and_revision(model)
+        self.store_path = self.cache_path / model_name / revision
+        self.store = TextVectorMap(self.store_path)
+        self.store.load(name=model_name)
+        self.task_views: dict[str, TaskView] = {}
+        self._prompts: dict[tuple[str, PromptType | None], str] = {}
+
         logger.info("Initialized CachedEmbeddingWrapper")
 
+    @staticmethod
+    def _model_name_and_revision(model: Encoder) -> tuple[str, str]:
+        meta = getattr(model, "mteb_model_meta", None)
+        if meta is not None and meta.name is not None:
+            return meta.model_name_as_path(), meta.revision or "no_revision_available"
+        model_name = getattr(model, "model_name", None)
+        if not isinstance(model_name, str):
+            model_name = type(model).__name__
+        return model_name.replace("/", "__").replace(" ", "_"), "no_revision_available"
+
+    def resolve_prompt(self, task_name: str, prompt_type: PromptType | None) -> str:
+        """The prompt the wrapped model applies when encoding for the task, used as part of the cache key.
+
+        Models using `model_prompts` (e.g. SentenceTransformerWrapper) resolve to the prompt text,
+        models using an `instruction_template` to the formatted instruction. For any other model the
+        prompt is unknown, so the task name and prompt type are used, which keeps the cache per task.
+        """
+        key = (task_name, prompt_type)
+        if key not in self._prompts:
+            prompt_type_value = prompt_type.value if prompt_type else ""
+            if hasattr(self._model, "model_prompts"):
+                prompt_name = None
+                if self._model.model_prompts:
+                    prompt_name = self.get_prompt_name(
+                        self._model.model_prompts, task_name, prompt_type
+                    )
+                prompts = getattr(getattr(self._model, "model", None), "prompts", None)
+                prompt = (prompts or {}).get(prompt_name, prompt_name) or ""
+            elif getattr(self._model, "instruction_template", None):
+                prompt = f"{prompt_type_value}:{self._model.get_task_instruction(task_name, prompt_type)}"
+            else:
+                prompt = f"{task_name}:{prompt_type_value}"
+            self._prompts[key] = prompt
+        return self._prompts[key]
+
+    def task_view(self, task_name: str) -> TaskView:
+        if task_name not in self.task_views:
+            self.task_views[task_name] = TaskView(
+                self.store_path / "tasks" / f"{task_name}.bin"
+            )
+        return self.task_views[task_name]
+
     def encode(
         self, texts: list[str], batch_size: int = 32, task_name: str = None, **kwargs
     ) -> np.ndarray:
         """Encode texts using the wrapped model, with caching"""
         try:
-            results = []
-            uncached_texts = []
-            uncached_indices = []
-
-            # Initialize cache
-            if task_name not in self.cache_dict:
-                self.cache_dict[task_name] = TextVectorMap(self.cache_path / task_name)
-                self.cache_dict[task_name].load(name=task_name)
-
-            # Check cache for each text
-            for i, text in enumerate(texts):
-                vector = self.cache_dict[task_name].get_vector(text)
-                if vector is not None:
-                    results.append(vector)
-                else:
-                    uncached_texts.append(text)
-                    uncached_indices.append(i)
+            cache = self.store
+            prompt = self.resolve_prompt(task_name, kwargs.get("prompt_type"))
+
+            # Check cache for all texts at once
+            indices = cache.get_indices(texts, namespace=prompt)
+            cached_mask = indices >= 0
+            cached_positions = np.flatnonzero(cached_mask)
+            uncached_positions = np.flatnonzero(~cached_mask)
 
             # Encode any texts not found in cache
-            if uncached_texts:
+            new_vectors = None
+            if len(uncached_positions):
+                uncached_texts = [texts[i] for i in uncached_positions]
                 logger.info(f"Encoding {len(uncached_texts)} new texts")
                 new_vectors = self._model.encode(
-                    uncached_texts, batch_size=batch_size, **kwargs
+                    uncached_texts, batch_size=batch_size, task_name=task_name, **kwargs
                 )
                 if isinstance(new_vectors, torch.Tensor):
                     new_vectors = new_vectors.cpu().numpy()
 
                 # Add new vectors to cache
-                for text, vector in zip(uncached_texts, new_vectors):
-                    self.cache_dict[task_name].add(text, vector)
-                results.extend(new_vectors)
-                self.cache_dict[task_name].save()
+                indices[uncached_positions] = cache.add_many(
+                    uncached_texts, new_vectors, namespace=prompt
+                )
+                cache.save()
             else:
                 logger.info("All texts found in cache")
 
-            # Reconstruct results in original order
-            final_results = [None] * len(texts)
-            uncached_idx = 0
-            for i in range(len(texts)):
-                if i in uncached_indices:
-                    final_results[i] = results[
-                        len(texts) - len(uncached_texts) + uncached_idx
-                    ]
-                    uncached_idx += 1
-                else:
-                    final_results[i] = results[i - uncached_idx]
+            task_view = self.task_view(task_name)
+            task_view.add(indices)
+            task_view.save()
 
-            return np.array(final_results)
+            # Scatter cached and new vectors into the original order
+            results = np.empty((len(texts), cache.vector_dim or 0), dtype=np.float32)
+            results[cached_positions] = cache.get_many(indices[cached_positions])
+            if new_vectors is not None:
+                results[uncached_positions] = new_vectors
+            return results
         except Exception as e:
             logger.error(f"Error in cached encoding: {str(e)}")
             raise
@@ -293,6 +583,6 @@ class CachedEmbeddingWrapper(Wrapper, Encoder):
         self.close()
 
     def close(self):
-        for task in list(self.cache_dict.keys()):
-            self.cache_dict[task].close()
+        if "store" in self.__dict__:
+            self.store.close()
         logger.info("Closed CachedEmbeddingWrapper")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 import logging
 from collections.abc import Sequence
 from functools import partial
@@ -15,6 +16,188 @@ from mteb.requires_package import requires_package
 
 logger = logging.getLogger(__name__)
 
+# the number of entries of the token similarity matrix computed at once by `max_sim`, i.e. 64MB in float32
+MAX_SIM_BLOCK_SIZE = 2**24
+
+
+class TokenEmbeddings:
+    """The token embeddings of a batch of texts, packed into a single matrix without padding.
+
+    The tokens of text `i` are the rows `offsets[i]:offsets[i + 1]` of `embeddings`. Padding all texts to the longest one wastes memory and
+    compute on corpora with skewed lengths, so late-interaction models return their embeddings in this form. It supports `len`, and indexing
+    with an integer, which returns the token matrix of a single text, or with a slice, list or array, which returns the selected texts packed
+    again, such that it can be used in place of a padded array by the evaluators. Converting it to a numpy array returns the padded array.
+
+    Args:
+        embeddings: The token embeddings of all texts, of shape (n_tokens, token_dim).
+        offsets: The start of the tokens of each text followed by the total number of tokens, of shape (n_texts + 1,).
+    """
+
+    def __init__(self, embeddings: torch.Tensor, offsets: torch.Tensor):
+        self.embeddings = embeddings
+        self.offsets = offsets
+
+    @classmethod
+    def from_sequences(
+        cls,
+        sequences: Sequence[torch.Tensor | np.ndarray],
+        dtype: torch.dtype | None = None,
+    ) -> TokenEmbeddings:
+        """Pack a list of token matrices of shape (n_tokens_i, token_dim)."""
+        sequences = [torch.as_tensor(seq).detach().cpu() for seq in sequences]
+        lengths = torch.tensor([len(seq) for seq in sequences], dtype=torch.long)
+        offsets = torch.cat([torch.zeros(1, dtype=torch.long), lengths.cumsum(0)])
+        if sequences:
+            embeddings = torch.cat(sequences)
+        else:
+            embeddings = torch.empty((0, 0))
+        return cls(embeddings.to(dtype) if dtype is not None else embeddings, offsets)
+
+    @classmethod
+    def from_padded(cls, padded: torch.Tensor | np.ndarray) -> TokenEmbeddings:
+        """Pack an array of shape (n_texts, max_tokens, token_dim), padded with zero vectors, which are dropped."""
+        padded = torch.as_tensor(padded)
+        is_token = (padded != 0).any(dim=-1)
+        lengths = is_token.sum(dim=1)
+        offsets = torch.cat([torch.zeros(1, dtype=torch.long), lengths.cumsum(0)])
+        return cls(padded[is_token], offsets)
+
+    @property
+    def lengths(self) -> torch.Tensor:
+        """The number of tokens of each text."""
+        return self.offsets[1:] - self.offsets[:-1]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx: Any) -> torch.Tensor | TokenEmbeddings:
+        if isinstance(idx, (int, np.integer)):
+            idx = range(len(self))[idx]
+            return self.embeddings[self.offsets[idx] : self.offsets[idx + 1]]
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+            if step == 1:
+                start = max(start, 0)
+                stop = max(stop, start)
+                offsets = self.offsets[start : stop + 1]
+                return TokenEmbeddings(
+                    self.embeddings[offsets[0] : offsets[-1]], offsets - offsets[0]
+                )
+            idx = range(start, stop, step)
+        idx = torch.from_numpy(np.array(idx, dtype=np.int64)).reshape(-1)
+        idx = torch.where(idx < 0, idx + len(self), idx)
+        lengths = self.lengths[idx]
+        offsets = torch.cat([torch.zeros(1, dtype=torch.long), lengths.cumsum(0)])
+        # the position of each selected token in the packed matrix
+        token_idx = torch.arange(int(offsets[-1])) + torch.repeat_interleave(
+            self.offsets[idx] - offsets[:-1], lengths
+        )
+        return TokenEmbeddings(self.embeddings[token_idx], offsets)
+
+    def to_padded(self) -> torch.Tensor:
+        """The token embeddings padded with zero vectors, of shape (n_texts, max_tokens, token_dim)."""
+        padded = torch.zeros(
+            (len(self), int(self.lengths.max()) if len(self) else 0)
+            + tuple(self.embeddings.shape[1:]),
+            dtype=self.embeddings.dtype,
+        )
+        text_idx = torch.repeat_interleave(torch.arange(len(self)), self.lengths)
+        padded[
+            text_idx, torch.arange(len(self.embeddings)) - self.offsets[text_idx]
+        ] = self.embeddings
+        return padded
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        padded = self.to_padded().float().numpy()
+        return padded if dtype is None else padded.astype(dtype)
+
+
+def _as_token_embeddings(embeddings: Any) -> TokenEmbeddings:
+    if isinstance(embeddings, TokenEmbeddings):
+        return embeddings
+    if isinstance(embeddings, list):
+        return TokenEmbeddings.from_sequences(embeddings)
+    embeddings = torch.as_tensor(embeddings)
+    if embeddings.ndim == 2:
+        embeddings = embeddings.unsqueeze(0)
+    return TokenEmbeddings.from_padded(embeddings)
+
+
+def _blocks(offsets: list[int], max_tokens: int) -> list[tuple[int, int]]:
+    """Split the texts into consecutive blocks of at most `max_tokens` tokens. A longer text is a block of its own."""
+    blocks = []
+    start = 0
+    while start < len(offsets) - 1:
+        end = (
+            bisect.bisect_right(offsets, offsets[start] + max_tokens, lo=start + 1) - 1
+        )
+        end = max(end, start + 1)
+        blocks.append((start, end))
+        start = end
+    return blocks
+
+
+def max_sim(
+    queries: Any, documents: Any, max_block_size: int = MAX_SIM_BLOCK_SIZE
+) -> torch.Tensor:
+    """Computes the late-interaction similarity: the sum over the query tokens of their maximum similarity to the tokens of the document.
+
+    The token similarities are computed for blocks of queries and documents with at most `max_block_size` entries, and reduced to the scores
+    of the block right away, such that the memory does not depend on the size of the corpus or the length of the longest text.
+
+    Args:
+        queries: The token embeddings of the queries, as `TokenEmbeddings`, a list of token matrices, an array padded with zero vectors of
+            shape (n_queries, max_tokens, token_dim), or the token matrix of a single query.
+        documents: The token embeddings of the documents, in the same formats.
+        max_block_size: The maximum number of token similarities computed at once.
+
+    Returns:
+        A (n_queries, n_documents) float32 tensor with res[i][j] = max_sim(queries[i], documents[j]).
+    """
+    queries = _as_token_embeddings(queries)
+    documents = _as_token_embeddings(documents)
+    scores = torch.zeros((len(queries), len(documents)))
+    if len(queries) == 0 or len(documents) == 0:
+        return scores
+
+    query_offsets = queries.offsets.tolist()
+    document_offsets = documents.offsets.tolist()
+    document_lengths = documents.lengths
+    max_query_tokens = max(1, max_block_size // max(1, int(document_lengths.max())))
+    for query_start, query_end in _blocks(query_offsets, max_query_tokens):
+        query_tokens = queries.embeddings[
+            query_offsets[query_start] : query_offsets[query_end]
+        ].float()
+        query_idx = torch.repeat_interleave(
+            torch.arange(query_end - query_start),
+            queries.lengths[query_start:query_end],
+        )
+        max_document_tokens = max(1, max_block_size // max(1, len(query_tokens)))
+        for document_start, document_end in _blocks(
+            document_offsets, max_document_tokens
+        ):
+            document_tokens = documents.embeddings[
+                document_offsets[document_start] : document_offsets[document_end]
+            ].float()
+            token_scores = document_tokens @ query_tokens.T
+            lengths = document_lengths[document_start:document_end]
+            document_idx = torch.repeat_interleave(
+                torch.arange(document_end - document_start), lengths
+            )
+            # the maximum over the tokens of each document, for each query token
+            max_scores = torch.full(
+                (document_end - document_start, len(query_tokens)), -torch.inf
+            ).scatter_reduce_(
+                0, document_idx[:, None].expand_as(token_scores), token_scores, "amax"
+            )
+            max_scores[lengths == 0] = 0
+            scores[query_start:query_end, document_start:document_end] = (
+                torch.zeros((document_end - document_start, query_end - query_start))
+                .index_add_(1, query_idx, max_scores)
+                .T
+            )
+    return scores
+
 
 class ColBERTWrapper(Wrapper):
     def __init__(
@@ -22,6 +205,7 @@ class ColBERTWrapper(Wrapper):
         model_name: str,
         revision: str | None = None,
         model_prompts: dict[str, str] | None = None,
+        token_embedding_dtype: torch.dtype | None = None,
         **kwargs,
     ) -> None:
         """Wrapper for ColBERT models.
@@ -33,12 +217,15 @@ class ColBERTWrapper(Wrapper):
                 First priority is given to the composed prompt of task name + prompt type (query or passage), then to the specific task prompt,
                 then to the composed prompt of task type + prompt type, then to the specific task type prompt,
                 and finally to the specific prompt type.
+            token_embedding_dtype: The dtype the token embeddings are stored in, e.g. torch.float16 to halve their memory. The similarities are
+                computed in float32 regardless. If None, the dtype of the model is kept.
             **kwargs: Additional arguments to pass to the model.
         """
         requires_package(self, "pylate", model_name, "pip install mteb[pylate]")
         from pylate import models as colbert_model
 
         self.model_name = model_name
+        self.token_embedding_dtype = token_embedding_dtype
         self.model = colbert_model.ColBERT(self.model_name, revision=revision, **kwargs)
         if (
             model_prompts is None
@@ -61,7 +248,7 @@ class ColBERTWrapper(Wrapper):
         task_name: str,
         prompt_type: PromptType | None = None,
         **kwargs: Any,
-    ) -> np.ndarray:
+    ) -> TokenEmbeddings:
         """Encodes the given sentences using the encoder.
 
         Args:
@@ -79,7 +266,7 @@ class ColBERTWrapper(Wrapper):
                 5. Specific prompt type (query or passage)
 
         Returns:
-            The encoded sentences as a numpy array.
+            The token embeddings of the sentences.
         """
         prompt_name = None
         if self.model_prompts is not None:
@@ -103,40 +290,17 @@ class ColBERTWrapper(Wrapper):
             **kwargs,
         )
 
-        # encode returns a list of tensors shaped (x, token_dim) where x is the number of tokens in the sentence
-        # we need to pad these tensors to the same length
-        # Tensors have varying lengths; therefore, they need to be padded with zeros to ensure uniformity before being combined
-        # output shape will be (batch_size, len(max(tokens)), embedding_token_dim)
-        pred = torch.nn.utils.rnn.pad_sequence(pred, batch_first=True, padding_value=0)
-
-        return pred.cpu().numpy()
+        # encode returns a list of tensors shaped (x, token_dim) where x is the number of tokens in the sentence, which are packed without
+        # padding them to the longest sentence
+        return TokenEmbeddings.from_sequences(pred, dtype=self.token_embedding_dtype)
 
-    def similarity(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
-        """Computes the max-similarity max_sim(a[i], b[j]) for all i and j.
-            Works with a Tensor of the shape (batch_size, num_tokens, token_dim)
+    def similarity(self, a: Any, b: Any) -> torch.Tensor:
+        """Computes the max-similarity max_sim(a[i], b[j]) for all i and j, see `max_sim`.
 
         Return:
             Matrix with res[i][j]  = max_sim(a[i], b[j])
         """  # noqa: D402
-        if not isinstance(a, torch.Tensor):
-            a = torch.tensor(a, dtype=torch.float32)
-
-        if not isinstance(b, torch.Tensor):
-            b = torch.tensor(b, dtype=torch.float32)
-
-        if len(a.shape) == 2:
-            a = a.unsqueeze(0)
-
-        if len(b.shape) == 2:
-            b = b.unsqueeze(0)
-
-        scores = torch.einsum(
-            "ash,bth->abst",
-            a,
-            b,
-        )
-
-        return scores.max(axis=-1).values.sum(axis=-1)
+        return max_sim(a, b)
 
 
 colbert_v2 = ModelMeta(
@@ -0,0 +1,149 @@
+"""A pool of worker processes encoding with copies of a SentenceTransformer model on CPU.
+
+Torch's intra-op threading scales poorly beyond a few cores for small models, so on CPU-only machines it is often faster to encode shards of
+the sentences in parallel, in processes with a few threads each.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing as mp
+import os
+import queue
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import torch
+from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+
+def _encode_worker(
+    model: SentenceTransformer,
+    num_threads: int,
+    input_queue: mp.Queue,
+    output_queue: mp.Queue,
+) -> None:
+    torch.set_num_threads(num_threads)
+    model = model.to("cpu")
+    while True:
+        item = input_queue.get()
+        if item is None:
+            break
+        chunk_idx, sentences, kwargs = item
+        try:
+            embeddings = model.encode(sentences, **kwargs)
+            output_queue.put((chunk_idx, embeddings, None))
+        except Exception as e:
+            output_queue.put((chunk_idx, None, repr(e)))
+
+
+class EncodePool:
+    """A persistent pool of processes, each with its own copy of the model and a fixed number of threads.
+
+    Args:
+        model: The model to encode with. It is copied to the workers once, on CPU.
+        num_processes: The number of worker processes.
+        threads_per_process: The number of torch threads of each worker. Defaults to the number of CPUs divided by the number of processes.
+    """
+
+    def __init__(
+        self,
+        model: SentenceTransformer,
+        num_processes: int,
+        threads_per_process: int | None = None,
+    ):
+        self.num_processes = num_processes
+        self.threads_per_process = threads_per_process or max(
+            1, (os.cpu_count() or 1) // num_processes
+        )
+        logger.info(
+            f"Starting {num_processes} encoding processes with {self.threads_per_process} threads each."
+        )
+        ctx = mp.get_context("spawn")
+        self.input_queue = ctx.Queue()
+        self.output_queue = ctx.Queue()
+        self.processes = [
+            ctx.Process(
+                target=_encode_worker,
+                args=(
+                    model,
+                    self.threads_per_process,
+                    self.input_queue,
+                    self.output_queue,
+                ),
+                daemon=True,
+            )
+            for _ in range(num_processes)
+        ]
+        for process in self.processes:
+            process.start()
+
+    def encode(
+        self, sentences: Sequence[str], chunk_size: int | None = None, **kwargs: Any
+    ) -> np.ndarray:
+        """Encode the sentences in shards on the workers and return the embeddings in the order of the sentences.
+
+        Args:
+            sentences: The sentences to encode.
+            chunk_size: The number of sentences per shard. Defaults to splitting the sentences into four shards per process, but no smaller
+                than the batch size.
+            **kwargs: Passed on to `SentenceTransformer.encode`.
+        """
+        if len(sentences) == 0:
+            return np.zeros((0, 0), dtype=np.float32)
+        kwargs = {
+            **kwargs,
+            "convert_to_numpy": True,
+            "convert_to_tensor": False,
+            "show_progress_bar": False,
+        }
+        if chunk_size is None:
+            chunk_size = max(
+                kwargs.get("batch_size", 32),
+                -(-len(sentences) // (4 * self.num_processes)),
+            )
+        chunks = [
+            sentences[start : start + chunk_size]
+            for start in range(0, len(sentences), chunk_size)
+        ]
+        for chunk_idx, chunk in enumerate(chunks):
+            self.input_queue.put((chunk_idx, list(chunk), kwargs))
+
+        results: list[np.ndarray | None] = [None] * len(chunks)
+        error = None
+        for _ in chunks:
+            while True:
+                try:
+                    chunk_idx, embeddings, chunk_error = self.output_queue.get(
+                        timeout=1
+                    )
+                    break
+                except queue.Empty:
+                    if not self.is_alive:
+                        raise RuntimeError(
+                            "An encoding worker process died, e.g. because it ran out of memory."
+                        )
+            results[chunk_idx] = embeddings
+            error = error or chunk_error
+        if error is not None:
+            raise RuntimeError(f"Encoding in a worker process failed: {error}")
+        return np.concatenate(results)  # type: ignore
+
+    @property
+    def is_alive(self) -> bool:
+        return len(self.processes) > 0 and all(
+            process.is_alive() for process in self.processes
+        )
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        for _ in self.processes:
+            self.input_queue.put(None)
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.processes = []
@@ -40,7 +40,7 @@ class JasperWrapper(Wrapper):
         prompt_type: PromptType | None = None,
         **kwargs: Any,
     ) -> np.ndarray:
-        task = mteb.get_task(task_name=task_name)
+        task = mteb.overview.get_task_class(task_name)
         instruction = self.get_task_instruction(task_name, prompt_type)
 
         # to passage prompts won't be applied to passages
@@ -0,0 +1,60 @@
+"""The manifest of the models in `mteb.models`.
+
+Importing all model modules creates hundreds of `ModelMeta` objects. Instead `MODEL_REGISTRY` resolves the models lazily using the manifest,
+which maps the name of each model to the module and attribute defining its metadata. After adding a model module to
+`mteb.models.overview.model_modules` or adding a model to one of them, the manifest can be regenerated using:
+
+    make build-manifests
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+
+from mteb.model_meta import ModelMeta
+
+logger = logging.getLogger(__name__)
+
+MODELS_MANIFEST_PATH = Path(__file__).parent / "models_manifest.json"
+
+
+def create_model_manifest() -> dict[str, dict[str, str]]:
+    """Create the manifest by importing all model modules.
+
+    Returns:
+        A dictionary mapping the model names to the module and attribute of their metadata. If the same model is found in multiple modules, the
+        last one is used.
+    """
+    from mteb.models.overview import model_modules
+
+    manifest = {}
+    for module_name in model_modules:
+        module = importlib.import_module(module_name)
+        for attribute, mdl in vars(module).items():
+            if isinstance(mdl, ModelMeta):
+                manifest[mdl.name] = {"module": module_name, "attribute": attribute}
+    return manifest
+
+
+def write_model_manifest(path: Path = MODELS_MANIFEST_PATH) -> None:
+    """Write the manifest in the format of the `pretty-format-json` pre-commit hook, such that the hook leaves it unchanged."""
+    path.write_text(
+        json.dumps(create_model_manifest(), indent=4) + "\n", encoding="utf-8"
+    )
+
+
+@lru_cache
+def load_model_manifest() -> dict[str, dict[str, str]]:
+    """Load the model manifest. If it does not exist, e.g. in a source checkout, it is created by importing all model modules."""
+    if not MODELS_MANIFEST_PATH.exists():
+        logger.warning(
+            f"Model manifest not found at {MODELS_MANIFEST_PATH}, importing all models instead. "
+            + "Run `make build-manifests` to create it."
+        )
+        return create_model_manifest()
+    with MODELS_MANIFEST_PATH.open(encoding="utf-8") as f:
+        return json.load(f)
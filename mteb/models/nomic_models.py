@@ -58,7 +58,7 @@ class NomicWrapper(SentenceTransformerWrapper):
             self.get_prompt_name(self.model_prompts, task_name, prompt_type)
             or PromptType.passage.value
         )
-        task = mteb.get_task(task_name)
+        task = mteb.overview.get_task_class(task_name)
         # normalization not applied to classification
         # https://github.com/nomic-ai/contrastors/blob/5f7b461e5a13b5636692d1c9f1141b27232fe966/src/contrastors/eval/mteb_eval/eval_mteb.py#L172
         normalize = task.metadata.type not in (
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Awaitable
 from functools import partial
-from typing import Any
+from typing import Any, Callable
 
 import numpy as np
-import tqdm
 
 from mteb.model_meta import ModelMeta
+from mteb.models.api_requests import APIRequestEngine, APIResponse, pack_batches
 from mteb.models.wrapper import Wrapper
 from mteb.requires_package import requires_package
 
@@ -21,10 +22,18 @@ class OpenAIWrapper(Wrapper):
         max_tokens: int,
         tokenizer_name: str = "cl100k_base",  # since all models use this tokenizer now
         embed_dim: int | None = None,
+        max_batch_tokens: int = 300_000,
+        max_concurrent_requests: int = 8,
+        max_requests_per_minute: int | None = None,
+        max_tokens_per_minute: int | None = None,
+        max_retries: int = 6,
         **kwargs,
     ) -> None:
         """Wrapper for OpenAIs embedding API.
         To handle documents larger than 8191 tokens, we truncate the document to the specified sequence length.
+
+        The batches are sent concurrently by an `APIRequestEngine`, within the rate limits reported by the API. The rate limits can also be set
+        up front using `max_requests_per_minute` and `max_tokens_per_minute`.
         """
         requires_package(
             self,
@@ -32,7 +41,7 @@ class OpenAIWrapper(Wrapper):
             model_name,
             install_instruction="pip install 'mteb[openai]'",
         )
-        from openai import OpenAI
+        from openai import AsyncOpenAI
 
         requires_package(
             self,
@@ -42,11 +51,19 @@ class OpenAIWrapper(Wrapper):
         )
         import tiktoken
 
-        self._client = OpenAI()
+        # the retries are handled by the request engine
+        self._client = AsyncOpenAI(max_retries=0)
         self._model_name = model_name
         self._embed_dim = embed_dim
         self._max_tokens = max_tokens
+        self._max_batch_tokens = max_batch_tokens
         self._encoding = tiktoken.get_encoding(tokenizer_name)
+        self._engine = APIRequestEngine(
+            max_concurrent_requests=max_concurrent_requests,
+            max_requests_per_minute=max_requests_per_minute,
+            max_tokens_per_minute=max_tokens_per_minute,
+            max_retries=max_retries,
+        )
 
     def truncate_text_tokens(self, text):
         """Truncate a string to have `max_tokens` according to the given encoding."""
@@ -63,20 +80,21 @@ class OpenAIWrapper(Wrapper):
                 "Reducing embedding size available only for text-embedding-3-* models"
             )
 
+        # each sentence is tokenized once, both to truncate it and to count its tokens for the batching and the rate limits
         trimmed_sentences = []
+        n_tokens = []
         for sentence in sentences:
             encoded_sentence = self._encoding.encode(sentence)
             if len(encoded_sentence) > self._max_tokens:
-                truncated_sentence = self.truncate_text_tokens(sentence)
-                trimmed_sentences.append(truncated_sentence)
+                encoded_sentence = encoded_sentence[: self._max_tokens]
+                trimmed_sentences.append(self._encoding.decode(encoded_sentence))
             else:
                 trimmed_sentences.append(sentence)
+            n_tokens.append(len(encoded_sentence))
 
-        max_batch_size = kwargs.get("batch_size", 2048)
-        sublists = [
-            trimmed_sentences[i : i + max_batch_size]
-            for i in range(0, len(trimmed_sentences), max_batch_size)
-        ]
+        batches = pack_batches(
+            n_tokens, kwargs.get("batch_size", 2048), self._max_batch_tokens
+        )
 
         show_progress_bar = (
             False
@@ -84,41 +102,26 @@ class OpenAIWrapper(Wrapper):
             else kwargs.pop("show_progress_bar")
         )
 
-        all_embeddings = []
-
-        for sublist in tqdm.tqdm(sublists, leave=False, disable=not show_progress_bar):
-            try:
-                response = self._client.embeddings.create(
-                    input=sublist,
+        def request(batch: range) -> Callable[[], Awaitable[APIResponse]]:
+            async def send() -> APIResponse:
+                response = await self._client.embeddings.with_raw_response.create(
+                    input=[trimmed_sentences[i] for i in batch],
                     model=self._model_name,
                     encoding_format="float",
                     dimensions=self._embed_dim or NotGiven(),
                 )
-            except Exception as e:
-                # Sleep due to too many requests
-                logger.info("Sleeping for 10 seconds due to error", e)
-                import time
-
-                time.sleep(10)
-                try:
-                    response = self._client.embeddings.create(
-                        input=sublist,
-                        model=self._model_name,
-                        encoding_format="float",
-                        dimensions=self._embed_dim or NotGiven(),
-                    )
-                except Exception as e:
-                    logger.info("Sleeping for 60 seconds due to error", e)
-                    time.sleep(60)
-                    response = self._client.embeddings.create(
-                        input=sublist,
-                        model=self._model_name,
-                        encoding_format="float",
-                        dimensions=self._embed_dim or NotGiven(),
-                    )
-            all_embeddings.extend(self._to_numpy(response))
-
-        return np.array(all_embeddings)
+                return APIResponse(self._to_numpy(response.parse()), response.headers)
+
+            return send
+
+        if not batches:
+            return np.array([])
+        embeddings = self._engine.run(
+            [request(batch) for batch in batches],
+            [sum(n_tokens[i] for i in batch) for batch in batches],
+            show_progress_bar=show_progress_bar,
+        )
+        return np.concatenate(embeddings)
 
     def _to_numpy(self, embedding_response) -> np.ndarray:
         return np.array([e.embedding for e in embedding_response.data])
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import importlib
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Mapping
 from functools import lru_cache
 from typing import Any
 
@@ -11,167 +12,116 @@ from sentence_transformers import SentenceTransformer
 from mteb.abstasks.AbsTask import AbsTask
 from mteb.encoder_interface import Encoder
 from mteb.model_meta import ModelMeta
-from mteb.models import (
-    align_models,
-    ara_models,
-    arctic_models,
-    b1ade_models,
-    bedrock_models,
-    bge_models,
-    blip2_models,
-    blip_models,
-    bm25,
-    cde_models,
-    clip_models,
-    codesage_models,
-    cohere_models,
-    cohere_v,
-    colbert_models,
-    conan_models,
-    dino_models,
-    e5_instruct,
-    e5_models,
-    e5_v,
-    evaclip_models,
-    fa_models,
-    gme_v_models,
-    google_models,
-    gritlm_models,
-    gte_models,
-    ibm_granite_models,
-    inf_models,
-    jasper_models,
-    jina_clip,
-    jina_models,
-    lens_models,
-    linq_models,
-    llm2clip_models,
-    llm2vec_models,
-    misc_models,
-    moco_models,
-    model2vec_models,
-    moka_models,
-    mxbai_models,
-    nb_sbert,
-    no_instruct_sentence_models,
-    nomic_models,
-    nomic_models_vision,
-    nvidia_models,
-    openai_models,
-    openclip_models,
-    ops_moa_models,
-    piccolo_models,
-    promptriever_models,
-    qodo_models,
-    qtack_models,
-    relle_models,
-    repllama_models,
-    rerankers_custom,
-    rerankers_monot5_based,
-    richinfoai_models,
-    ru_sentence_models,
-    salesforce_models,
-    searchmap_models,
-    seed_models,
-    sentence_transformers_models,
-    shuu_model,
-    siglip_models,
-    sonar_models,
-    stella_models,
-    text2vec_models,
-    ua_sentence_models,
-    uae_models,
-    vdr_models,
-    vista_models,
-    vlm2vec_models,
-    voyage_models,
-    voyage_v,
-)
+from mteb.models.manifest import load_model_manifest
 
 logger = logging.getLogger(__name__)
 
 model_modules = [
-    align_models,
-    arctic_models,
-    bedrock_models,
-    bge_models,
-    blip2_models,
-    blip_models,
-    bm25,
-    clip_models,
-    codesage_models,
-    cde_models,
-    cohere_models,
-    cohere_v,
-    colbert_models,
-    conan_models,
-    dino_models,
-    e5_instruct,
-    e5_models,
-    e5_v,
-    evaclip_models,
-    google_models,
-    gritlm_models,
-    gte_models,
-    ibm_granite_models,
-    inf_models,
-    jasper_models,
-    jina_models,
-    jina_clip,
-    lens_models,
-    linq_models,
-    llm2clip_models,
-    llm2vec_models,
-    misc_models,
-    model2vec_models,
-    moka_models,
-    moco_models,
-    mxbai_models,
-    no_instruct_sentence_models,
-    nomic_models,
-    nomic_models_vision,
-    nvidia_models,
-    openai_models,
-    openclip_models,
-    ops_moa_models,
-    piccolo_models,
-    gme_v_models,
-    promptriever_models,
-    qodo_models,
-    qtack_models,
-    relle_models,
-    repllama_models,
-    rerankers_custom,
-    rerankers_monot5_based,
-    richinfoai_models,
-    ru_sentence_models,
-    ua_sentence_models,
-    salesforce_models,
-    searchmap_models,
-    sentence_transformers_models,
-    shuu_model,
-    siglip_models,
-    vista_models,
-    vlm2vec_models,
-    voyage_v,
-    stella_models,
-    sonar_models,
-    text2vec_models,
-    uae_models,
-    voyage_models,
-    vdr_models,
-    fa_models,
-    ara_models,
-    b1ade_models,
-    nb_sbert,
-    seed_models,
+    "mteb.models.align_models",
+    "mteb.models.arctic_models",
+    "mteb.models.bedrock_models",
+    "mteb.models.bge_models",
+    "mteb.models.blip2_models",
+    "mteb.models.blip_models",
+    "mteb.models.bm25",
+    "mteb.models.clip_models",
+    "mteb.models.codesage_models",
+    "mteb.models.cde_models",
+    "mteb.models.cohere_models",
+    "mteb.models.cohere_v",
+    "mteb.models.colbert_models",
+    "mteb.models.conan_models",
+    "mteb.models.dino_models",
+    "mteb.models.e5_instruct",
+    "mteb.models.e5_models",
+    "mteb.models.e5_v",
+    "mteb.models.evaclip_models",
+    "mteb.models.google_models",
+    "mteb.models.gritlm_models",
+    "mteb.models.gte_models",
+    "mteb.models.ibm_granite_models",
+    "mteb.models.inf_models",
+    "mteb.models.jasper_models",
+    "mteb.models.jina_models",
+    "mteb.models.jina_clip",
+    "mteb.models.lens_models",
+    "mteb.models.linq_models",
+    "mteb.models.llm2clip_models",
+    "mteb.models.llm2vec_models",
+    "mteb.models.misc_models",
+    "mteb.models.model2vec_models",
+    "mteb.models.moka_models",
+    "mteb.models.moco_models",
+    "mteb.models.mxbai_models",
+    "mteb.models.no_instruct_sentence_models",
+    "mteb.models.nomic_models",
+    "mteb.models.nomic_models_vision",
+    "mteb.models.nvidia_models",
+    "mteb.models.openai_models",
+    "mteb.models.openclip_models",
+    "mteb.models.ops_moa_models",
+    "mteb.models.piccolo_models",
+    "mteb.models.gme_v_models",
+    "mteb.models.promptriever_models",
+    "mteb.models.qodo_models",
+    "mteb.models.qtack_models",
+    "mteb.models.relle_models",
+    "mteb.models.repllama_models",
+    "mteb.models.rerankers_custom",
+    "mteb.models.rerankers_monot5_based",
+    "mteb.models.richinfoai_models",
+    "mteb.models.ru_sentence_models",
+    "mteb.models.ua_sentence_models",
+    "mteb.models.salesforce_models",
+    "mteb.models.searchmap_models",
+    "mteb.models.sentence_transformers_models",
+    "mteb.models.shuu_model",
+    "mteb.models.siglip_models",
+    "mteb.models.vista_models",
+    "mteb.models.vlm2vec_models",
+    "mteb.models.voyage_v",
+    "mteb.models.stella_models",
+    "mteb.models.sonar_models",
+    "mteb.models.text2vec_models",
+    "mteb.models.uae_models",
+    "mteb.models.voyage_models",
+    "mteb.models.vdr_models",
+    "mteb.models.fa_models",
+    "mteb.models.ara_models",
+    "mteb.models.b1ade_models",
+    "mteb.models.nb_sbert",
+    "mteb.models.seed_models",
 ]
-MODEL_REGISTRY = {}
 
-for module in model_modules:
-    for mdl in vars(module).values():
-        if isinstance(mdl, ModelMeta):
-            MODEL_REGISTRY[mdl.name] = mdl
+
+class ModelRegistry(Mapping):
+    """A mapping from model names to model metadata, which imports the module defining a model once it is accessed.
+
+    The model names are read from the model manifest (see `mteb.models.manifest`), such that e.g. checking whether a model exists does not
+    require importing any model modules.
+    """
+
+    def __init__(self, manifest: dict[str, dict[str, str]]):
+        self.manifest = manifest
+
+    def __getitem__(self, model_name: str) -> ModelMeta:
+        entry = self.manifest[model_name]
+        return getattr(importlib.import_module(entry["module"]), entry["attribute"])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.manifest)
+
+    def __len__(self) -> int:
+        return len(self.manifest)
+
+    def __contains__(self, model_name: object) -> bool:
+        return model_name in self.manifest
+
+    def __repr__(self) -> str:
+        return f"ModelRegistry({len(self)} models)"
+
+
+MODEL_REGISTRY = ModelRegistry(load_model_manifest())
 
 
 def get_model_metas(
@@ -199,9 +149,13 @@ def get_model_metas(
     model_names = set(model_names) if model_names is not None else None
     languages = set(languages) if languages is not None else None
     frameworks = set(frameworks) if frameworks is not None else None
-    for model_meta in MODEL_REGISTRY.values():
-        if (model_names is not None) and (model_meta.name not in model_names):
-            continue
+    # only import the models which are requested
+    registry_names = (
+        [name for name in MODEL_REGISTRY if name in model_names]
+        if model_names is not None
+        else list(MODEL_REGISTRY)
+    )
+    for model_meta in (MODEL_REGISTRY[name] for name in registry_names):
         if languages is not None:
             if (model_meta.languages is None) or not (
                 languages <= set(model_meta.languages)
@@ -9,6 +9,7 @@ import torch
 from sentence_transformers import CrossEncoder, SentenceTransformer
 
 from mteb.encoder_interface import PromptType
+from mteb.models.encode_pool import EncodePool
 from mteb.models.wrapper import Wrapper
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,8 @@ class SentenceTransformerWrapper(Wrapper):
         model: str | SentenceTransformer | CrossEncoder,
         revision: str | None = None,
         model_prompts: dict[str, str] | None = None,
+        num_processes: int = 1,
+        threads_per_process: int | None = None,
         **kwargs,
     ) -> None:
         """Wrapper for SentenceTransformer models.
@@ -31,6 +34,11 @@ class SentenceTransformerWrapper(Wrapper):
                 First priority is given to the composed prompt of task name + prompt type (query or passage), then to the specific task prompt,
                 then to the composed prompt of task type + prompt type, then to the specific task type prompt,
                 and finally to the specific prompt type.
+            num_processes: The number of CPU worker processes to encode with, each with its own copy of the model. The pool is started on the
+                first call to encode and reused afterwards. Can also be set per call by passing `num_processes` in the encode kwargs. Default 1,
+                i.e. encoding in the current process.
+            threads_per_process: The number of torch threads of each worker process. Defaults to the number of CPUs divided by the number of
+                processes.
             **kwargs: Additional arguments to pass to the SentenceTransformer model.
         """
         if isinstance(model, str):
@@ -54,6 +62,9 @@ class SentenceTransformerWrapper(Wrapper):
             logger.info(f"Model prompts will be overwritten with {model_prompts}")
             self.model.prompts = model_prompts
         self.model_prompts = self.validate_task_to_prompt_name(model_prompts)
+        self.num_processes = num_processes
+        self.threads_per_process = threads_per_process
+        self._encode_pool: EncodePool | None = None
 
         if isinstance(self.model, CrossEncoder):
             self.predict = self._predict
@@ -104,16 +115,46 @@ class SentenceTransformerWrapper(Wrapper):
             )
         logger.info(f"Encoding {len(sentences)} sentences.")
 
-        embeddings = self.model.encode(
-            sentences,
-            prompt_name=prompt_name,
-            **kwargs,
-        )
+        num_processes = kwargs.pop("num_processes", self.num_processes)
+        if num_processes > 1 and isinstance(self.model, SentenceTransformer):
+            embeddings = self._get_encode_pool(num_processes).encode(
+                sentences,
+                prompt_name=prompt_name,
+                **kwargs,
+            )
+        else:
+            embeddings = self.model.encode(
+                sentences,
+                prompt_name=prompt_name,
+                **kwargs,
+            )
         if isinstance(embeddings, torch.Tensor):
             # sometimes in kwargs can be return_tensors=True
             embeddings = embeddings.cpu().detach().float().numpy()
         return embeddings
 
+    def _get_encode_pool(self, num_processes: int) -> EncodePool:
+        if (
+            self._encode_pool is None
+            or self._encode_pool.num_processes != num_processes
+            or not self._encode_pool.is_alive
+        ):
+            self.close_encode_pool()
+            self._encode_pool = EncodePool(
+                self.model, num_processes, self.threads_per_process
+            )
+        return self._encode_pool
+
+    def close_encode_pool(self) -> None:
+        """Stop the worker processes started for encoding with `num_processes` > 1."""
+        if self._encode_pool is not None:
+            self._encode_pool.close()
+            self._encode_pool = None
+
+    def __del__(self) -> None:
+        if getattr(self, "_encode_pool", None) is not None:
+            self.close_encode_pool()
+
     def _predict(
         self,
         sentences: Sequence[str],
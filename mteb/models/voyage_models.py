@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import time
-from functools import partial, wraps
-from typing import Any, Literal
+from collections.abc import Awaitable
+from functools import partial
+from typing import Any, Callable, Literal
 
 import numpy as np
 
 from mteb.encoder_interface import PromptType
 from mteb.model_meta import ModelMeta
+from mteb.models.api_requests import APIRequestEngine, APIResponse, pack_batches
 from mteb.models.wrapper import Wrapper
 from mteb.requires_package import requires_package
 
@@ -17,57 +18,6 @@ VOYAGE_TRAINING_DATA = {
 }
 
 
-def token_limit(max_tpm: int, interval: int = 60):
-    limit_interval_start_ts = time.time()
-    used_tokens = 0
-
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            nonlocal limit_interval_start_ts, used_tokens
-
-            result = func(*args, **kwargs)
-            used_tokens += result.total_tokens
-
-            current_time = time.time()
-            if current_time - limit_interval_start_ts > interval:
-                limit_interval_start_ts = current_time
-                used_tokens = 0
-
-            if used_tokens > max_tpm:
-                time.sleep(interval - (current_time - limit_interval_start_ts))
-                used_tokens = 0
-            return result
-
-        return wrapper
-
-    return decorator
-
-
-def rate_limit(max_rpm: int, interval: int = 60):
-    request_interval = interval / max_rpm
-    previous_call_ts: float | None = None
-
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            current_time = time.time()
-            nonlocal previous_call_ts
-            if (
-                previous_call_ts is not None
-                and current_time - previous_call_ts < request_interval
-            ):
-                time.sleep(request_interval - (current_time - previous_call_ts))
-
-            result = func(*args, **kwargs)
-            previous_call_ts = time.time()
-            return result
-
-        return wrapper
-
-    return decorator
-
-
 class VoyageWrapper(Wrapper):
     def __init__(
         self,
@@ -75,14 +25,22 @@ class VoyageWrapper(Wrapper):
         max_retries: int = 5,
         max_rpm: int = 300,
         max_tpm: int = 1_000_000,
+        max_concurrent_requests: int = 8,
         model_prompts: dict[str, str] | None = None,
         **kwargs,
     ) -> None:
         requires_package(self, "voyageai", model_name, "pip install 'mteb[voyageai]'")
         import voyageai
 
+        # the client is only used for tokenizing, the requests are sent by the async client, retried by the request engine
         self._client = voyageai.Client(max_retries=max_retries)
-        self._embed_func = rate_limit(max_rpm)(token_limit(max_tpm)(self._client.embed))
+        self._async_client = voyageai.AsyncClient(max_retries=0)
+        self._engine = APIRequestEngine(
+            max_concurrent_requests=max_concurrent_requests,
+            max_requests_per_minute=max_rpm,
+            max_tokens_per_minute=max_tpm,
+            max_retries=max_retries,
+        )
         self._model_name = model_name
         self._max_tpm = max_tpm
         self.model_prompts = (
@@ -109,33 +67,28 @@ class VoyageWrapper(Wrapper):
         batch_size: int,
         input_type: Literal["query", "document"],
     ) -> np.ndarray:
-        embeddings, index = [], 0
-
-        while index < len(sentences):
-            batch, batch_tokens = [], 0
-            while (
-                index < len(sentences)
-                and len(batch) < batch_size
-                and batch_tokens < self._max_tpm
-            ):
-                n_tokens = len(
-                    self._client.tokenize([sentences[index]], model=self._model_name)[0]
-                )
-                if batch_tokens + n_tokens > self._max_tpm:
-                    break
-                batch_tokens += n_tokens
-                batch.append(sentences[index])
-                index += 1
-
-            embeddings.extend(
-                self._embed_func(
-                    texts=batch,
+        n_tokens = [
+            len(tokens)
+            for tokens in self._client.tokenize(sentences, model=self._model_name)
+        ]
+        batches = pack_batches(n_tokens, batch_size, self._max_tpm)
+
+        def request(batch: range) -> Callable[[], Awaitable[APIResponse]]:
+            async def send() -> APIResponse:
+                response = await self._async_client.embed(
+                    texts=[sentences[i] for i in batch],
                     model=self._model_name,
                     input_type=input_type,
-                ).embeddings
-            )
+                )
+                return APIResponse(response.embeddings)
 
-        return np.array(embeddings)
+            return send
+
+        embeddings = self._engine.run(
+            [request(batch) for batch in batches],
+            [sum(n_tokens[i] for i in batch) for batch in batches],
+        )
+        return np.array([embedding for batch in embeddings for embedding in batch])
 
 
 model_prompts = {
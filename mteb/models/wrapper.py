@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Callable, get_args
 
 import mteb
@@ -10,6 +11,46 @@ from mteb.encoder_interface import PromptType
 logger = logging.getLogger(__name__)
 
 
+@lru_cache
+def _get_instruction(task_name: str, prompt_type: PromptType | None) -> str:
+    # the instruction only depends on the task metadata, so it is resolved once per task and prompt type instead of on every encode call
+    task = mteb.overview.get_task_class(task_name)
+    task_metadata = task.metadata
+    if isinstance(task_metadata.prompt, dict) and prompt_type:
+        if task_metadata.prompt.get(prompt_type.value):
+            return task_metadata.prompt[prompt_type.value]
+        logger.warning(
+            f"Prompt type '{prompt_type}' not found in task metadata for task '{task_name}'."
+        )
+        return ""
+    if task_metadata.prompt:
+        return task_metadata.prompt
+    return task.abstask_prompt
+
+
+@lru_cache
+def _get_prompt_name(
+    prompt_names: frozenset[str], task_name: str, prompt_type: PromptType | None
+) -> str | None:
+    task_type = mteb.overview.get_task_class(task_name).metadata.type
+    prompt_type_value = prompt_type.value if prompt_type else None
+
+    if task_name and prompt_type and f"{task_name}-{prompt_type_value}" in prompt_names:
+        return f"{task_name}-{prompt_type_value}"
+    if task_name and task_name in prompt_names:
+        return task_name
+    if task_type and prompt_type and f"{task_type}-{prompt_type_value}" in prompt_names:
+        return f"{task_type}-{prompt_type_value}"
+    if task_type and task_type in prompt_names:
+        return task_type
+    if prompt_type and prompt_type_value in prompt_names:
+        return prompt_type_value
+    logger.info(
+        "No combination of task name and prompt type was found in model prompts."
+    )
+    return None
+
+
 class Wrapper:
     """Base class to indicate that this is a wrapper for a model.
     Also contains some utility functions for wrappers for working with prompts and instructions.
@@ -37,32 +78,8 @@ class Wrapper:
             task_name: The task name to use for building the encoding prompt
             prompt_type: The prompt type (e.g. "query" | "passage") to use for building the encoding prompt
         """
-        task = mteb.get_task(task_name=task_name)
-        task_type = task.metadata.type
-        prompt_type_value = prompt_type.value if prompt_type else None
-
-        if (
-            task_name
-            and prompt_type
-            and f"{task_name}-{prompt_type_value}" in task_to_prompt
-        ):
-            return f"{task_name}-{prompt_type_value}"
-        if task_name and task_name in task_to_prompt:
-            return task_name
-        if (
-            task_type
-            and prompt_type
-            and f"{task_type}-{prompt_type_value}" in task_to_prompt
-        ):
-            return f"{task_type}-{prompt_type_value}"
-        if task_type and task_type in task_to_prompt:
-            return task_type
-        if prompt_type and prompt_type_value in task_to_prompt:
-            return prompt_type_value
-        logger.info(
-            "No combination of task name and prompt type was found in model prompts."
-        )
-        return None
+        # the prompt name only depends on which prompts the model has, so it is resolved once per set of prompts, task and prompt type
+        return _get_prompt_name(frozenset(task_to_prompt or ()), task_name, prompt_type)
 
     @staticmethod
     def validate_task_to_prompt_name(
@@ -80,7 +97,7 @@ class Wrapper:
                     logger.warning(msg)
                     raise KeyError(msg)
             if task_name not in task_types and task_name not in prompt_types:
-                task = mteb.get_task(task_name=task_name)
+                task = mteb.overview.get_task_class(task_name)
                 if not task:
                     msg = f"Task name {task_name} is not valid. Valid task names are task types [{task_types}], prompt types [{prompt_types}] and task names"
                     logger.warning(msg)
@@ -90,18 +107,7 @@ class Wrapper:
     @staticmethod
     def get_instruction(task_name: str, prompt_type: PromptType | None) -> str:
         """Get the instruction/prompt to be used for encoding sentences."""
-        task = mteb.get_task(task_name=task_name)
-        task_metadata = task.metadata
-        if isinstance(task_metadata.prompt, dict) and prompt_type:
-            if task_metadata.prompt.get(prompt_type.value):
-                return task_metadata.prompt[prompt_type.value]
-            logger.warning(
-                f"Prompt type '{prompt_type}' not found in task metadata for task '{task_name}'."
-            )
-            return ""
-        if task_metadata.prompt:
-            return task_metadata.prompt
-        return task.abstask_prompt
+        return _get_instruction(task_name, prompt_type)
 
     def format_instruction(
         self, instruction: str, prompt_type: PromptType | None = None
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import difflib
+import importlib
 import logging
 from collections import Counter, defaultdict
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from typing import Any
 
 import pandas as pd
 
@@ -17,7 +21,7 @@ from mteb.languages import (
     path_to_lang_codes,
     path_to_lang_scripts,
 )
-from mteb.tasks import *  # import all tasks
+from mteb.tasks.manifest import import_task_modules, load_task_manifest
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +30,7 @@ logger = logging.getLogger(__name__)
 
 
 def create_task_list() -> list[type[AbsTask]]:
+    import_task_modules()  # tasks are imported lazily, so import all of them before collecting the subclasses
     tasks_categories_cls = list(AbsTask.__subclasses__())
     tasks = [
         cls
@@ -41,22 +46,48 @@ def create_name_to_task_mapping() -> dict[str, type[AbsTask]]:
     return {cls.metadata.name: cls for cls in tasks}
 
 
+class TaskRegistry(Mapping):
+    """A mapping from task names to task classes, which imports the module of a task once it is accessed.
+
+    The task names are read from the task manifest (see `mteb.tasks.manifest`), such that e.g. checking whether a task exists does not require
+    importing any tasks.
+    """
+
+    def __init__(self, manifest: dict[str, dict[str, Any]]):
+        self.manifest = manifest
+
+    def __getitem__(self, task_name: str) -> type[AbsTask]:
+        entry = self.manifest[task_name]
+        return getattr(importlib.import_module(entry["module"]), entry["class"])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.manifest)
+
+    def __len__(self) -> int:
+        return len(self.manifest)
+
+    def __contains__(self, task_name: object) -> bool:
+        return task_name in self.manifest
+
+    def __repr__(self) -> str:
+        return f"TaskRegistry({len(self)} tasks)"
+
+
 def create_similar_tasks() -> dict[str, list[str]]:
     """Create a dictionary of similar tasks.
 
     Returns:
         Dict with key is parent task and value is list of similar tasks.
     """
-    tasks = create_task_list()
     similar_tasks = defaultdict(list)
-    for task in tasks:
-        if task.metadata.adapted_from:
-            for similar_task in task.metadata.adapted_from:
-                similar_tasks[similar_task].append(task.metadata.name)
+    for task_name, entry in load_task_manifest().items():
+        if entry["adapted_from"]:
+            for similar_task in entry["adapted_from"]:
+                similar_tasks[similar_task].append(task_name)
     return similar_tasks
 
 
-TASKS_REGISTRY = create_name_to_task_mapping()
+TASKS_REGISTRY = TaskRegistry(load_task_manifest())
 SIMILAR_TASKS = create_similar_tasks()
 
 
@@ -142,6 +173,54 @@ def filter_aggregate_tasks(tasks: list[AbsTask]) -> list[AbsTask]:
     return [t for t in tasks if not t.is_aggregate]
 
 
+def filter_task_names_by_manifest(
+    languages: list[str] | None = None,
+    script: list[str] | None = None,
+    domains: list[TASK_DOMAIN] | None = None,
+    task_types: list[TASK_TYPE] | None = None,
+    categories: list[TASK_CATEGORY] | None = None,
+    exclude_superseded: bool = True,
+    modalities: list[MODALITIES] | None = None,
+    exclusive_modality_filter: bool = False,
+    exclude_aggregate: bool = False,
+) -> list[str]:
+    """Returns the names of the tasks which pass the filters, using the task manifest such that no tasks have to be imported.
+
+    The filters correspond to the task level filters used in `get_tasks` (e.g. `filter_tasks_by_languages`).
+    """
+    _languages = set(languages) if languages else None
+    _scripts = set(script) if script else None
+    _domains = set(domains) if domains else None
+    _task_types = set(task_types) if task_types else None
+    _categories = set(categories) if categories else None
+    _modalities = set(modalities) if modalities else None
+
+    task_names = []
+    for name, entry in load_task_manifest().items():
+        if _languages and not _languages.intersection(entry["languages"]):
+            continue
+        if _scripts and not _scripts.intersection(entry["scripts"]):
+            continue
+        if _domains and not _domains.intersection(entry["domains"] or []):
+            continue
+        if _task_types and entry["type"] not in _task_types:
+            continue
+        if _categories and entry["category"] not in _categories:
+            continue
+        if exclude_superseded and entry["superseded_by"] is not None:
+            continue
+        if _modalities:
+            if exclusive_modality_filter:
+                if set(entry["modalities"]) != _modalities:
+                    continue
+            elif not _modalities.intersection(entry["modalities"]):
+                continue
+        if exclude_aggregate and entry["is_aggregate"]:
+            continue
+        task_names.append(name)
+    return task_names
+
+
 class MTEBTasks(tuple):
     def __repr__(self) -> str:
         return "MTEBTasks" + super().__repr__()
@@ -337,9 +416,23 @@ def get_tasks(
         ]
         return MTEBTasks(_tasks)
 
+    # only the tasks which pass the filters on the manifest are imported and initialized
+    task_names = filter_task_names_by_manifest(
+        languages=languages,
+        script=script,
+        domains=domains,
+        task_types=task_types,
+        categories=categories,
+        exclude_superseded=exclude_superseded,
+        modalities=modalities,
+        exclusive_modality_filter=exclusive_modality_filter,
+        exclude_aggregate=exclude_aggregate,
+    )
     _tasks = [
-        cls().filter_languages(languages, script).filter_eval_splits(eval_splits)
-        for cls in create_task_list()
+        TASKS_REGISTRY[name]()
+        .filter_languages(languages, script)
+        .filter_eval_splits(eval_splits)
+        for name in task_names
     ]
 
     if languages:
@@ -367,6 +460,37 @@ def get_tasks(
     return MTEBTasks(_tasks)
 
 
+@lru_cache
+def get_task_class(task_name: str) -> type[AbsTask]:
+    """Get the class of a task by name without initializing it.
+
+    The lookup is cached, which makes it suitable for code which is called often, e.g. within `encode`. The class, including its metadata, is
+    shared and should be treated as read-only.
+
+    Args:
+        task_name: The name of the task to fetch.
+
+    Returns:
+        The task class.
+
+    Examples:
+        >>> get_task_class("BornholmBitextMining").metadata.type
+        'BitextMining'
+    """
+    if task_name not in TASKS_REGISTRY:
+        close_matches = difflib.get_close_matches(task_name, TASKS_REGISTRY.keys())
+        if close_matches:
+            suggestion = (
+                f"KeyError: '{task_name}' not found. Did you mean: {close_matches[0]}?"
+            )
+        else:
+            suggestion = (
+                f"KeyError: '{task_name}' not found and no similar keys were found."
+            )
+        raise KeyError(suggestion)
+    return TASKS_REGISTRY[task_name]
+
+
 def get_task(
     task_name: str,
     languages: list[str] | None = None,
@@ -400,18 +524,7 @@ def get_task(
     Examples:
         >>> get_task("BornholmBitextMining")
     """
-    if task_name not in TASKS_REGISTRY:
-        close_matches = difflib.get_close_matches(task_name, TASKS_REGISTRY.keys())
-        if close_matches:
-            suggestion = (
-                f"KeyError: '{task_name}' not found. Did you mean: {close_matches[0]}?"
-            )
-        else:
-            suggestion = (
-                f"KeyError: '{task_name}' not found and no similar keys were found."
-            )
-        raise KeyError(suggestion)
-    task = TASKS_REGISTRY[task_name]()
+    task = get_task_class(task_name)()
     if eval_splits:
         task.filter_eval_splits(eval_splits=eval_splits)
     if modalities:
@@ -1,27 +1,34 @@
 from __future__ import annotations
 
-from .dan.BornholmskBitextMining import *
-from .eng.PubChemSMILESBitextMining import *
-from .fas.FaMTEBSummaryRetrieval import *
-from .kat.TbilisiCityHallBitextMining import *
-from .multilingual.BibleNLPBitextMining import *
-from .multilingual.BUCCBitextMining import *
-from .multilingual.BUCCBitextMiningFast import *
-from .multilingual.DiaBLaBitextMining import *
-from .multilingual.FloresBitextMining import *
-from .multilingual.IN22ConvBitextMining import *
-from .multilingual.IN22GenBitextMining import *
-from .multilingual.IndicGenBenchFloresBitextMining import *
-from .multilingual.IWSLT2017BitextMining import *
-from .multilingual.LinceMTBitextMining import *
-from .multilingual.NollySentiBitextMining import *
-from .multilingual.NorwegianCourtsBitextMining import *
-from .multilingual.NTREXBitextMining import *
-from .multilingual.NusaTranslationBitextMining import *
-from .multilingual.NusaXBitextMining import *
-from .multilingual.PhincBitextMining import *
-from .multilingual.RomaTalesBitextMining import *
-from .multilingual.TatoebaBitextMining import *
-from .multilingual.WebFAQBitextMining import *
-from .srn.SRNCorpusBitextMining import *
-from .vie.VieMedEVBitextMining import *
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .dan.BornholmskBitextMining import *
+    from .eng.PubChemSMILESBitextMining import *
+    from .fas.FaMTEBSummaryRetrieval import *
+    from .kat.TbilisiCityHallBitextMining import *
+    from .multilingual.BibleNLPBitextMining import *
+    from .multilingual.BUCCBitextMining import *
+    from .multilingual.BUCCBitextMiningFast import *
+    from .multilingual.DiaBLaBitextMining import *
+    from .multilingual.FloresBitextMining import *
+    from .multilingual.IN22ConvBitextMining import *
+    from .multilingual.IN22GenBitextMining import *
+    from .multilingual.IndicGenBenchFloresBitextMining import *
+    from .multilingual.IWSLT2017BitextMining import *
+    from .multilingual.LinceMTBitextMining import *
+    from .multilingual.NollySentiBitextMining import *
+    from .multilingual.NorwegianCourtsBitextMining import *
+    from .multilingual.NTREXBitextMining import *
+    from .multilingual.NusaTranslationBitextMining import *
+    from .multilingual.NusaXBitextMining import *
+    from .multilingual.PhincBitextMining import *
+    from .multilingual.RomaTalesBitextMining import *
+    from .multilingual.TatoebaBitextMining import *
+    from .multilingual.WebFAQBitextMining import *
+    from .srn.SRNCorpusBitextMining import *
+    from .vie.VieMedEVBitextMining import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
@@ -1,5 +1,12 @@
 from __future__ import annotations
 
-from .eng.BLINKIT2IMultiChoice import *
-from .eng.BLINKIT2TMultiChoice import *
-from .eng.CVBench import *
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .eng.BLINKIT2IMultiChoice import *
+    from .eng.BLINKIT2TMultiChoice import *
+    from .eng.CVBench import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
@@ -1,5 +1,12 @@
 from __future__ import annotations
 
-from .eng.CIFAR import *
-from .eng.ImageNet import *
-from .eng.TinyImageNet import *
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .eng.CIFAR import *
+    from .eng.ImageNet import *
+    from .eng.TinyImageNet import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
@@ -1,3 +1,10 @@
 from __future__ import annotations
 
-from .eng.PascalVOC2007 import *
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .eng.PascalVOC2007 import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
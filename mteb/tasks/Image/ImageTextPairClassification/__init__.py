@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from .AROCocoOrder import *
-from .AROFlickrOrder import *
-from .AROVisualAttribution import *
-from .AROVisualRelation import *
-from .ImageCoDe import *
-from .SugarCrepe import *
-from .Winoground import *
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .AROCocoOrder import *
+    from .AROFlickrOrder import *
+    from .AROVisualAttribution import *
+    from .AROVisualRelation import *
+    from .ImageCoDe import *
+    from .SugarCrepe import *
+    from .Winoground import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
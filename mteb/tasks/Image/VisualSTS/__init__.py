@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from .eng.STS12VisualSTS import *
-from .eng.STS13VisualSTS import *
-from .eng.STS14VisualSTS import *
-from .eng.STS15VisualSTS import *
-from .eng.STS16VisualSTS import *
-from .multilingual.STS17MultilingualVisualSTS import *
-from .multilingual.STSBenchmarkMultilingualVisualSTS import *
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .eng.STS12VisualSTS import *
+    from .eng.STS13VisualSTS import *
+    from .eng.STS14VisualSTS import *
+    from .eng.STS15VisualSTS import *
+    from .eng.STS16VisualSTS import *
+    from .multilingual.STS17MultilingualVisualSTS import *
+    from .multilingual.STSBenchmarkMultilingualVisualSTS import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from .Any2AnyMultiChoice import *
-from .Any2AnyRetrieval import *
-from .ImageClassification import *
-from .ImageClustering import *
-from .ImageMultilabelClassification import *
-from .ImageTextPairClassification import *
-from .VisualSTS import *
-from .ZeroShotClassification import *
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .Any2AnyMultiChoice import *
+    from .Any2AnyRetrieval import *
+    from .ImageClassification import *
+    from .ImageClustering import *
+    from .ImageMultilabelClassification import *
+    from .ImageTextPairClassification import *
+    from .VisualSTS import *
+    from .ZeroShotClassification import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from .eng.Core17InstructionRetrieval import *
-from .eng.News21InstructionRetrieval import *
-from .eng.Robust04InstructionRetrieval import *
-from .multilingual.mFollowIR import *
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .eng.Core17InstructionRetrieval import *
+    from .eng.News21InstructionRetrieval import *
+    from .eng.Robust04InstructionRetrieval import *
+    from .multilingual.mFollowIR import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from .kor.KorHateSpeechMLClassification import *
-from .mlt.MalteseNewsClassification import *
-from .multilingual.MultiEURLEXMultilabelClassification import *
-from .por.BrazilianToxicTweetsClassification import *
-from .rus.CEDRClassification import *
-from .rus.ru_toixic_multilabelclassification_okmlcup import *
-from .rus.SensitiveTopicsClassification import *
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .kor.KorHateSpeechMLClassification import *
+    from .mlt.MalteseNewsClassification import *
+    from .multilingual.MultiEURLEXMultilabelClassification import *
+    from .por.BrazilianToxicTweetsClassification import *
+    from .rus.CEDRClassification import *
+    from .rus.ru_toixic_multilabelclassification_okmlcup import *
+    from .rus.SensitiveTopicsClassification import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
@@ -1,29 +1,36 @@
 from __future__ import annotations
 
-from .ara.ArEntail import *
-from .ces.CTKFactsNLI import *
-from .deu.FalseFriendsDeEnPC import *
-from .eng.LegalBenchPC import *
-from .eng.PubChemAISentenceParaphrasePC import *
-from .eng.PubChemSMILESPC import *
-from .eng.PubChemSynonymPC import *
-from .eng.PubChemWikiParagraphsPC import *
-from .eng.SprintDuplicateQuestionsPC import *
-from .eng.TwitterSemEval2015PC import *
-from .eng.TwitterURLCorpusPC import *
-from .fas.FaMTEBPairClassification import *
-from .fas.FarsTail import *
-from .hye.ArmenianParaphrasePC import *
-from .ind.IndoNLI import *
-from .kor.KlueNLI import *
-from .multilingual.OpusparcusPC import *
-from .multilingual.PawsXPairClassification import *
-from .multilingual.PubChemWikiPairClassification import *
-from .multilingual.RTE3 import *
-from .multilingual.XNLI import *
-from .multilingual.XStance import *
-from .pol.PolishPC import *
-from .por.Assin2RTE import *
-from .por.SickBrPC import *
-from .rus.TERRa import *
-from .zho.CMTEBPairClassification import *
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .ara.ArEntail import *
+    from .ces.CTKFactsNLI import *
+    from .deu.FalseFriendsDeEnPC import *
+    from .eng.LegalBenchPC import *
+    from .eng.PubChemAISentenceParaphrasePC import *
+    from .eng.PubChemSMILESPC import *
+    from .eng.PubChemSynonymPC import *
+    from .eng.PubChemWikiParagraphsPC import *
+    from .eng.SprintDuplicateQuestionsPC import *
+    from .eng.TwitterSemEval2015PC import *
+    from .eng.TwitterURLCorpusPC import *
+    from .fas.FaMTEBPairClassification import *
+    from .fas.FarsTail import *
+    from .hye.ArmenianParaphrasePC import *
+    from .ind.IndoNLI import *
+    from .kor.KlueNLI import *
+    from .multilingual.OpusparcusPC import *
+    from .multilingual.PawsXPairClassification import *
+    from .multilingual.PubChemWikiPairClassification import *
+    from .multilingual.RTE3 import *
+    from .multilingual.XNLI import *
+    from .multilingual.XStance import *
+    from .pol.PolishPC import *
+    from .por.Assin2RTE import *
+    from .por.SickBrPC import *
+    from .rus.TERRa import *
+    from .zho.CMTEBPairClassification import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
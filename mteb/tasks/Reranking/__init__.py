@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-from .ara.NamaaMrTydiReranking import *
-from .eng.AskUbuntuDupQuestions import *
-from .eng.BuiltBenchReranking import *
-from .eng.MindSmallReranking import *
-from .eng.SciDocsReranking import *
-from .eng.StackOverflowDupQuestions import *
-from .eng.WebLINXCandidatesReranking import *
-from .fra.AlloprofReranking import *
-from .fra.SyntecReranking import *
-from .jpn.MMarcoReranking import *
-from .multilingual.ESCIReranking import *
-from .multilingual.MIRACLReranking import *
-from .multilingual.WikipediaRerankingMultilingual import *
-from .rus.RuBQReranking import *
-from .zho.CMTEBReranking import *
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .ara.NamaaMrTydiReranking import *
+    from .eng.AskUbuntuDupQuestions import *
+    from .eng.BuiltBenchReranking import *
+    from .eng.MindSmallReranking import *
+    from .eng.SciDocsReranking import *
+    from .eng.StackOverflowDupQuestions import *
+    from .eng.WebLINXCandidatesReranking import *
+    from .fra.AlloprofReranking import *
+    from .fra.SyntecReranking import *
+    from .jpn.MMarcoReranking import *
+    from .multilingual.ESCIReranking import *
+    from .multilingual.MIRACLReranking import *
+    from .multilingual.WikipediaRerankingMultilingual import *
+    from .rus.RuBQReranking import *
+    from .zho.CMTEBReranking import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
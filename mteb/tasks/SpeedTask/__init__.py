@@ -1,4 +1,11 @@
 from __future__ import annotations
 
-from .CPUSpeedTask import *
-from .GPUSpeedTask import *
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .CPUSpeedTask import *
+    from .GPUSpeedTask import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
@@ -1,4 +1,11 @@
 from __future__ import annotations
 
-from .eng.SummEvalSummarization import *
-from .fra.SummEvalFrSummarization import *
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .eng.SummEvalSummarization import *
+    from .fra.SummEvalFrSummarization import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
@@ -1,22 +1,29 @@
 from __future__ import annotations
 
-from .aggregated_tasks import *
-from .BitextMining import *
-from .Classification import *
-from .Clustering import *
-from .Image.Any2AnyMultiChoice import *
-from .Image.Any2AnyRetrieval import *
-from .Image.ImageClassification import *
-from .Image.ImageClustering import *
-from .Image.ImageMultilabelClassification import *
-from .Image.ImageTextPairClassification import *
-from .Image.VisualSTS import *
-from .Image.ZeroShotClassification import *
-from .InstructionRetrieval import *
-from .MultiLabelClassification import *
-from .PairClassification import *
-from .Reranking import *
-from .Retrieval import *
-from .SpeedTask import *
-from .STS import *
-from .Summarization import *
+from typing import TYPE_CHECKING
+
+from .manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .aggregated_tasks import *
+    from .BitextMining import *
+    from .Classification import *
+    from .Clustering import *
+    from .Image.Any2AnyMultiChoice import *
+    from .Image.Any2AnyRetrieval import *
+    from .Image.ImageClassification import *
+    from .Image.ImageClustering import *
+    from .Image.ImageMultilabelClassification import *
+    from .Image.ImageTextPairClassification import *
+    from .Image.VisualSTS import *
+    from .Image.ZeroShotClassification import *
+    from .InstructionRetrieval import *
+    from .MultiLabelClassification import *
+    from .PairClassification import *
+    from .Reranking import *
+    from .Retrieval import *
+    from .SpeedTask import *
+    from .STS import *
+    from .Summarization import *
+
+__getattr__, __dir__ = lazy_task_package(__name__)
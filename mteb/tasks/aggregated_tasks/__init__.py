@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-from .CQADupStackNLRetrieval import CQADupstackNLRetrieval
-from .CQADupStackRetrieval import CQADupstackRetrieval
-from .CQADupStackRetrievalFa import CQADupstackRetrievalFa
-from .STS17MultilingualVisualSTS import (
-    STS17MultilingualVisualSTSEng,
-    STS17MultilingualVisualSTSMultilingual,
-)
-from .STSBenchmarkMultilingualVisualSTS import (
-    STSBenchmarkMultilingualVisualSTSEng,
-    STSBenchmarkMultilingualVisualSTSMultilingual,
-)
-from .SynPerChatbotConvSAClassification import SynPerChatbotConvSAClassification
+from typing import TYPE_CHECKING
+
+from mteb.tasks.manifest import lazy_task_package
+
+if TYPE_CHECKING:
+    from .CQADupStackNLRetrieval import CQADupstackNLRetrieval
+    from .CQADupStackRetrieval import CQADupstackRetrieval
+    from .CQADupStackRetrievalFa import CQADupstackRetrievalFa
+    from .STS17MultilingualVisualSTS import (
+        STS17MultilingualVisualSTSEng,
+        STS17MultilingualVisualSTSMultilingual,
+    )
+    from .STSBenchmarkMultilingualVisualSTS import (
+        STSBenchmarkMultilingualVisualSTSEng,
+        STSBenchmarkMultilingualVisualSTSMultilingual,
+    )
+    from .SynPerChatbotConvSAClassification import SynPerChatbotConvSAClassification
 
 __all__ = [
     "CQADupstackRetrieval",
@@ -23,3 +28,5 @@ __all__ = [
     "STSBenchmarkMultilingualVisualSTSEng",
     "STSBenchmarkMultilingualVisualSTSMultilingual",
 ]
+
+__getattr__, __dir__ = lazy_task_package(__name__)
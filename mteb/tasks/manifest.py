@@ -0,0 +1,158 @@
+"""The manifest of the tasks in `mteb.tasks`.
+
+Importing every task module creates hundreds of `TaskMetadata` objects, which used to dominate the time it takes to `import mteb`. Instead the
+task packages resolve their tasks lazily using the manifest, which maps the name of each task to the module defining it along with the metadata
+used by `mteb.get_tasks` for filtering. This way a task module is only imported once the task is requested.
+
+The registered task modules are the ones imported in the `__init__.py` of the task packages. After adding a task or changing its metadata the
+manifest can be regenerated using:
+
+    make build-manifests
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib
+import json
+import logging
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from mteb.abstasks.AbsTask import AbsTask
+
+logger = logging.getLogger(__name__)
+
+TASKS_PACKAGE = "mteb.tasks"
+TASKS_MANIFEST_PATH = Path(__file__).parent / "tasks_manifest.json"
+
+
+def _package_path(package: str) -> Path:
+    return Path(__file__).parent.joinpath(*package.split(".")[2:])
+
+
+@lru_cache
+def registered_task_modules(package: str = TASKS_PACKAGE) -> tuple[str, ...]:
+    """The task modules registered in a task package, i.e. the modules imported in the `__init__.py` of the package and its subpackages."""
+    init_file = _package_path(package) / "__init__.py"
+    modules = []
+    for node in ast.walk(ast.parse(init_file.read_text(encoding="utf-8"))):
+        if not isinstance(node, ast.ImportFrom) or node.level != 1 or not node.module:
+            continue
+        module = f"{package}.{node.module}"
+        if (_package_path(module) / "__init__.py").exists():
+            modules.extend(registered_task_modules(module))
+        else:
+            modules.append(module)
+    return tuple(dict.fromkeys(modules))
+
+
+def import_task_modules(package: str = TASKS_PACKAGE) -> None:
+    """Import all task modules registered in the package."""
+    for module in registered_task_modules(package):
+        importlib.import_module(module)
+
+
+def _manifest_entry(task: type[AbsTask]) -> dict[str, Any]:
+    from mteb.abstasks.aggregated_task import AbsTaskAggregate
+
+    def _sorted(values: list[str] | None) -> list[str] | None:
+        # the metadata of aggregated tasks is collected using sets, so it is sorted to keep the manifest stable
+        return sorted(values) if values is not None else None
+
+    metadata = task.metadata
+    return {
+        "module": task.__module__,
+        "class": task.__name__,
+        "type": metadata.type,
+        "category": metadata.category,
+        "languages": metadata.languages,
+        "scripts": sorted(metadata.scripts),
+        "domains": _sorted(metadata.domains),
+        "modalities": _sorted(metadata.modalities),
+        "superseded_by": task.superseded_by,
+        "is_aggregate": issubclass(task, AbsTaskAggregate),
+        "adapted_from": _sorted(metadata.adapted_from),
+    }
+
+
+def create_task_manifest() -> dict[str, dict[str, Any]]:
+    """Create the manifest by importing all registered task modules.
+
+    Returns:
+        A dictionary mapping the task names to their manifest entry, in the order of `mteb.overview.create_task_list`.
+    """
+    from mteb.overview import create_task_list
+
+    return {
+        task.metadata.name: _manifest_entry(task)
+        for task in create_task_list()
+        if task.__module__.startswith(
+            TASKS_PACKAGE + "."
+        )  # e.g. not tasks defined in tests
+    }
+
+
+def write_task_manifest(path: Path = TASKS_MANIFEST_PATH) -> None:
+    """Write the manifest in the format of the `pretty-format-json` pre-commit hook, such that the hook leaves it unchanged."""
+    path.write_text(
+        json.dumps(create_task_manifest(), indent=4) + "\n", encoding="utf-8"
+    )
+
+
+@lru_cache
+def load_task_manifest() -> dict[str, dict[str, Any]]:
+    """Load the task manifest. If it does not exist, e.g. in a source checkout, it is created by importing all tasks."""
+    if not TASKS_MANIFEST_PATH.exists():
+        logger.warning(
+            f"Task manifest not found at {TASKS_MANIFEST_PATH}, importing all tasks instead. "
+            + "Run `make build-manifests` to create it."
+        )
+        return create_task_manifest()
+    with TASKS_MANIFEST_PATH.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache
+def _task_classes_in_package(package: str) -> dict[str, str]:
+    prefix = package + "."
+    return {
+        entry["class"]: entry["module"]
+        for entry in load_task_manifest().values()
+        if entry["module"].startswith(prefix)
+    }
+
+
+def lazy_task_package(
+    package: str,
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create the module level `__getattr__` and `__dir__` of a task package, such that its tasks are imported on first access.
+
+    Args:
+        package: The name of the task package, i.e. `__name__` of the package.
+
+    Examples:
+        >>> __getattr__, __dir__ = lazy_task_package(__name__)
+    """
+
+    def __getattr__(name: str) -> Any:
+        task_classes = _task_classes_in_package(package)
+        if name == "__all__":
+            return sorted(task_classes)
+        if name in task_classes:
+            return getattr(importlib.import_module(task_classes[name]), name)
+        if not name.startswith("__"):
+            # objects which are not tasks, e.g. helper functions, can only be found by importing the registered modules
+            for module_name in registered_task_modules(package):
+                module = importlib.import_module(module_name)
+                if hasattr(module, name):
+                    return getattr(module, name)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *_task_classes_in_package(package)})
+
+    return __getattr__, __dir__
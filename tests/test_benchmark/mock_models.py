@@ -43,6 +43,47 @@ class MockTorchbf16Encoder(SentenceTransformer):
         return torch.randn(len(sentences), 10, dtype=torch.bfloat16)
 
 
+class MockHashEncoder(mteb.Encoder):
+    """Embeds each sentence by a hash of its text, such that a sentence has the same embedding in every call, and records the sentences of
+    each call. Images are embedded by their mean pixel values, recording the number of images of each call.
+    """
+
+    def __init__(self, embed_dim: int = 8):
+        self.embed_dim = embed_dim
+        self.calls: list[list[str]] = []
+        self.image_calls: list[int] = []
+
+    @property
+    def n_calls(self) -> int:
+        return len(self.calls)
+
+    @property
+    def n_encoded(self) -> int:
+        return sum(len(sentences) for sentences in self.calls)
+
+    def encode(self, sentences, **kwargs):
+        self.calls.append(list(sentences))
+        return np.stack(
+            [
+                np.random.default_rng(abs(hash(sentence)) % 2**32).standard_normal(
+                    self.embed_dim
+                )
+                for sentence in sentences
+            ]
+        ).astype(np.float32)
+
+    def get_image_embeddings(self, images, batch_size: int = 32, **kwargs):
+        embeddings = np.stack(
+            [
+                image.float().mean(dim=(1, 2)).numpy()
+                for batch in images
+                for image in batch
+            ]
+        )
+        self.image_calls.append(len(embeddings))
+        return embeddings
+
+
 class MockCLIPEncoder:
     mteb_model_meta = ModelMeta(
         name="mock/MockCLIPModel",
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
+import datasets
 import numpy as np
 import pytest
 import torch
+from datasets import Dataset, DatasetDict
 from sentence_transformers import SentenceTransformer
 
 import mteb
 import mteb.overview
+from mteb.abstasks import AbsTask
 from mteb.create_meta import generate_readme
 from mteb.evaluation.MTEB import logger
 
@@ -26,6 +31,7 @@ from .mock_models import (
     MockTorchEncoder,
 )
 from .mock_tasks import (
+    MockClassificationTask,
     MockImageClusteringTask,
     MockImageTextPairClassificationTask,
     MockInstructionRetrival,
@@ -404,3 +410,94 @@ def test_task_modality_filtering_model_modalities_more_than_task_modalities(task
         output_folder="tests/results",
         overwrite_results=True,
     )
+
+
+@pytest.mark.parametrize("model", [MockNumpyEncoder()])
+def test_run_with_approximate_search_backend(model: mteb.Encoder, tmp_path: Path):
+    """Test that all tasks accept a search backend and that retrieval tasks report its recall against exact search."""
+    eval = mteb.MTEB(tasks=MOCK_TASK_TEST_GRID)
+    results = eval.run(
+        model,
+        output_folder=tmp_path.as_posix(),
+        overwrite_results=True,
+        search_backend="ivf",
+    )
+    retrieval_results = [
+        result for result in results if result.task_name == "MockRetrievalTask"
+    ]
+    assert len(retrieval_results) == 1
+    scores = retrieval_results[0].scores["test"][0]
+    # every document forms its own list in this small corpus, so the search is exact
+    assert scores["search_recall_at_1"] == 1.0
+
+
+@pytest.mark.parametrize("model", [MockNumpyEncoder()])
+def test_run_with_prefetched_tasks(model: mteb.Encoder, tmp_path: Path):
+    """Test that prefetching the data of upcoming tasks gives the same results, in the same order, and releases the data afterwards."""
+    expected = mteb.MTEB(tasks=MOCK_TASK_TEST_GRID).run(
+        model, output_folder=None, overwrite_results=True
+    )
+    tasks = [type(task)() for task in MOCK_TASK_TEST_GRID]
+    results = mteb.MTEB(tasks=tasks).run(
+        model, output_folder=tmp_path.as_posix(), prefetch_tasks=2
+    )
+
+    assert [res.task_name for res in results] == [res.task_name for res in expected]
+    for res, expected_res in zip(results, expected):
+        assert res.scores == expected_res.scores
+    # the data of every task is released once it has been evaluated
+    assert not any(task.data_loaded for task in tasks)
+
+
+class RandomlyTransformedClassificationTask(MockClassificationTask):
+    """A classification task using the default loader, whose transform reseeds and draws from the global random state, like e.g.
+    VieQuADRetrieval.
+    """
+
+    load_data = AbsTask.load_data
+    transform_threads = []
+
+    def dataset_transform(self):
+        self.transform_threads.append(threading.current_thread())
+        np.random.seed(0)
+        self.dataset = self.dataset.shuffle(seed=int(np.random.randint(1000)))
+
+
+def test_prefetching_does_not_change_scores(monkeypatch):
+    """Test that the scores are the same with and without prefetching, even though the transforms of the tasks reseed the global random
+    state, which the encoder draws from.
+    """
+    download_threads = []
+
+    def load_dataset(**kwargs):
+        download_threads.append(threading.current_thread())
+        time.sleep(0.05)
+        texts = [f"sentence {i}" for i in range(40)]
+        return DatasetDict(
+            {
+                split: Dataset.from_dict(
+                    {"text": texts, "label": [i % 2 for i in range(40)]}
+                )
+                for split in ["train", "test"]
+            }
+        )
+
+    monkeypatch.setattr(datasets, "load_dataset", load_dataset)
+    model = MockNumpyEncoder()
+    scores = {}
+    for prefetch_tasks in [0, 2]:
+        tasks = [RandomlyTransformedClassificationTask() for _ in range(4)]
+        download_threads.clear()
+        results = mteb.MTEB(tasks=tasks).run(
+            model, output_folder=None, prefetch_tasks=prefetch_tasks
+        )
+        scores[prefetch_tasks] = [res.scores for res in results]
+
+    assert scores[0] == scores[2]
+    # the upcoming tasks are downloaded in the background, but transformed in the main thread
+    assert any(thread is not threading.main_thread() for thread in download_threads)
+    assert all(
+        thread is threading.main_thread()
+        for thread in RandomlyTransformedClassificationTask.transform_threads
+    )
+    assert not any(task.data_loaded for task in tasks)
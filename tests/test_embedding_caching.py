@@ -1,12 +1,29 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import shutil
 
 import numpy as np
 import pytest
 
-from mteb.encoder_interface import Encoder
-from mteb.models.cache_wrapper import CachedEmbeddingWrapper
+from mteb.encoder_interface import Encoder, PromptType
+from mteb.models.cache_wrapper import CachedEmbeddingWrapper, TextVectorMap
+
+
+class DeterministicModel(Encoder):
+    def __init__(self, embedding_dim=16):
+        self.embedding_dim = embedding_dim
+        self.encoded_texts = []
+
+    def encode(self, texts, **kwargs):
+        self.encoded_texts.extend(texts)
+        return np.stack(
+            [
+                np.random.default_rng(sum(map(ord, text))).random(self.embedding_dim)
+                for text in texts
+            ]
+        ).astype(np.float32)
 
 
 class DummyModel(Encoder):
@@ -66,10 +83,11 @@ class TestCachedEmbeddingWrapper:
         np.testing.assert_allclose(corpus_embeddings1, corpus_embeddings2)
 
         # Verify that cache files were created
-        assert (cache_dir / "DummyTaskQuery" / "vectors.npy").exists()
-        assert (cache_dir / "DummyTaskQuery" / "index.json").exists()
-        assert (cache_dir / "DummyTaskCorpus" / "vectors.npy").exists()
-        assert (cache_dir / "DummyTaskCorpus" / "index.json").exists()
+        store_path = cache_dir / "DummyModel" / "no_revision_available"
+        assert (store_path / "vectors.npy").exists()
+        assert (store_path / "index.bin").exists()
+        assert (store_path / "tasks" / "DummyTaskQuery.bin").exists()
+        assert (store_path / "tasks" / "DummyTaskCorpus.bin").exists()
 
         # Test with a new query - should use cache for existing queries and compute for new one
         new_queries = ["What is the role of insulin in diabetes?"]
@@ -86,6 +104,129 @@ class TestCachedEmbeddingWrapper:
 
         wrapped_model.close()  # delete to allow cleanup on Windows
 
+    def test_partially_cached_order_is_preserved(self, cache_dir):
+        model = DeterministicModel()
+        wrapped_model = CachedEmbeddingWrapper(model, cache_dir)
+        texts = [f"text {i}" for i in range(10)]
+
+        wrapped_model.encode(texts[::2], task_name="DummyTask")
+        assert model.encoded_texts == texts[::2]
+
+        embeddings = wrapped_model.encode(texts, task_name="DummyTask")
+        assert model.encoded_texts[5:] == texts[1::2]
+        np.testing.assert_allclose(embeddings, model.encode(texts))
+
+        wrapped_model.close()
+
+    def test_prompt_types_do_not_collide(self, cache_dir):
+        model = DeterministicModel()
+        wrapped_model = CachedEmbeddingWrapper(model, cache_dir)
+        texts = ["shared text"]
+
+        wrapped_model.encode(texts, task_name="DummyTask", prompt_type=PromptType.query)
+        wrapped_model.encode(
+            texts, task_name="DummyTask", prompt_type=PromptType.passage
+        )
+        assert model.encoded_texts == texts * 2
+
+        wrapped_model.close()
+
+    def test_texts_are_shared_across_tasks(self, cache_dir):
+        model = DeterministicModel()
+        # the model applies no prompts, so the embeddings do not depend on the task
+        model.model_prompts = None
+        wrapped_model = CachedEmbeddingWrapper(model, cache_dir)
+
+        wrapped_model.encode(["a", "b"], task_name="DummyTask1")
+        wrapped_model.encode(["b", "c"], task_name="DummyTask2")
+        assert model.encoded_texts == ["a", "b", "c"]
+
+        view = wrapped_model.task_view("DummyTask2")
+        np.testing.assert_array_equal(
+            wrapped_model.store.get_many(view.rows), model.encode(["b", "c"])
+        )
+        wrapped_model.close()
+
+    def test_add_many_grows_vectors_file(self, cache_dir):
+        vector_map = TextVectorMap(cache_dir, initial_vectors=2)
+        texts = [f"text {i}" for i in range(5)]
+        vectors = np.arange(15, dtype=np.float32).reshape(5, 3)
+
+        vector_map.add_many(texts + texts[:1], np.concatenate([vectors, vectors[:1]]))
+        assert len(vector_map) == 5
+        assert len(vector_map.vectors) == 8
+
+        indices = vector_map.get_indices(["unknown"] + texts[::-1])
+        assert indices[0] == -1
+        np.testing.assert_array_equal(vector_map.get_many(indices[1:]), vectors[::-1])
+
+        vector_map.close()
+
+    def test_index_is_appended_and_reloaded(self, cache_dir):
+        texts = [f"text {i}" for i in range(2000)]
+        vectors = np.random.rand(2000, 4).astype(np.float32)
+
+        vector_map = TextVectorMap(cache_dir)
+        vector_map.add_many(texts[:1500], vectors[:1500])
+        vector_map.save()
+        vector_map.add_many(texts[1500:], vectors[1500:])
+        vector_map.save()
+        vector_map.close()
+        index_file = cache_dir / "index.bin"
+        assert index_file.stat().st_size == 2000 * TextVectorMap.digest_size
+
+        # simulate a save interrupted in the middle of a record
+        with open(index_file, "ab") as f:
+            f.write(b"partial")
+
+        reloaded = TextVectorMap(cache_dir)
+        reloaded.load()
+        assert len(reloaded) == 2000
+        assert index_file.stat().st_size == 2000 * TextVectorMap.digest_size
+        np.testing.assert_array_equal(
+            reloaded.get_many(reloaded.get_indices(texts)), vectors
+        )
+        reloaded.close()
+
+    def test_legacy_json_index_is_converted(self, cache_dir):
+        vector_map = TextVectorMap(cache_dir)
+        vector_map.add_many(["a", "b"], np.eye(2, dtype=np.float32))
+        vector_map.save()
+        vector_map.close()
+        (cache_dir / "index.bin").unlink()
+        with open(cache_dir / "index.json", "w") as f:
+            json.dump(
+                {
+                    hashlib.sha256(b"b").hexdigest(): 1,
+                    hashlib.sha256(b"a").hexdigest(): 0,
+                },
+                f,
+            )
+
+        reloaded = TextVectorMap(cache_dir)
+        reloaded.load()
+        assert not (cache_dir / "index.json").exists()
+        np.testing.assert_array_equal(reloaded.get_vector("b"), [0, 1])
+        assert "c" not in reloaded
+        reloaded.close()
+
+    def test_warns_once_about_task_caches(self, cache_dir, caplog):
+        # the per-task layout of earlier versions
+        vector_map = TextVectorMap(cache_dir / "DummyTask")
+        vector_map.add_many(["a"], np.eye(1, 2, dtype=np.float32))
+        vector_map.save()
+        vector_map.close()
+
+        for _ in range(2):
+            CachedEmbeddingWrapper(DeterministicModel(), cache_dir).close()
+        warnings = [
+            record
+            for record in caplog.records
+            if "embedding caches of earlier versions" in record.message
+        ]
+        assert len(warnings) == 1
+        assert "DummyTask" in warnings[0].message
+
     def test_other_functions_still_work(self, cache_dir):
         # Create a dummy model
         dummy_model = DummyModel()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from datasets import Dataset
+
+from mteb.evaluation.evaluators import BitextMiningEvaluator
+from mteb.models.colbert_models import TokenEmbeddings, max_sim
+from tests.test_benchmark.mock_models import MockHashEncoder
+
+
+@pytest.mark.parametrize("corpus_chunk_size", [7, 500000])
+def test_nearest_neighbors_matches_similarity_search(corpus_chunk_size):
+    rng = np.random.default_rng(0)
+    queries = rng.random((50, 8)).astype(np.float32)
+    corpus = rng.random((30, 8)).astype(np.float32)
+    evaluator = BitextMiningEvaluator(
+        Dataset.from_dict({"sentence1": ["a"], "sentence2": ["b"]})
+    )
+    model = MockHashEncoder()
+
+    nearest = evaluator._nearest_neighbors(
+        queries,
+        corpus,
+        model,
+        query_chunk_size=16,
+        corpus_chunk_size=corpus_chunk_size,
+    )
+    expected = evaluator._similarity_search(queries, corpus, model, top_k=1)
+
+    assert nearest.tolist() == [hits[0]["corpus_id"] for hits in expected]
+
+    # ties are resolved towards the lowest index
+    corpus[20] = corpus[3]
+    queries[0] = corpus[3]
+    nearest = evaluator._nearest_neighbors(
+        queries, corpus, model, corpus_chunk_size=corpus_chunk_size
+    )
+    assert nearest[0] == 3
+
+
+def test_embedding_cache_shared_between_subsets():
+    english = [f"sentence {i}" for i in range(10)]
+    subsets = {
+        "deu-eng": Dataset.from_dict(
+            {"sentence1": [f"Satz {i}" for i in range(10)], "sentence2": english}
+        ),
+        "fra-eng": Dataset.from_dict(
+            {"sentence1": [f"phrase {i}" for i in range(10)], "sentence2": english}
+        ),
+    }
+    model = MockHashEncoder()
+    embedding_cache = {}
+    scores = {
+        name: BitextMiningEvaluator(sentences, embedding_cache=embedding_cache)(model)
+        for name, sentences in subsets.items()
+    }
+
+    # the English side is only encoded for the first subset
+    assert model.n_encoded == 30
+    uncached_model = MockHashEncoder()
+    for name, sentences in subsets.items():
+        assert BitextMiningEvaluator(sentences)(uncached_model) == scores[name]
+    assert uncached_model.n_encoded == 40
+
+
+class MockTokenEncoder(MockHashEncoder):
+    """Embeds each word of a sentence by a hash of the sentence, returning packed token embeddings like ColBERTWrapper, or padded ones."""
+
+    def __init__(self, padded: bool = False):
+        super().__init__()
+        self.padded = padded
+
+    def encode(self, sentences, **kwargs):
+        self.calls.append(list(sentences))
+        embeddings = TokenEmbeddings.from_sequences(
+            [
+                np.random.default_rng(abs(hash(sentence)) % 2**32)
+                .standard_normal((len(sentence.split()), self.embed_dim))
+                .astype(np.float32)
+                for sentence in sentences
+            ]
+        )
+        return np.asarray(embeddings) if self.padded else embeddings
+
+    def similarity(self, embeddings1, embeddings2):
+        return max_sim(embeddings1, embeddings2)
+
+
+def test_token_embeddings():
+    # the English sentences of the second subset are longer, such that they are padded differently if encoded in a separate call
+    english = [" ".join([str(i)] * (i // 3 + 1)) for i in range(15)]
+    subsets = {
+        "deu-eng": Dataset.from_dict(
+            {"sentence1": [f"Satz {i}" for i in range(10)], "sentence2": english[:10]}
+        ),
+        "fra-eng": Dataset.from_dict(
+            {
+                "sentence1": [f"une phrase {i}" for i in range(10)],
+                "sentence2": english[5:],
+            }
+        ),
+    }
+    embedding_cache = {}
+    for name, sentences in subsets.items():
+        scores = BitextMiningEvaluator(sentences, embedding_cache=embedding_cache)(
+            MockTokenEncoder()
+        )
+        # without the cache, as in the evaluation of the subsets in parallel
+        assert BitextMiningEvaluator(sentences)(MockTokenEncoder()) == scores
+        assert BitextMiningEvaluator(sentences)(MockTokenEncoder(padded=True)) == scores
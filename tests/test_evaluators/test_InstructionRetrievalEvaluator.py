@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import numpy as np
+
 from mteb import SentenceTransformerWrapper
+from mteb.encoder_interface import PromptType
 from mteb.evaluation.evaluators import InstructionRetrievalEvaluator, utils
 from tests.test_benchmark.mock_models import MockNumpyEncoder
 
 
+class CountingEncoder:
+    def __init__(self):
+        self.encoded = {PromptType.query: [], PromptType.passage: []}
+
+    def encode(self, sentences, prompt_type=None, **kwargs):
+        self.encoded[prompt_type].extend(sentences)
+        return np.array(
+            [[len(str(s)), 1.0, len(str(s)) % 3, 2.0] for s in sentences],
+            dtype=np.float32,
+        )
+
+
 class TestInstructionRetrievalEvaluator:
     def setup_method(self):
         """Setup any state tied to the execution of the given method in a class.
@@ -61,3 +76,41 @@ class TestInstructionRetrievalEvaluator:
         )
 
         assert results["p-MRR"] == 0.75
+
+    def test_corpus_is_encoded_once_across_instructions(self):
+        model = CountingEncoder()
+        evaluator = InstructionRetrievalEvaluator.InstructionRetrievalEvaluator(
+            model, task_name="test", k_values=[1, 3]
+        )
+        corpus = {
+            "d1": {"text": "short doc"},
+            "d2": {"text": "a much longer document"},
+            "d3": {"text": "unranked document"},
+        }
+        queries = {"q1": "query"}
+
+        expected = evaluator(
+            corpus, queries, instructions={"query": "original instruction"}, qid="q1"
+        )
+        assert len(model.encoded[PromptType.passage]) == 3
+
+        evaluator.encode_corpus({"d1": corpus["d1"], "d2": corpus["d2"]})
+        assert len(model.encoded[PromptType.passage]) == 5
+        for instruction in ["original instruction", "changed instruction", ""]:
+            results = evaluator(
+                {"d2": corpus["d2"], "d1": corpus["d1"]},
+                queries,
+                instructions={"query": instruction},
+                qid="q1",
+            )
+            assert set(results["q1"]) == {"d1", "d2"}
+            if instruction == "original instruction":
+                assert results["q1"]["d1"] == expected["q1"]["d1"]
+                assert results["q1"]["d2"] == expected["q1"]["d2"]
+        assert len(model.encoded[PromptType.passage]) == 5
+
+        # corpora which are not covered by the encoded corpus are encoded as usual
+        evaluator(corpus, queries, instructions={"query": ""}, qid="q1")
+        assert len(model.encoded[PromptType.passage]) == 8
+        evaluator.clear_corpus_embeddings()
+        assert evaluator.corpus_embeddings is None
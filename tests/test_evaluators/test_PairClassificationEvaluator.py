@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from mteb.evaluation.evaluators import PairClassificationEvaluator
@@ -44,3 +45,107 @@ class TestPairClassificationEvaluator:
             scores, labels, high_score_more_similar
         )
         assert ap == pytest.approx(0.7, TOL)
+
+
+def find_best_acc_and_f1_loop(scores, labels, high_score_more_similar):
+    """The threshold search scanning the sorted pairs in Python, only splitting them between different scores or after the last pair."""
+    rows = sorted(
+        zip(scores, labels), key=lambda x: x[0], reverse=high_score_more_similar
+    )
+    max_acc, acc_threshold = 0, -1
+    best_f1 = best_precision = best_recall = f1_threshold = 0
+    positive_so_far, remaining_negatives = 0, sum(np.array(labels) == 0)
+    total_num_duplicates = sum(labels)
+    for i in range(len(rows)):
+        if rows[i][1] == 1:
+            positive_so_far += 1
+        else:
+            remaining_negatives -= 1
+        if i + 1 < len(rows) and rows[i][0] == rows[i + 1][0]:
+            continue
+        if i + 1 < len(rows):
+            threshold = (rows[i][0] + rows[i + 1][0]) / 2
+        else:
+            threshold = np.nextafter(
+                rows[i][0], -np.inf if high_score_more_similar else np.inf
+            )
+        acc = (positive_so_far + remaining_negatives) / len(labels)
+        if acc > max_acc:
+            max_acc, acc_threshold = acc, threshold
+        if positive_so_far > 0:
+            precision = positive_so_far / (i + 1)
+            recall = positive_so_far / total_num_duplicates
+            f1 = 2 * precision * recall / (precision + recall)
+            if f1 > best_f1:
+                best_f1, best_precision, best_recall = f1, precision, recall
+                f1_threshold = threshold
+    return (max_acc, acc_threshold), (
+        best_f1,
+        best_precision,
+        best_recall,
+        f1_threshold,
+    )
+
+
+@pytest.mark.parametrize("high_score_more_similar", [True, False])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_threshold_search_matches_loop(seed, high_score_more_similar):
+    rng = np.random.default_rng(seed)
+    # rounded scores, such that there are ties
+    scores = rng.random(500).round(2)
+    labels = (rng.random(500) < scores).astype(int)
+
+    expected_acc, expected_f1 = find_best_acc_and_f1_loop(
+        scores, labels, high_score_more_similar
+    )
+    assert (
+        PairClassificationEvaluator.find_best_acc_and_threshold(
+            scores, labels, high_score_more_similar
+        )
+        == expected_acc
+    )
+    assert (
+        PairClassificationEvaluator.find_best_f1_and_threshold(
+            scores, labels, high_score_more_similar
+        )
+        == expected_f1
+    )
+
+
+@pytest.mark.parametrize("high_score_more_similar", [True, False])
+def test_threshold_not_inside_tied_scores(high_score_more_similar):
+    # splitting between the pairs scored 0.8 would classify every pair correctly, but no threshold does that
+    scores = np.array([0.9, 0.8, 0.8, 0.8, 0.1])
+    labels = [1, 1, 0, 0, 0]
+    if not high_score_more_similar:
+        scores = 1 - scores
+
+    acc, acc_threshold = PairClassificationEvaluator.find_best_acc_and_threshold(
+        scores, labels, high_score_more_similar
+    )
+    f1, precision, recall, f1_threshold = (
+        PairClassificationEvaluator.find_best_f1_and_threshold(
+            scores, labels, high_score_more_similar
+        )
+    )
+    assert acc == pytest.approx(0.8)
+    assert (f1, precision, recall) == pytest.approx((2 / 3, 1.0, 0.5))
+    assert (
+        acc_threshold
+        == f1_threshold
+        == pytest.approx(0.85 if high_score_more_similar else 0.15)
+    )
+
+    # with a single score, the only threshold classifies all pairs as similar
+    acc, acc_threshold = PairClassificationEvaluator.find_best_acc_and_threshold(
+        [0.5, 0.5, 0.5], [1, 1, 0], high_score_more_similar
+    )
+    f1, precision, recall, f1_threshold = (
+        PairClassificationEvaluator.find_best_f1_and_threshold(
+            [0.5, 0.5, 0.5], [1, 1, 0], high_score_more_similar
+        )
+    )
+    assert acc == pytest.approx(2 / 3)
+    assert (f1, precision, recall) == pytest.approx((0.8, 2 / 3, 1.0))
+    assert acc_threshold == f1_threshold
+    assert (acc_threshold < 0.5) == high_score_more_similar
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
+import torch
 
 from mteb.evaluation.evaluators import RerankingEvaluator
+from tests.test_benchmark.mock_models import MockHashEncoder
 
 TOL = 0.0001
 
@@ -56,3 +59,75 @@ class TestRerankingEvaluator:
         assert nauc_scores_map["nAUC_map_max"] == pytest.approx(0.8694, TOL)
         assert nauc_scores_map["nAUC_map_std"] == pytest.approx(0.94065, TOL)
         assert nauc_scores_map["nAUC_map_diff1"] == pytest.approx(0.85460, TOL)
+
+    def test_batched_metrics_match_instance_metrics(self):
+        rng = np.random.default_rng(0)
+        evaluator = RerankingEvaluator([], mrr_at_k=3)
+        all_is_relevant = [
+            rng.permutation([True] * n_pos + [False] * n_neg).tolist()
+            for n_pos, n_neg in rng.integers(1, 8, (50, 2))
+        ]
+        # rounded scores, such that there are ties for the AP
+        all_sim_scores = [
+            torch.from_numpy(rng.random(len(is_relevant)).round(1))
+            for is_relevant in all_is_relevant
+        ]
+
+        mrr_scores, ap_scores, conf_scores = evaluator._compute_metrics_batched(
+            all_sim_scores, all_is_relevant
+        )
+        for i, (sim_scores, is_relevant) in enumerate(
+            zip(all_sim_scores, all_is_relevant)
+        ):
+            pred_ranking = torch.argsort(-sim_scores, stable=True)
+            assert mrr_scores[i] == evaluator.mrr_at_k_score(
+                is_relevant, pred_ranking, 3
+            )
+            assert ap_scores[i] == pytest.approx(
+                evaluator.ap_score(is_relevant, sim_scores.tolist())
+            )
+            for name, score in evaluator.conf_scores(sim_scores.tolist()).items():
+                assert conf_scores[name][i] == pytest.approx(score)
+
+    def test_batched_encoding_matches_individual_encoding(self):
+        samples = [
+            {
+                "query": f"query {i}",
+                "positive": [f"positive {i} {j}" for j in range(i % 3 + 1)],
+                "negative": [f"negative {j}" for j in range(i % 5 + 1)],
+            }
+            for i in range(20)
+        ]
+        batched = RerankingEvaluator(samples, use_batched_encoding=True)
+        individual = RerankingEvaluator(samples, use_batched_encoding=False)
+        batched_scores = batched(MockHashEncoder())
+        individual_scores = individual(MockHashEncoder())
+
+        assert batched_scores.keys() == individual_scores.keys()
+        for name, score in individual_scores.items():
+            assert batched_scores[name] == pytest.approx(score)
+
+    def test_miracl_candidates_encoded_once(self):
+        candidates = [f"candidate {j}" for j in range(10)]
+        samples = [
+            {
+                "query": f"query {i}",
+                "positive": candidates[i % 4 : i % 4 + 2],
+                "negative": candidates[i % 4 + 2 :],
+                "candidates": candidates[i % 3 :],
+            }
+            for i in range(20)
+        ]
+        model = MockHashEncoder()
+        batched_scores = RerankingEvaluator(
+            samples, evaluator_type="miracl", use_batched_encoding=True
+        )(model)
+        # the queries and the distinct candidates are encoded once
+        assert model.n_encoded == 20 + 10
+
+        individual_scores = RerankingEvaluator(
+            samples, evaluator_type="miracl", use_batched_encoding=False
+        )(MockHashEncoder())
+        assert batched_scores.keys() == individual_scores.keys()
+        for name, score in individual_scores.items():
+            assert batched_scores[name] == pytest.approx(score)
@@ -1,9 +1,35 @@
 from __future__ import annotations
 
+import shutil
+import warnings
+from types import SimpleNamespace
+
+import numpy as np
 import pytest
+import pytrec_eval
+import torch
 
 from mteb import SentenceTransformerWrapper
+from mteb.encoder_interface import PromptType
 from mteb.evaluation.evaluators import RetrievalEvaluator
+from mteb.evaluation.evaluators.retrieval_metrics import RankedRun
+from mteb.evaluation.evaluators.retrieval_metrics import (
+    confidence_scores as query_confidence_scores,
+)
+from mteb.evaluation.evaluators.RetrievalEvaluator import DenseRetrievalExactSearch
+from mteb.evaluation.evaluators.search_backends import (
+    ExactSearchBackend,
+    IVFSearchBackend,
+    recall_against_exact,
+)
+from mteb.evaluation.evaluators.utils import (
+    confidence_scores,
+    cos_sim,
+    encode_sorted_by_length,
+    hole,
+    mrr,
+    recall_cap,
+)
 from tests.test_benchmark.mock_models import MockNumpyEncoder
 
 TOL = 0.0001
@@ -131,3 +157,326 @@ class TestRetrievalEvaluator:
         aucs = ["nAUC_NDCG@3_max", "nAUC_NDCG@3_std", "nAUC_NDCG@3_diff1"]
         for auc in aucs:
             assert naucs[auc] == pytest.approx(expected_naucs[auc], TOL)
+
+
+class RandomEncoder:
+    def __init__(self, embeddings: dict[str, np.ndarray]):
+        self.embeddings = embeddings
+
+    def encode(self, sentences, **kwargs):
+        return np.stack(
+            [self.embeddings[s if isinstance(s, str) else s["text"]] for s in sentences]
+        )
+
+
+@pytest.mark.parametrize(
+    "corpus_chunk_size, query_chunk_size", [(7, 3), (50, 1), (1000, 1024)]
+)
+def test_exact_search_matches_brute_force(corpus_chunk_size, query_chunk_size):
+    rng = np.random.default_rng(42)
+    corpus = {f"d{i}": {"text": f"document {i}"} for i in range(50)}
+    queries = {f"q{i}": f"query {i}" for i in range(10)}
+    embeddings = {
+        text: rng.normal(size=8).astype(np.float32)
+        for text in [doc["text"] for doc in corpus.values()] + list(queries.values())
+    }
+    # a duplicated document creates a tie, which keeps the larger corpus id
+    embeddings["document 11"] = embeddings["document 10"]
+
+    retriever = DenseRetrievalExactSearch(
+        RandomEncoder(embeddings),
+        encode_kwargs={"show_progress_bar": False},
+        corpus_chunk_size=corpus_chunk_size,
+        query_chunk_size=query_chunk_size,
+    )
+    results = retriever.search(corpus, queries, top_k=5, task_name="test")
+
+    corpus_ids = sorted(corpus, key=lambda cid: len(corpus[cid]["text"]), reverse=True)
+    scores = cos_sim(
+        np.stack([embeddings[q] for q in queries.values()]),
+        np.stack([embeddings[corpus[cid]["text"]] for cid in corpus_ids]),
+    )
+    for qid, query_scores in zip(queries, scores.tolist()):
+        expected = sorted(zip(query_scores, corpus_ids), reverse=True)[:5]
+        assert list(results[qid]) == [cid for _, cid in expected]
+        assert list(results[qid].values()) == pytest.approx(
+            [score for score, _ in expected]
+        )
+
+
+@pytest.mark.parametrize(
+    "search_backend, corpus_chunk_size",
+    [("exact", 4), ("exact", 1000), ("ivf", 4), ("ivf", 1000)],
+)
+def test_ties_broken_by_descending_corpus_id(search_backend, corpus_chunk_size):
+    corpus = {f"d{i}": {"text": f"document {i}" + " long" * (i % 3)} for i in range(12)}
+    queries = {"q0": "query"}
+    # every document has the same score, so the top-k are the largest ids as strings, whatever the length order of the corpus
+    embeddings = {doc["text"]: np.ones(4, dtype=np.float32) for doc in corpus.values()}
+    embeddings["query"] = np.ones(4, dtype=np.float32)
+    retriever = DenseRetrievalExactSearch(
+        RandomEncoder(embeddings),
+        encode_kwargs={"show_progress_bar": False},
+        corpus_chunk_size=corpus_chunk_size,
+        search_backend=search_backend,
+        search_backend_kwargs={"n_lists": 2, "n_probe": 2}
+        if search_backend == "ivf"
+        else {},
+    )
+    results = retriever.search(corpus, queries, top_k=5, task_name="test")
+    assert list(results["q0"]) == ["d9", "d8", "d7", "d6", "d5"]
+
+
+def test_return_sorted_is_deprecated():
+    corpus = {f"d{i}": {"text": f"document {i}"} for i in range(10)}
+    queries = {f"q{i}": f"query {i}" for i in range(3)}
+    rng = np.random.default_rng(42)
+    embeddings = {
+        text: rng.normal(size=8).astype(np.float32)
+        for text in [doc["text"] for doc in corpus.values()] + list(queries.values())
+    }
+    retriever = DenseRetrievalExactSearch(
+        RandomEncoder(embeddings), encode_kwargs={"show_progress_bar": False}
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        results = retriever.search(corpus, queries, top_k=5, task_name="test")
+    with pytest.warns(DeprecationWarning, match="return_sorted"):
+        assert (
+            retriever.search(
+                corpus, queries, top_k=5, task_name="test", return_sorted=False
+            )
+            == results
+        )
+    for scores in results.values():
+        assert list(scores.values()) == sorted(scores.values(), reverse=True)
+
+
+def test_ivf_search_backend_probing_all_lists_is_exact():
+    rng = np.random.default_rng(42)
+    queries = torch.from_numpy(rng.normal(size=(20, 8)).astype(np.float32))
+    chunks = [
+        torch.from_numpy(rng.normal(size=(n, 8)).astype(np.float32)) for n in [40, 25]
+    ]
+
+    exact = ExactSearchBackend(queries, 10, cos_sim, query_chunk_size=7)
+    ivf = IVFSearchBackend(
+        queries, 10, cos_sim, query_chunk_size=7, n_lists=6, n_probe=6
+    )
+    for chunk in chunks:
+        exact.add(chunk)
+        ivf.add(chunk)
+    exact_scores, exact_idx = exact.search()
+    ivf_scores, ivf_idx = ivf.search()
+
+    assert torch.equal(ivf_idx, exact_idx)
+    assert torch.allclose(ivf_scores, exact_scores)
+    assert torch.equal(ivf.exact_search(torch.tensor([3, 5]))[1], exact_idx[[3, 5]])
+
+
+def test_recall_against_exact():
+    approximate_idx = torch.tensor([[0, 1, 2], [3, 4, -1]])
+    exact_idx = torch.tensor([[0, 2, 5], [3, 5, 4]])
+    recall = recall_against_exact(approximate_idx, exact_idx, [1, 3])
+    assert recall[1] == 1.0
+    assert recall[3] == pytest.approx((2 / 3 + 2 / 3) / 2)
+
+
+def test_search_backend_selected_through_encode_kwargs():
+    evaluator = RetrievalEvaluator(
+        MockNumpyEncoder(),
+        task_name="test",
+        k_values=[1, 2],
+        encode_kwargs={
+            "search_backend": "ivf",
+            "search_backend_kwargs": {"n_probe": 1},
+        },
+    )
+    assert evaluator.retriever.search_backend is IVFSearchBackend
+    assert "search_backend" not in evaluator.retriever.encode_kwargs
+
+    corpus = {f"d{i}": {"text": f"document {i}"} for i in range(10)}
+    queries = {f"q{i}": f"query {i}" for i in range(3)}
+    results = evaluator(corpus, queries)
+    assert set(results) == set(queries)
+    assert set(evaluator.search_recall()) == {
+        "search_recall_at_1",
+        "search_recall_at_2",
+    }
+
+
+def test_encode_sorted_by_length_restores_order():
+    class RecordingEncoder:
+        def encode(self, sentences, **kwargs):
+            self.sentences = list(sentences)
+            return np.array([[len(s), i] for i, s in enumerate(sentences)])
+
+    model = RecordingEncoder()
+    sentences = ["a", "ccc", "bb", "dddd", "ee"]
+    embeddings = encode_sorted_by_length(model, sentences, task_name="test")
+
+    assert model.sentences == ["dddd", "ccc", "bb", "ee", "a"]
+    assert embeddings[:, 0].tolist() == [len(s) for s in sentences]
+
+
+@pytest.mark.parametrize("search_backend", ["exact", "ivf"])
+def test_search_resumes_from_corpus_checkpoint(search_backend, tmp_path):
+    rng = np.random.default_rng(42)
+    corpus = {f"d{i}": {"text": f"document {i}"} for i in range(30)}
+    queries = {f"q{i}": f"query {i}" for i in range(4)}
+    embeddings = {
+        text: rng.normal(size=8).astype(np.float32)
+        for text in [doc["text"] for doc in corpus.values()] + list(queries.values())
+    }
+
+    class CrashingEncoder(RandomEncoder):
+        mteb_model_meta = SimpleNamespace(name="mock/crashing", revision="1")
+
+        def __init__(self, embeddings, crash_after: int | None = None):
+            super().__init__(embeddings)
+            self.crash_after = crash_after
+            self.n_corpus_chunks = 0
+
+        def encode(self, sentences, **kwargs):
+            if kwargs.get("prompt_type") == PromptType.passage:
+                if self.n_corpus_chunks == self.crash_after:
+                    raise RuntimeError("killed")
+                self.n_corpus_chunks += 1
+            return super().encode(sentences, **kwargs)
+
+    def search(model, checkpoint_dir=None, corpus=corpus, batch_size=128):
+        retriever = DenseRetrievalExactSearch(
+            model,
+            encode_kwargs={"show_progress_bar": False, "batch_size": batch_size},
+            corpus_chunk_size=7,
+            search_backend=search_backend,
+            corpus_checkpoint_dir=checkpoint_dir,
+        )
+        return retriever.search(corpus, queries, top_k=5, task_name="test")
+
+    expected = search(RandomEncoder(embeddings))
+
+    with pytest.raises(RuntimeError):
+        search(CrashingEncoder(embeddings, crash_after=3), tmp_path)
+    model = CrashingEncoder(embeddings)
+    results = search(model, tmp_path)
+
+    assert model.n_corpus_chunks == 2  # only the chunks after the crash are encoded
+    assert results == expected
+    assert list(tmp_path.iterdir()) == []  # the checkpoint is removed once finished
+
+    # the checkpoint is not resumed when the texts of the corpus or the encode kwargs change
+    changed_corpus = {**corpus, "d0": {"text": "document 1"}}
+    for kwargs in [{"corpus": changed_corpus}, {"batch_size": 16}]:
+        with pytest.raises(RuntimeError):
+            search(CrashingEncoder(embeddings, crash_after=3), tmp_path)
+        model = CrashingEncoder(embeddings)
+        search(model, tmp_path, **kwargs)
+        assert model.n_corpus_chunks == 5
+        shutil.rmtree(tmp_path)
+
+
+def test_corpus_checkpoint_requires_model_name_and_revision(tmp_path, caplog):
+    corpus = {f"d{i}": {"text": f"document {i}"} for i in range(10)}
+    queries = {"q0": "query 0"}
+    retriever = DenseRetrievalExactSearch(
+        MockNumpyEncoder(),
+        encode_kwargs={"show_progress_bar": False},
+        corpus_chunk_size=3,
+        corpus_checkpoint_dir=tmp_path,
+    )
+    retriever.search(corpus, queries, top_k=5, task_name="test")
+    assert "Not checkpointing the corpus embeddings" in caplog.text
+    assert list(tmp_path.iterdir()) == []
+
+
+def random_run(seed: int, n_queries: int = 50, n_docs: int = 40):
+    rng = np.random.default_rng(seed)
+    doc_ids = [f"d{i}" for i in range(n_docs)]
+    qrels, results = {}, {}
+    for i in range(n_queries):
+        judged = rng.choice(doc_ids, size=rng.integers(1, 8), replace=False)
+        qrels[f"q{i}"] = {
+            str(doc_id): int(rel)
+            for doc_id, rel in zip(judged, rng.integers(-1, 4, size=len(judged)))
+        }
+        retrieved = rng.choice(doc_ids, size=rng.integers(2, 30), replace=False)
+        # rounded scores, such that there are ties
+        results[f"q{i}"] = {
+            str(doc_id): float(score)
+            for doc_id, score in zip(retrieved, rng.random(len(retrieved)).round(1))
+        }
+    results["q0"] = {}  # no results
+    results["not_judged"] = {"d0": 1.0}
+    qrels["not_retrieved"] = {"d1": 1}
+    return qrels, results
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_ranked_run_matches_pytrec_eval(seed):
+    qrels, results = random_run(seed)
+    k_values = [1, 3, 5, 10, 100]
+    measures = {
+        f"{measure}." + ",".join(str(k) for k in k_values)
+        for measure in ["ndcg_cut", "map_cut", "recall", "P"]
+    }
+    expected = pytrec_eval.RelevanceEvaluator(qrels, measures).evaluate(results)
+
+    ranked_run = RankedRun(qrels, results, k_values)
+    metrics = ranked_run.trec_metrics()
+
+    assert ranked_run.query_ids == list(expected)
+    for name, trec_name in [
+        ("NDCG", "ndcg_cut"),
+        ("MAP", "map_cut"),
+        ("Recall", "recall"),
+        ("P", "P"),
+    ]:
+        for k in k_values:
+            trec_scores = [scores[f"{trec_name}_{k}"] for scores in expected.values()]
+            assert metrics[f"{name}@{k}"] == pytest.approx(trec_scores, abs=1e-9)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_ranked_run_custom_metrics_match_utils(seed):
+    qrels, results = random_run(seed)
+    # the original implementations fail on queries without judgements or relevant documents
+    results.pop("not_judged")
+    results = {
+        qid: docs
+        for qid, docs in results.items()
+        if any(rel > 0 for rel in qrels[qid].values())
+    }
+    k_values = [1, 3, 5, 10]
+    ranked_run = RankedRun(qrels, results, k_values)
+
+    for metric, expected in [
+        (ranked_run.mrr(), mrr(qrels, results, k_values, "all")),
+        (ranked_run.recall_cap(), recall_cap(qrels, results, k_values, "all")),
+        (ranked_run.hole(), hole(qrels, results, k_values, "all")),
+    ]:
+        for name, scores in expected.items():
+            assert metric[name] == pytest.approx(scores)
+
+    accuracy = ranked_run.top_k_accuracy()
+    for name, scores in mrr(qrels, results, k_values, "all").items():
+        k = name.split("@")[1]
+        assert accuracy[f"Accuracy@{k}"] == pytest.approx(
+            [float(score > 0) for score in scores]
+        )
+
+    non_empty = [qid for qid in results if results[qid]]
+    confidence = query_confidence_scores({qid: results[qid] for qid in non_empty})
+    for i, qid in enumerate(non_empty):
+        for name, score in confidence_scores(list(results[qid].values())).items():
+            assert confidence[name][i] == pytest.approx(score)
+
+
+def test_confidence_scores_of_short_result_lists():
+    results = {"q1": {"d1": 0.5}, "q2": {}, "q3": {"d1": 0.2, "d2": 0.7}}
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        confidence = query_confidence_scores(results)
+    assert confidence["max"].tolist() == [0.5, 0.0, 0.7]
+    assert confidence["diff1"].tolist() == pytest.approx([0.0, 0.0, 0.5])
+    assert confidence["std"].tolist() == pytest.approx([0.0, 0.0, 0.25])
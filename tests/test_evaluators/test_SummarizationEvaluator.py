@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+from scipy.stats import pearsonr, spearmanr
+
+from mteb.evaluation.evaluators import SummarizationEvaluator
+from tests.test_benchmark.mock_models import MockHashEncoder
+
+
+class MockHashEncoderWithSimilarity(MockHashEncoder):
+    def similarity(self, embeddings1, embeddings2):
+        return torch.as_tensor(embeddings1) @ torch.as_tensor(embeddings2).T
+
+
+def reference_scores(human_embeddings, machine_embeddings, gold_scores, similarity):
+    spearman, pearson = [], []
+    for human, machine, gold in zip(human_embeddings, machine_embeddings, gold_scores):
+        predicted = [max(similarity(m, h) for h in human) for m in machine]
+        if len(set(gold)) == 1 or len(set(predicted)) == 1:
+            continue
+        spearman.append(spearmanr(gold, predicted).statistic)
+        pearson.append(pearsonr(gold, predicted).statistic)
+    return np.mean(spearman), np.mean(pearson)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [MockHashEncoder(embed_dim=16), MockHashEncoderWithSimilarity(embed_dim=16)],
+)
+def test_batched_scores_match_per_summary_scores(model):
+    rng = np.random.default_rng(0)
+    human_summaries = [
+        [f"human {i} {j}" for j in range(rng.integers(1, 5))] for i in range(20)
+    ]
+    machine_summaries = [
+        [f"machine {i} {j}" for j in range(rng.integers(2, 10))] for i in range(20)
+    ]
+    gold_scores = [
+        rng.integers(1, 5, len(summaries)).tolist() for summaries in machine_summaries
+    ]
+    evaluator = SummarizationEvaluator(
+        human_summaries=human_summaries,
+        machine_summaries=machine_summaries,
+        texts=[""] * 20,
+        gold_scores=gold_scores,
+    )
+    scores = evaluator(model)
+
+    human_embeddings = [model.encode(summaries) for summaries in human_summaries]
+    machine_embeddings = [model.encode(summaries) for summaries in machine_summaries]
+
+    def cosine(a, b):
+        return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+    for prefix, similarity in [("cosine_", cosine), ("dot_", np.dot)]:
+        spearman, pearson = reference_scores(
+            human_embeddings, machine_embeddings, gold_scores, similarity
+        )
+        assert scores[f"{prefix}spearman"] == pytest.approx(spearman, abs=1e-6)
+        assert scores[f"{prefix}pearson"] == pytest.approx(pearson, abs=1e-6)
+
+    model_similarity = np.dot if hasattr(model, "similarity") else cosine
+    spearman, pearson = reference_scores(
+        human_embeddings, machine_embeddings, gold_scores, model_similarity
+    )
+    assert scores["spearman"] == pytest.approx(spearman, abs=1e-6)
+    assert scores["pearson"] == pytest.approx(pearson, abs=1e-6)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import os
+import shutil
 from pathlib import Path
 
+import polars as pl
+
 import mteb
+from mteb.load_results import results_cache
 from mteb.load_results.benchmark_results import BenchmarkResults, ModelResult
+from mteb.load_results.results_cache import ResultsCache, _parse_task_files
+from mteb.load_results.task_results import TaskResult
 
 
 def test_mteb_load_results():
@@ -26,3 +32,69 @@ def test_mteb_load_results():
     assert known_revision in [
         res.model_revision for res in results if res.model_name == known_model
     ]
+
+
+def sorted_task_results(results: BenchmarkResults) -> list[list[dict]]:
+    return [
+        sorted(model_result.model_dump()["task_results"], key=lambda r: r["task_name"])
+        for model_result in results
+    ]
+
+
+def test_load_results_from_cache(tmp_path, monkeypatch):
+    mock_cache = Path(__file__).parent.parent / "mock_mteb_cache"
+    shutil.copytree(mock_cache / "results", tmp_path / "results")
+    monkeypatch.setenv("MTEB_CACHE", str(tmp_path))
+
+    expected = mteb.load_results(download_latest=False, use_cache=False)
+    results = mteb.load_results(download_latest=False)
+    assert (tmp_path / "results_index" / "task_results.parquet").exists()
+    assert sorted_task_results(results) == sorted_task_results(expected)
+
+    tasks = ["STS12", "NFCorpus"]
+    results = mteb.load_results(download_latest=False, tasks=tasks)
+    expected = mteb.load_results(download_latest=False, tasks=tasks, use_cache=False)
+    assert sorted_task_results(results) == sorted_task_results(expected)
+
+
+def test_results_cache_is_updated_incrementally(tmp_path, monkeypatch):
+    mock_cache = Path(__file__).parent.parent / "mock_mteb_cache"
+    results_directory = tmp_path / "results" / "results"
+    shutil.copytree(mock_cache / "results", tmp_path / "results")
+    revision_path = next(p for p in results_directory.glob("*/*") if p.is_dir())
+    parsed = []
+
+    def parse_task_files(results_directory, paths):
+        parsed.extend(paths)
+        return _parse_task_files(results_directory, paths)
+
+    monkeypatch.setattr(results_cache, "_parse_task_files", parse_task_files)
+    cache = ResultsCache(results_directory).update()
+    n_files = len(cache.task_results)
+    assert len(parsed) == n_files
+
+    # nothing is parsed again
+    parsed.clear()
+    cache = ResultsCache(results_directory).update()
+    assert parsed == [] and len(cache.task_results) == n_files
+
+    # only the changed file is parsed again, and the removed file is dropped
+    changed = revision_path / "STS12.json"
+    task_result = TaskResult.from_disk(changed)
+    task_result.scores["test"][0]["main_score"] = 0.5
+    task_result.to_disk(changed)
+    (revision_path / "NFCorpus.json").unlink()
+    cache = ResultsCache(results_directory).update()
+    changed_path = f"{revision_path.parent.name}/{revision_path.name}/STS12.json"
+    assert parsed == [changed_path]
+    assert len(cache.task_results) == n_files - 1
+
+    main_scores = cache.scores.filter(
+        (pl.col("path") == changed_path) & (pl.col("metric") == "main_score")
+    )
+    assert main_scores["value"].to_list() == [0.5]
+    assert f"{revision_path.parent.name}/{revision_path.name}/NFCorpus.json" not in (
+        cache.scores["path"].to_list()
+    )
+    [loaded] = cache.load_task_results(revision_path, task_names=["STS12"])
+    assert loaded.to_dict() == TaskResult.from_disk(changed).to_dict()
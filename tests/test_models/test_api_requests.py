@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mteb.models.api_requests import (
+    APIRequestEngine,
+    APIResponse,
+    TokenBucket,
+    is_retryable,
+    pack_batches,
+    parse_duration,
+    parse_rate_limit_headers,
+)
+
+
+class MockEmbeddingServer(ThreadingHTTPServer):
+    """A local embedding API, which answers the first `n_rate_limited` requests with a 429 and sends rate limit headers."""
+
+    def __init__(self, n_rate_limited: int = 0, latency: float = 0.05):
+        super().__init__(("127.0.0.1", 0), MockEmbeddingHandler)
+        self.n_rate_limited = n_rate_limited
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.n_requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/embeddings"
+
+
+class MockEmbeddingHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server
+        texts = json.loads(self.rfile.read(int(self.headers["Content-Length"])))[
+            "input"
+        ]
+        with server.lock:
+            server.n_requests += 1
+            rate_limited = server.n_requests <= server.n_rate_limited
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(server.latency)
+        with server.lock:
+            server.in_flight -= 1
+
+        if texts == ["invalid"]:
+            self.send_response(400)
+            self.end_headers()
+            return
+        if rate_limited:
+            self.send_response(429)
+            self.send_header("retry-after-ms", "10")
+            self.end_headers()
+            return
+        body = json.dumps({"data": [[len(text)] for text in texts]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("x-ratelimit-limit-requests", "10000")
+        self.send_header("x-ratelimit-remaining-requests", "9999")
+        self.send_header("x-ratelimit-reset-requests", "6ms")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(request):
+    server = MockEmbeddingServer(**getattr(request, "param", {}))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def embed_request(url: str, texts: list[str]):
+    def post() -> APIResponse:
+        request = urllib.request.Request(
+            url,
+            data=json.dumps({"input": texts}).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request) as response:
+            return APIResponse(json.load(response)["data"], dict(response.headers))
+
+    async def send() -> APIResponse:
+        return await asyncio.get_running_loop().run_in_executor(None, post)
+
+    return send
+
+
+def test_engine_sends_requests_concurrently_in_order(server):
+    texts = [f"text {'x' * i}" for i in range(40)]
+    batches = pack_batches([len(text) for text in texts], 4, None)
+    engine = APIRequestEngine(max_concurrent_requests=5, seed=0)
+
+    results = engine.run(
+        [embed_request(server.url, [texts[i] for i in batch]) for batch in batches]
+    )
+    engine.close()
+
+    assert [e for batch in results for e in batch] == [[len(t)] for t in texts]
+    assert server.n_requests == 10
+    assert 1 < server.max_in_flight <= 5
+    # the rate limits reported by the server are tracked
+    assert engine.request_bucket is not None
+    assert engine.request_bucket.capacity == 10000
+
+
+@pytest.mark.parametrize("server", [{"n_rate_limited": 3}], indirect=True)
+def test_engine_retries_rate_limited_requests(server):
+    engine = APIRequestEngine(max_concurrent_requests=1, max_retries=3, seed=0)
+    results = engine.run([embed_request(server.url, ["a", "bb"])])
+    engine.close()
+
+    assert results == [[[1], [2]]]
+    assert server.n_requests == 4
+
+
+def test_engine_raises_non_retryable_errors(server):
+    engine = APIRequestEngine(max_retries=3, seed=0)
+    with pytest.raises(urllib.error.HTTPError):
+        engine.run([embed_request(server.url, ["invalid"])])
+    engine.close()
+    assert server.n_requests == 1
+
+
+def test_pack_batches():
+    batches = pack_batches(
+        [5, 5, 5, 20, 1, 1, 1], max_batch_size=3, max_batch_tokens=10
+    )
+    assert batches == [range(0, 2), range(2, 3), range(3, 4), range(4, 7)]
+
+
+def test_parse_rate_limit_headers():
+    assert parse_duration("6m0s") == 360
+    assert parse_duration("1h2m3.5s") == 3723.5
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    limits = parse_rate_limit_headers(
+        {
+            "X-RateLimit-Limit-Tokens": "1000000",
+            "x-ratelimit-remaining-tokens": "0",
+            "x-ratelimit-reset-tokens": "1s",
+            "Retry-After": "2",
+        }
+    )
+    assert limits == {
+        "tokens_limit": 1_000_000,
+        "tokens_remaining": 0,
+        "tokens_reset": 1,
+        "retry_after": 2,
+    }
+
+
+def test_token_bucket_waits_for_refill():
+    bucket = TokenBucket(capacity=600, interval=60)  # 10 per second
+
+    async def acquire_twice():
+        await bucket.acquire(600)
+        start = time.monotonic()
+        await bucket.acquire(2)
+        return time.monotonic() - start
+
+    assert asyncio.run(acquire_twice()) >= 0.15
+
+
+def test_is_retryable():
+    class StatusError(Exception):
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+    class APIConnectionError(Exception):
+        pass
+
+    assert is_retryable(StatusError(429))
+    assert is_retryable(StatusError(503))
+    assert not is_retryable(StatusError(400))
+    assert is_retryable(APIConnectionError())
+    assert not is_retryable(ValueError())
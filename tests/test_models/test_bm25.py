@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import importlib.machinery
+import pickle
+import sys
+import types
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mteb.models.bm25 import _index_fingerprint, bm25_loader
+
+Tokenized = namedtuple("Tokenized", ["ids", "vocab"])
+
+
+class StubBM25:
+    """Scores a document by the number of query tokens it contains, relative to its length."""
+
+    n_indexed = 0
+
+    def index(self, tokenized: Tokenized) -> None:
+        StubBM25.n_indexed += 1
+        tokens = {i: token for token, i in tokenized.vocab.items()}
+        self.documents = [[tokens[i] for i in ids] for ids in tokenized.ids]
+
+    def retrieve(self, query_tokens, corpus=None, k: int = 10):
+        scores = np.array(
+            [
+                [
+                    sum(document.count(token) for token in query) / (len(document) + 1)
+                    for document in self.documents
+                ]
+                for query in query_tokens
+            ]
+        )
+        indices = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+        top_scores = np.take_along_axis(scores, indices, axis=1)
+        if corpus is not None:
+            return np.asarray(corpus, dtype=object)[indices], top_scores
+        return indices, top_scores
+
+    def save(self, path: str) -> None:
+        with (Path(path) / "documents.pkl").open("wb") as f:
+            pickle.dump(self.documents, f)
+
+    @classmethod
+    def load(cls, path: str) -> StubBM25:
+        retriever = cls()
+        with (Path(path) / "documents.pkl").open("rb") as f:
+            retriever.documents = pickle.load(f)
+        return retriever
+
+
+def stub_tokenize(texts, stopwords=None, stemmer=None, return_ids=True):
+    stopwords = {"the", "a", "of"} if stopwords == "en" else set()
+    token_lists = []
+    for text in texts:
+        tokens = [t for t in text.lower().split() if t not in stopwords]
+        if stemmer is not None:
+            tokens = stemmer.stemWords(tokens)
+        token_lists.append(tokens)
+    if not return_ids:
+        return token_lists
+    vocab = {}
+    ids = [
+        [vocab.setdefault(token, len(vocab)) for token in tokens]
+        for tokens in token_lists
+    ]
+    return Tokenized(ids, vocab)
+
+
+class StubStemmer:
+    def __init__(self, language: str):
+        self.language = language
+
+    def stemWords(self, words: list[str]) -> list[str]:
+        return [word.rstrip("s") for word in words]
+
+
+@pytest.fixture
+def stub_bm25s(monkeypatch):
+    bm25s = types.ModuleType("bm25s")
+    bm25s.__spec__ = importlib.machinery.ModuleSpec("bm25s", None)
+    bm25s.__version__ = "0.0.0"
+    bm25s.BM25 = StubBM25
+    bm25s.tokenize = stub_tokenize
+    stemmer = types.ModuleType("Stemmer")
+    stemmer.__spec__ = importlib.machinery.ModuleSpec("Stemmer", None)
+    stemmer.Stemmer = StubStemmer
+    monkeypatch.setitem(sys.modules, "bm25s", bm25s)
+    monkeypatch.setitem(sys.modules, "Stemmer", stemmer)
+    monkeypatch.setattr(StubBM25, "n_indexed", 0)
+
+
+corpus = {
+    f"d{i}": {"title": f"title {i}", "text": f"the cats of document {i} " * (i % 3 + 1)}
+    for i in range(10)
+}
+corpus["d10"] = "a plain text document about dogs"
+queries = {"q0": "cats document 3", "q1": "dogs", "q2": "title 7 of the cat"}
+
+
+def test_index_is_cached_in_memory_and_on_disk(stub_bm25s, tmp_path):
+    model = bm25_loader(index_cache_dir=tmp_path)
+    results = model.search(corpus, queries, top_k=5, score_function="bm25")
+    assert model.search(corpus, queries, top_k=5, score_function="bm25") == results
+    assert StubBM25.n_indexed == 1
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # a later run loads the index from disk
+    model = bm25_loader(index_cache_dir=tmp_path)
+    assert model.search(corpus, queries, top_k=5, score_function="bm25") == results
+    assert StubBM25.n_indexed == 1
+
+    # a different corpus is indexed again
+    model.search(
+        {**corpus, "d11": "another document"}, queries, top_k=5, score_function="bm25"
+    )
+    assert StubBM25.n_indexed == 2
+
+    model = bm25_loader(index_cache_dir=tmp_path / "uncached", cache_index=False)
+    assert model.search(corpus, queries, top_k=5, score_function="bm25") == results
+    assert StubBM25.n_indexed == 3
+    assert not (tmp_path / "uncached").exists()
+
+
+def test_tokenizer_settings_change_the_index_key(stub_bm25s, tmp_path):
+    ids, texts = list(corpus), [str(doc) for doc in corpus.values()]
+    key = _index_fingerprint(ids, texts, "0.0.0", "en", "english")
+    assert key == _index_fingerprint(ids, texts, "0.0.0", "en", "english")
+    assert key != _index_fingerprint(ids, texts, "0.0.0", None, "english")
+    assert key != _index_fingerprint(ids, texts, "0.0.0", "en", None)
+    assert key != _index_fingerprint(ids, texts, "0.0.1", "en", "english")
+    assert key != _index_fingerprint(ids[::-1], texts, "0.0.0", "en", "english")
+
+    for kwargs in [{}, {"stopwords": None}, {"stemmer_language": None}]:
+        bm25_loader(index_cache_dir=tmp_path, **kwargs).search(
+            corpus, queries, top_k=5, score_function="bm25"
+        )
+    assert StubBM25.n_indexed == 3
+    assert len(list(tmp_path.iterdir())) == 3
+
+
+@pytest.mark.parametrize("top_k", [3, 100])
+def test_mapped_ids_match_per_document_results(stub_bm25s, tmp_path, top_k):
+    model = bm25_loader(index_cache_dir=tmp_path)
+    results = model.search(corpus, queries, top_k=top_k, score_function="bm25")
+
+    # the results of bm25s when retrieving the documents themselves
+    corpus_with_ids = [
+        {"doc_id": cid, **({"text": doc} if isinstance(doc, str) else doc)}
+        for cid, doc in corpus.items()
+    ]
+    retriever = StubBM25()
+    retriever.index(
+        model.encode(
+            ["\n".join([doc.get("title", ""), doc["text"]]) for doc in corpus_with_ids]
+        )
+    )
+    documents, scores = retriever.retrieve(
+        model.encode(list(queries.values()), return_ids=False),
+        corpus=corpus_with_ids,
+        k=min(top_k, len(corpus)),
+    )
+    expected = {
+        qid: {doc["doc_id"]: float(score) for doc, score in zip(docs, doc_scores)}
+        for qid, docs, doc_scores in zip(queries, documents, scores)
+    }
+
+    assert results == expected
+    assert all(len(hits) == min(top_k, len(corpus)) for hits in results.values())
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+
+from mteb.models.colbert_models import TokenEmbeddings, max_sim
+
+
+def padded_max_sim(queries: torch.Tensor, documents: torch.Tensor) -> torch.Tensor:
+    scores = torch.einsum("ash,bth->abst", queries, documents)
+    # padding tokens of the documents are never the maximum, padding tokens of the queries do not count
+    scores = scores.masked_fill((documents == 0).all(dim=-1)[None, :, None], -torch.inf)
+    scores = scores.max(dim=-1).values
+    return scores.masked_fill((queries == 0).all(dim=-1)[:, None], 0).sum(dim=-1)
+
+
+def random_token_embeddings(rng, n_texts, max_tokens, dim=8) -> TokenEmbeddings:
+    return TokenEmbeddings.from_sequences(
+        [
+            torch.from_numpy(rng.standard_normal((n_tokens, dim)).astype(np.float32))
+            for n_tokens in rng.integers(1, max_tokens, n_texts)
+        ]
+    )
+
+
+@pytest.mark.parametrize("max_block_size", [1, 50, 2**24])
+def test_max_sim_matches_padded(max_block_size):
+    rng = np.random.default_rng(0)
+    queries = random_token_embeddings(rng, 7, 6)
+    documents = random_token_embeddings(rng, 20, 30)
+
+    scores = max_sim(queries, documents, max_block_size=max_block_size)
+    expected = padded_max_sim(queries.to_padded(), documents.to_padded())
+    torch.testing.assert_close(scores, expected)
+
+    # padded arrays and single texts are accepted as well
+    torch.testing.assert_close(
+        max_sim(np.asarray(queries), np.asarray(documents)), expected
+    )
+    torch.testing.assert_close(max_sim(queries[2], documents)[0], expected[2])
+
+
+def test_token_embeddings_indexing():
+    rng = np.random.default_rng(0)
+    embeddings = random_token_embeddings(rng, 10, 5)
+    padded = embeddings.to_padded()
+
+    assert len(embeddings) == 10
+    torch.testing.assert_close(embeddings[3], padded[3, : embeddings.lengths[3]])
+    for idx in [slice(2, 7), slice(None, None, -2), [4, 1, 1, -1], np.arange(3)[::-1]]:
+        selected = embeddings[idx]
+        assert isinstance(selected, TokenEmbeddings)
+        expected = padded[np.arange(10)[idx].tolist()]
+        torch.testing.assert_close(
+            selected.to_padded(), expected[:, : selected.lengths.max()]
+        )
+
+    half = TokenEmbeddings.from_sequences(
+        [embeddings[i] for i in range(10)], dtype=torch.float16
+    )
+    assert half.embeddings.dtype == torch.float16
+    torch.testing.assert_close(
+        max_sim(half, embeddings), max_sim(embeddings, embeddings), atol=1e-2, rtol=1e-2
+    )
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from sentence_transformers import SentenceTransformer
+from sentence_transformers.models import StaticEmbedding
+from tokenizers import Tokenizer
+from tokenizers.models import WordLevel
+from tokenizers.pre_tokenizers import Whitespace
+
+from mteb import SentenceTransformerWrapper
+
+
+@pytest.fixture(scope="module")
+def static_model() -> SentenceTransformer:
+    vocab = {word: i for i, word in enumerate(["[UNK]", "a", "b", "c", "d", "e"])}
+    tokenizer = Tokenizer(WordLevel(vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = Whitespace()
+    weights = np.random.default_rng(42).normal(size=(len(vocab), 4)).astype(np.float32)
+    return SentenceTransformer(
+        modules=[StaticEmbedding(tokenizer, embedding_weights=weights)], device="cpu"
+    )
+
+
+def test_multi_process_encoding_matches_single_process(static_model):
+    sentences = [" ".join("abcde"[j % 5] for j in range(i % 7 + 1)) for i in range(103)]
+    expected = SentenceTransformerWrapper(static_model).encode(
+        sentences, task_name="STS12", batch_size=8
+    )
+
+    model = SentenceTransformerWrapper(static_model, num_processes=2)
+    try:
+        embeddings = model.encode(
+            sentences, task_name="STS12", batch_size=8, convert_to_tensor=True
+        )
+        pool = model._encode_pool
+        # the pool is kept alive and reused by later calls
+        model.encode(sentences[:10], task_name="STS12")
+        assert model._encode_pool is pool
+    finally:
+        model.close_encode_pool()
+
+    assert isinstance(embeddings, np.ndarray)
+    np.testing.assert_allclose(embeddings, expected, rtol=1e-5, atol=1e-6)
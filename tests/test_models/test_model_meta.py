@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 
 import mteb
 from mteb import ModelMeta
+from mteb.models.manifest import (
+    MODELS_MANIFEST_PATH,
+    create_model_manifest,
+    load_model_manifest,
+    write_model_manifest,
+)
 
 
 @pytest.mark.parametrize(
@@ -99,3 +107,16 @@ def test_model_training_dataset_adapted():
     # MIRACLRetrieval not in training_datasets of deepvk/USER-bge-m3, but in
     # training_datasets of BAAI/bge-m3
     assert "MIRACLRetrieval" in model_meta.get_training_datasets()
+
+
+def test_model_manifest_is_up_to_date():
+    """Test that the model manifest matches the models, otherwise it should be rebuilt using `make build-manifests`"""
+    assert load_model_manifest() == create_model_manifest()
+
+
+def test_model_manifest_written_like_pretty_format_json(tmp_path):
+    """Test that the manifest is written as the pretty-format-json pre-commit hook formats it, such that the hook does not rewrite it"""
+    write_model_manifest(tmp_path / "manifest.json")
+    text = (tmp_path / "manifest.json").read_text(encoding="utf-8")
+    assert text == json.dumps(json.loads(text), indent=4) + "\n"
+    assert MODELS_MANIFEST_PATH.read_text(encoding="utf-8") == text
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 
 import mteb
@@ -7,7 +9,16 @@ from mteb import get_task, get_tasks
 from mteb.abstasks.AbsTask import AbsTask
 from mteb.abstasks.TaskMetadata import TASK_DOMAIN, TASK_TYPE
 from mteb.custom_validators import MODALITIES
-from mteb.overview import MTEBTasks
+from mteb.encoder_interface import PromptType
+from mteb.models import wrapper
+from mteb.models.wrapper import Wrapper
+from mteb.overview import MTEBTasks, create_name_to_task_mapping
+from mteb.tasks.manifest import (
+    TASKS_MANIFEST_PATH,
+    create_task_manifest,
+    load_task_manifest,
+    write_task_manifest,
+)
 
 
 def test_get_tasks_size_differences():
@@ -169,3 +180,61 @@ def test_get_tasks_with_exclusive_modality_filter(modalities):
     )
     for task in text_tasks_exclusive:
         assert set(task.modalities) == set(modalities)
+
+
+def test_task_manifest_is_up_to_date():
+    """Test that the task manifest matches the tasks, otherwise it should be rebuilt using `make build-manifests`"""
+    assert load_task_manifest() == create_task_manifest()
+
+
+def test_task_manifest_written_like_pretty_format_json(tmp_path):
+    """Test that the manifest is written as the pretty-format-json pre-commit hook formats it, such that the hook does not rewrite it"""
+    write_task_manifest(tmp_path / "manifest.json")
+    text = (tmp_path / "manifest.json").read_text(encoding="utf-8")
+    assert text == json.dumps(json.loads(text), indent=4) + "\n"
+    assert TASKS_MANIFEST_PATH.read_text(encoding="utf-8") == text
+
+
+def test_tasks_registry_matches_all_tasks():
+    all_tasks = {
+        name: task
+        for name, task in create_name_to_task_mapping().items()
+        if task.__module__.startswith("mteb.tasks.")
+    }
+    assert dict(mteb.TASKS_REGISTRY) == all_tasks
+
+
+def test_get_task_class():
+    task_cls = mteb.overview.get_task_class("BornholmBitextMining")
+    assert task_cls is mteb.overview.get_task_class("BornholmBitextMining")
+    assert isinstance(get_task("BornholmBitextMining"), task_cls)
+    with pytest.raises(KeyError):
+        mteb.overview.get_task_class("BornholmBitextMinning")
+
+
+def test_prompt_name_resolved_once(monkeypatch):
+    get_task_class = mteb.overview.get_task_class
+    looked_up = []
+
+    def counting_get_task_class(task_name):
+        looked_up.append(task_name)
+        return get_task_class(task_name)
+
+    monkeypatch.setattr(mteb.overview, "get_task_class", counting_get_task_class)
+    wrapper._get_prompt_name.cache_clear()
+    prompts = {"BitextMining": "bitext", "query": "query", "STS12-query": "sts12"}
+    for _ in range(3):
+        assert (
+            Wrapper.get_prompt_name(prompts, "STS12", PromptType.query) == "STS12-query"
+        )
+        assert (
+            Wrapper.get_prompt_name(prompts, "BornholmBitextMining", PromptType.query)
+            == "BitextMining"
+        )
+        assert Wrapper.get_prompt_name(prompts, "STS13", PromptType.query) == "query"
+        assert Wrapper.get_prompt_name(prompts, "STS13", None) is None
+    assert sorted(looked_up) == ["BornholmBitextMining", "STS12", "STS13", "STS13"]
+
+    # a change to the prompts of the model is taken into account
+    prompts["STS13"] = "sts13"
+    assert Wrapper.get_prompt_name(prompts, "STS13", PromptType.query) == "STS13"
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from datasets import Dataset, DatasetDict
+from PIL import Image
+
+from mteb.evaluation.evaluators import (
+    kNNClassificationEvaluator,
+    logRegClassificationEvaluator,
+)
+from mteb.evaluation.evaluators.Image.ClassificationEvaluator import (
+    ImagekNNClassificationEvaluator,
+    ImagelogRegClassificationEvaluator,
+)
+from tests.test_benchmark.mock_models import MockHashEncoder
+from tests.test_benchmark.mock_tasks import (
+    MockClassificationTask,
+    MockImageClassificationTask,
+)
+
+
+def text_dataset() -> DatasetDict:
+    return DatasetDict(
+        {
+            "train": Dataset.from_dict(
+                {
+                    "text": [f"train sentence {i}" for i in range(60)],
+                    "label": [i % 3 for i in range(60)],
+                }
+            ),
+            "test": Dataset.from_dict(
+                {
+                    "text": [f"test sentence {i}" for i in range(12)],
+                    "label": [i % 3 for i in range(12)],
+                }
+            ),
+        }
+    )
+
+
+def image_dataset() -> DatasetDict:
+    rng = np.random.default_rng(0)
+
+    def split(n: int) -> Dataset:
+        return Dataset.from_dict(
+            {
+                "image": [
+                    Image.fromarray(
+                        rng.integers(0, 255, (16, 16, 3)).astype("uint8")
+                    ).convert("RGB")
+                    for _ in range(n)
+                ],
+                "label": [i % 2 for i in range(n)],
+            }
+        )
+
+    return DatasetDict({"train": split(30), "test": split(6)})
+
+
+@pytest.mark.parametrize(
+    "method, evaluator_class",
+    [("logReg", logRegClassificationEvaluator), ("kNN", kNNClassificationEvaluator)],
+)
+def test_train_sentences_encoded_once(method, evaluator_class):
+    dataset = text_dataset()
+    task = MockClassificationTask(n_experiments=5, samples_per_label=4, method=method)
+    model = MockHashEncoder()
+    np.random.seed(0)
+    scores = task._evaluate_subset(model, dataset)
+
+    # encoding each experiment on its own, as the evaluators would without the cache
+    np.random.seed(0)
+    idxs, test_cache = None, None
+    expected, sampled = [], set()
+    for _ in range(task.n_experiments):
+        X_sampled, y_sampled, idxs = task._undersample_data(
+            dataset["train"]["text"],
+            dataset["train"]["label"],
+            task.samples_per_label,
+            idxs,
+        )
+        sampled.update(X_sampled)
+        evaluator = evaluator_class(
+            X_sampled,
+            y_sampled,
+            dataset["test"]["text"],
+            dataset["test"]["label"],
+            task_name=task.metadata.name,
+            k=task.k,
+        )
+        scores_exp, test_cache = evaluator(MockHashEncoder(), test_cache=test_cache)
+        expected.append(scores_exp)
+
+    # a single call encoding the union of the training samples, and one for the test set
+    assert len(model.calls) == 2
+    assert sorted(model.calls[0]) == sorted(sampled)
+    assert model.calls[1] == dataset["test"]["text"]
+    assert scores["scores_per_experiment"] == expected
+
+
+@pytest.mark.parametrize(
+    "method, evaluator_class",
+    [
+        ("logReg", ImagelogRegClassificationEvaluator),
+        ("kNN", ImagekNNClassificationEvaluator),
+    ],
+)
+def test_train_images_encoded_once(method, evaluator_class):
+    dataset = image_dataset()
+    task = MockImageClassificationTask(method=method)
+    task.n_experiments, task.samples_per_label = 4, 5
+    model = MockHashEncoder()
+    np.random.seed(0)
+    scores = task._evaluate_subset(model, dataset)
+
+    np.random.seed(0)
+    idxs, test_cache = None, None
+    expected, sampled = [], set()
+    for _ in range(task.n_experiments):
+        sample_indices, idxs = task._undersample_data_indices(
+            dataset["train"], "label", task.samples_per_label, idxs=idxs
+        )
+        sampled.update(sample_indices)
+        evaluator = evaluator_class(
+            dataset["train"].select(sample_indices),
+            dataset["test"],
+            "image",
+            "label",
+            task_name=task.metadata.name,
+            k=task.k,
+        )
+        scores_exp, test_cache = evaluator(MockHashEncoder(), test_cache=test_cache)
+        expected.append(scores_exp)
+
+    assert model.image_calls == [len(sampled), len(dataset["test"])]
+    assert scores["scores_per_experiment"] == expected
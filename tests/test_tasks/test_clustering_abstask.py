@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import numpy as np
+from datasets import Dataset
+
+from mteb.abstasks.AbsTaskClusteringFast import evaluate_clustering_bootstrapped
+from mteb.evaluation.evaluators import ClusteringEvaluator
+from tests.test_benchmark.mock_models import MockHashEncoder
+from tests.test_benchmark.mock_tasks import MockClusteringTask
+
+
+def cluster_sets(n_sets: int = 4) -> Dataset:
+    rng = np.random.default_rng(0)
+    sentences, labels = [], []
+    for _ in range(n_sets):
+        idx = rng.choice(60, 30, replace=False)
+        sentences.append([f"sentence {i}" for i in idx])
+        labels.append((idx % 3).tolist())
+    return Dataset.from_dict({"sentences": sentences, "labels": labels})
+
+
+def test_cluster_sets_encoded_once():
+    dataset = cluster_sets()
+    model = MockHashEncoder()
+    scores = MockClusteringTask()._evaluate_subset(model, dataset)
+
+    assert model.n_calls == 1
+    assert model.n_encoded == len(
+        {s for sentences in dataset["sentences"] for s in sentences}
+    )
+
+    # the same scores as evaluating each set on its own
+    expected = [
+        ClusteringEvaluator(sentences, labels)(MockHashEncoder())["v_measure"]
+        for sentences, labels in zip(dataset["sentences"], dataset["labels"])
+    ]
+    assert scores["v_measures"] == expected
+
+
+def test_evaluator_kwargs_applied_to_cluster_sets():
+    dataset = cluster_sets()
+    kwargs = {"seed": 7, "limit": 20, "clustering_batch_size": 16}
+    scores = MockClusteringTask()._evaluate_subset(MockHashEncoder(), dataset, **kwargs)
+
+    expected = [
+        ClusteringEvaluator(sentences, labels, **kwargs)(MockHashEncoder())["v_measure"]
+        for sentences, labels in zip(dataset["sentences"], dataset["labels"])
+    ]
+    assert scores["v_measures"] == expected
+
+
+def test_cluster_sets_fitted_in_processes():
+    class ParallelClusteringTask(MockClusteringTask):
+        n_jobs = 2
+        min_sentences_per_process_pool = 0
+
+    dataset = cluster_sets(n_sets=2)
+    parallel_scores = ParallelClusteringTask()._evaluate_subset(
+        MockHashEncoder(), dataset
+    )
+    scores = MockClusteringTask()._evaluate_subset(MockHashEncoder(), dataset)
+    assert parallel_scores == scores
+
+
+def test_parallel_bootstrap_reproducible():
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((200, 8)).astype(np.float32)
+    labels = [[str(i % 4), str(i % 8)] if i % 5 else [str(i % 4)] for i in range(200)]
+
+    v_measures = [
+        evaluate_clustering_bootstrapped(
+            embeddings,
+            labels,
+            n_clusters=6,
+            cluster_size=50,
+            kmean_batch_size=32,
+            max_depth=None,
+            rng_state=np.random.default_rng(42),
+            n_jobs=n_jobs,
+        )
+        for n_jobs in [1, 3, 3]
+    ]
+    assert list(v_measures[0]) == ["Level 0", "Level 1"]
+    assert all(len(scores) == 6 for scores in v_measures[0].values())
+    assert v_measures[0] == v_measures[1] == v_measures[2]